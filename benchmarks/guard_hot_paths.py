@@ -0,0 +1,340 @@
+"""Times the guard's hot paths with the mock LLM outputs and test validators
+from the integration tests, so nothing calls a real LLM.
+
+Each benchmark is run in rounds long enough to time reliably, and the
+median time per call over --rounds rounds is reported.  Hub telemetry is
+switched off.  Results are saved to benchmarks/results/<commit>.json,
+with the Python version and machine they were run on.  Pass --compare
+with an earlier results file to see the change in each benchmark;
+anything more than --threshold slower counts as a regression and makes
+the script exit non-zero.
+
+Usage:
+    python benchmarks/guard_hot_paths.py [--filter parse] [--rounds 5]
+    python benchmarks/guard_hot_paths.py --compare benchmarks/results/<commit>.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from contextlib import ExitStack
+from typing import Callable, Dict, Iterator, List, Optional
+from unittest.mock import MagicMock, patch
+
+from pydantic import BaseModel, Field
+
+# The mock LLM outputs and validators live with the integration tests
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+# The OpenAI client needs a key to be created, even though it's never used,
+#   like in tests/conftest.py
+os.environ.setdefault("OPENAI_API_KEY", "mocked")
+
+from guardrails import AsyncGuard, Guard  # noqa: E402
+from guardrails.llm_providers import OpenAICallable  # noqa: E402
+from guardrails.utils.openai_utils import get_static_openai_create_func  # noqa: E402
+from import_time import measure, top_level_imports  # noqa: E402
+from tests.integration_tests.mock_llm_outputs import MockOpenAICallable  # noqa: E402
+from tests.integration_tests.test_assets import entity_extraction, string  # noqa: E402
+from tests.integration_tests.test_assets.validators import (  # noqa: E402
+    LowerCase,
+    OneLine,
+    RegexMatch,
+    TwoWords,
+    ValidChoices,
+    ValidLength,
+)
+
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+
+# Where hub telemetry is sent from, switched off so timings don't depend on
+#   the network, like in tests/conftest.py
+HUB_TELEMETRY_USERS = [
+    "guardrails.guard",
+    "guardrails.validator_base",
+    "guardrails.validator_service",
+    "guardrails.run.runner",
+]
+
+# How many fee objects the large JSON output has; the mock output has 9
+LARGE_JSON_FEES = 500
+ASYNC_CONCURRENCY = 50
+
+# name -> setup, which builds the guard and returns the call to time
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    def register(setup: Callable[[], Callable[[], object]]):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def make_validators(count: int) -> list:
+    """`count` of the test validators, all of which pass "hello world"."""
+    validators = [
+        lambda: LowerCase(on_fail="noop"),
+        lambda: OneLine(on_fail="noop"),
+        lambda: TwoWords(on_fail="noop"),
+        lambda: ValidLength(min=1, max=100, on_fail="noop"),
+        lambda: RegexMatch(regex="^[a-z ]+$", on_fail="noop"),
+        lambda: ValidChoices(choices=["hello world"], on_fail="noop"),
+    ]
+    return [validators[i % len(validators)]() for i in range(count)]
+
+
+def chunks(text: str, size: int = 8) -> List[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class Statement(BaseModel):
+    statement: str = Field(
+        json_schema_extra={"validators": [LowerCase(on_fail="noop")]}
+    )
+
+
+def timed(guard: Guard, call: Callable[[], object]) -> Callable[[], object]:
+    def run():
+        result = call()
+        # Otherwise history grows with every call
+        guard.history.clear()
+        return result
+
+    return run
+
+
+@benchmark("parse/string")
+def parse_string():
+    guard = Guard.from_rail_string(string.RAIL_SPEC_FOR_STRING)
+    return timed(guard, lambda: guard.parse(string.LLM_OUTPUT, num_reasks=0))
+
+
+@benchmark("parse/large_json")
+def parse_large_json():
+    output = json.loads(entity_extraction.LLM_OUTPUT)
+    fees = output["fees"]
+    output["fees"] = [fees[i % len(fees)] for i in range(LARGE_JSON_FEES)]
+    llm_output = json.dumps(output)
+    guard = Guard.from_rail_string(entity_extraction.RAIL_SPEC_WITH_NOOP)
+    return timed(guard, lambda: guard.parse(llm_output, num_reasks=0))
+
+
+def validate_with(count: int):
+    guard = Guard().use_many(*make_validators(count))
+    return timed(guard, lambda: guard.validate("hello world"))
+
+
+for _count in (1, 10, 50):
+    benchmark(f"validate/{_count}_validators")(
+        lambda count=_count: validate_with(count)
+    )
+
+
+@benchmark(f"async/parse_x{ASYNC_CONCURRENCY}")
+def async_parse():
+    guard = AsyncGuard().use_many(*make_validators(10))
+
+    async def parse_all():
+        return await asyncio.gather(
+            *(guard.parse("hello world") for _ in range(ASYNC_CONCURRENCY))
+        )
+
+    return timed(guard, lambda: asyncio.run(parse_all()))
+
+
+def stream_with(guard: Guard, text_chunks: List[str], **kwargs):
+    def llm_api(*args, **kwargs) -> Iterator[str]:
+        return iter(text_chunks)
+
+    def run():
+        return list(guard(llm_api, stream=True, **kwargs))
+
+    return timed(guard, run)
+
+
+@benchmark("stream/string")
+def stream_string():
+    guard = Guard().use(LowerCase(on_fail="noop"))
+    text = " ".join([string.LLM_OUTPUT.lower()] * 20)
+    return stream_with(guard, chunks(text), prompt="Name a pizza.")
+
+
+@benchmark("stream/json")
+def stream_json():
+    guard = Guard.from_pydantic(
+        output_class=Statement, prompt="Say something nice to me."
+    )
+    text = json.dumps({"statement": " ".join(["i am doing well."] * 20)})
+    return stream_with(guard, chunks(text))
+
+
+@benchmark("reask/string")
+def reask_string():
+    guard = Guard.from_rail_string(string.RAIL_SPEC_FOR_STRING_REASK)
+    llm_api = get_static_openai_create_func()
+
+    def run():
+        return guard(
+            llm_api=llm_api,
+            prompt_params={"ingredients": "tomato, cheese, sour cream"},
+            num_reasks=1,
+        )
+
+    return timed(guard, run)
+
+
+@benchmark("construct/from_rail")
+def construct_from_rail():
+    return lambda: Guard.from_rail_string(entity_extraction.RAIL_SPEC_WITH_NOOP)
+
+
+@benchmark("construct/from_pydantic")
+def construct_from_pydantic():
+    return lambda: Guard.from_pydantic(
+        output_class=entity_extraction.PYDANTIC_RAIL_WITH_NOOP,
+        prompt=entity_extraction.PYDANTIC_PROMPT,
+    )
+
+
+def time_call(call: Callable[[], object], rounds: int) -> List[float]:
+    """Seconds per call in each round."""
+    call()  # warm up
+    timer = timeit.Timer(call)
+    number, _ = timer.autorange()
+    return [total / number for total in timer.repeat(repeat=rounds, number=number)]
+
+
+IMPORT_STATEMENT = "from guardrails import Guard"
+
+
+def time_import(rounds: int) -> List[float]:
+    """Seconds importing the Guard takes in a fresh interpreter, each round.
+
+    `import guardrails` alone imports almost nothing until its attributes
+    are used, so it wouldn't catch a slower import.
+    """
+    startup = top_level_imports("pass")
+    return [measure(IMPORT_STATEMENT, startup)[0] / 1e6 for _ in range(rounds)]
+
+
+def summarize(times: List[float]) -> Dict[str, float]:
+    return {
+        "median": statistics.median(times),
+        "min": min(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+
+
+def get_commit() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[str]:
+    """Prints each benchmark's change from the baseline, and returns the
+    names of those that got more than `threshold` slower."""
+    regressions = []
+    for name, stats in results.items():
+        if name not in baseline:
+            continue
+        change = stats["median"] / baseline[name]["median"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<32} {format_time(baseline[name]['median']):>12}"
+            f" -> {format_time(stats['median']):>12} {change:>+8.1%}{flag}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filter", help="Only run benchmarks whose name has this.")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--output", help="Where to save the results.")
+    parser.add_argument("--compare", help="A results file to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if not args.filter or args.filter in name]
+    results: Dict[str, Dict[str, float]] = {}
+
+    with ExitStack() as patches:
+        for module in HUB_TELEMETRY_USERS:
+            patches.enter_context(
+                patch(f"{module}.HubTelemetry", return_value=MagicMock())
+            )
+        # The reask benchmark's LLM calls get the mock integration test outputs
+        patches.enter_context(
+            patch.object(OpenAICallable, "_invoke_llm", MockOpenAICallable._invoke_llm)
+        )
+        for name in names:
+            results[name] = summarize(time_call(BENCHMARKS[name](), args.rounds))
+            print(f"{name:<32} {format_time(results[name]['median']):>12}")
+    if not args.filter or args.filter in "import/guard":
+        results["import/guard"] = summarize(time_import(args.rounds))
+        median = results["import/guard"]["median"]
+        print(f"{'import/guard':<32} {format_time(median):>12}")
+
+    commit = get_commit()
+    output_path: Optional[str] = args.output
+    if output_path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output_path = os.path.join(RESULTS_DIR, f"{commit}.json")
+    with open(output_path, "w") as output_file:
+        json.dump(
+            {
+                "commit": commit,
+                "python": platform.python_version(),
+                "machine": platform.platform(),
+                "processor": platform.processor() or platform.machine(),
+                "cpu_count": os.cpu_count(),
+                "benchmarks": results,
+            },
+            output_file,
+            indent=2,
+            sort_keys=True,
+        )
+    print(f"Saved results to {output_path}")
+
+    if args.compare:
+        with open(args.compare, "r") as baseline_file:
+            baseline = json.load(baseline_file)
+        print(f"\nCompared to {baseline['commit']}:")
+        regressions = compare(results, baseline["benchmarks"], args.threshold)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
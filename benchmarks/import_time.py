@@ -0,0 +1,75 @@
+"""Measures how long importing guardrails takes, using `python -X importtime`.
+
+Each statement runs in a fresh interpreter, so nothing is already imported.
+Reports the median import time over several runs, and the slowest
+top-level imports of the last run, to show what a change pulled in.
+
+Usage:
+    python benchmarks/import_time.py [--repeat 5] [--top 10]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+STATEMENTS = [
+    "import guardrails",
+    "from guardrails import Guard",
+    "from guardrails import AsyncGuard",
+]
+
+# import time: self [us] | cumulative | imported package
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def top_level_imports(statement: str) -> Dict[str, int]:
+    """Returns the cumulative import time in microseconds of each module the
+    statement imported directly, i.e. not as a dependency of another."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match and len(match.group(3)) == 1:
+            imports[match.group(4)] = int(match.group(2))
+    return imports
+
+
+def measure(statement: str, startup: Dict[str, int]) -> Tuple[int, Dict[str, int]]:
+    imports = {
+        name: micros
+        for name, micros in top_level_imports(statement).items()
+        if name not in startup
+    }
+    return sum(imports.values()), imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    # Modules the interpreter imports on its own, e.g. site
+    startup = top_level_imports("pass")
+
+    for statement in STATEMENTS:
+        runs = [measure(statement, startup) for _ in range(args.repeat)]
+        median_ms = statistics.median(total for total, _ in runs) / 1000
+        print(f"{statement:<40} {median_ms:>8.1f} ms")
+
+        _, imports = runs[-1]
+        slowest = sorted(imports.items(), key=lambda item: item[1], reverse=True)
+        for name, micros in slowest[: args.top]:
+            print(f"    {name:<56} {micros / 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
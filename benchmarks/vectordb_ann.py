@@ -0,0 +1,84 @@
+"""Compares the approximate Faiss indexes against the exact flat index.
+
+Reports recall@k (the share of the true k nearest neighbours that were
+found) and queries per second on synthetic, clustered data.
+
+Usage:
+    python benchmarks/vectordb_ann.py [--num-vectors 100000] [--dim 128]
+"""
+
+import argparse
+import time
+from unittest.mock import Mock
+
+import numpy as np
+
+from guardrails.vectordb import Faiss
+
+
+def make_data(num_vectors: int, num_queries: int, dim: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(num_vectors // 1000, 1), dim))
+    assignments = rng.integers(0, len(centers), num_vectors + num_queries)
+    points = centers[assignments] + 0.3 * rng.standard_normal(
+        (num_vectors + num_queries, dim)
+    )
+    points = points.astype(np.float32)
+    return points[:num_vectors], points[num_vectors:]
+
+
+def search_all(store: Faiss, queries: np.ndarray, k: int):
+    start = time.perf_counter()
+    results = [store.similarity_search_vector(query, k) for query in queries]
+    elapsed = time.perf_counter() - start
+    return results, len(queries) / elapsed
+
+
+def recall_at_k(results, ground_truth) -> float:
+    found = sum(len(set(r) & set(t)) for r, t in zip(results, ground_truth))
+    return found / sum(len(t) for t in ground_truth)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-vectors", type=int, default=100_000)
+    parser.add_argument("--num-queries", type=int, default=1_000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    vectors, queries = make_data(args.num_vectors, args.num_queries, args.dim)
+    nlist = max(int(np.sqrt(args.num_vectors)), 1)
+    embedder = Mock()
+
+    flat = Faiss.new_flat_l2_index(args.dim, embedder)
+    flat.add_vectors(vectors)
+    ground_truth, flat_qps = search_all(flat, queries, args.k)
+
+    stores = {
+        "IVF-Flat": Faiss.new_ivf_flat_index(
+            args.dim, embedder, nlist=nlist, nprobe=16
+        ),
+        "IVF-PQ": Faiss.new_ivf_pq_index(
+            args.dim, embedder, nlist=nlist, m=args.dim // 4, nprobe=16
+        ),
+        "HNSW": Faiss.new_hnsw_index(args.dim, embedder, ef_search=64),
+    }
+
+    print(f"{'index':<10} {'recall@' + str(args.k):>10} {'QPS':>10} {'build s':>8}")
+    print(f"{'Flat':<10} {1.0:>10.3f} {flat_qps:>10.0f} {0:>8.1f}")
+    for name, store in stores.items():
+        start = time.perf_counter()
+        if not store.is_trained:
+            sample = vectors[np.random.default_rng(1).permutation(len(vectors))]
+            store.train(sample[: nlist * 40])
+        store.add_vectors(vectors)
+        build_time = time.perf_counter() - start
+
+        results, qps = search_all(store, queries, args.k)
+        recall = recall_at_k(results, ground_truth)
+        print(f"{name:<10} {recall:>10.3f} {qps:>10.0f} {build_time:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
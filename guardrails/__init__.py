@@ -1,15 +1,41 @@
 # Set up __init__.py so that users can do from guardrails import Response, Schema, etc.
 
-from guardrails.guard import Guard
-from guardrails.async_guard import AsyncGuard
-from guardrails.llm_providers import PromptCallableBase
-from guardrails.logging_utils import configure_logging
-from guardrails.prompt import Instructions, Prompt
-from guardrails.utils import constants, docs_utils
-from guardrails.types.on_fail import OnFailAction
-from guardrails.validator_base import Validator, register_validator
+# Most of these pull in large dependencies (openai, langchain, OpenTelemetry,
+#   the API client models, ...), so they're only imported when first used.
+#   See benchmarks/import_time.py.
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Imported up front, since it's cheap and importing the guardrails.settings
+#   module would otherwise shadow the instance with the module.
 from guardrails.settings import settings
-from guardrails.hub.install import install
+
+if TYPE_CHECKING:
+    from guardrails.guard import Guard
+    from guardrails.async_guard import AsyncGuard
+    from guardrails.llm_providers import PromptCallableBase
+    from guardrails.logging_utils import configure_logging
+    from guardrails.prompt import Instructions, Prompt
+    from guardrails.utils import constants, docs_utils
+    from guardrails.types.on_fail import OnFailAction
+    from guardrails.validator_base import Validator, register_validator
+    from guardrails.hub.install import install
+
+# name -> (module, attribute); an attribute of None means the module itself
+_LAZY_IMPORTS = {
+    "Guard": ("guardrails.guard", "Guard"),
+    "AsyncGuard": ("guardrails.async_guard", "AsyncGuard"),
+    "PromptCallableBase": ("guardrails.llm_providers", "PromptCallableBase"),
+    "Validator": ("guardrails.validator_base", "Validator"),
+    "OnFailAction": ("guardrails.types.on_fail", "OnFailAction"),
+    "register_validator": ("guardrails.validator_base", "register_validator"),
+    "constants": ("guardrails.utils.constants", None),
+    "docs_utils": ("guardrails.utils.docs_utils", None),
+    "configure_logging": ("guardrails.logging_utils", "configure_logging"),
+    "Prompt": ("guardrails.prompt", "Prompt"),
+    "Instructions": ("guardrails.prompt", "Instructions"),
+    "install": ("guardrails.hub.install", "install"),
+}
 
 __all__ = [
     "Guard",
@@ -26,3 +52,18 @@ __all__ = [
     "settings",
     "install",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_IMPORTS[name]
+    module = importlib.import_module(module_name)
+    value = module if attribute is None else getattr(module, attribute)
+    # Cache it, so later lookups don't come through here
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -10,7 +10,6 @@ from guardrails.prompt.instructions import Instructions
 from guardrails.prompt.prompt import Prompt
 from guardrails.prompt.messages import Messages
 from guardrails.schema.generator import generate_example
-from guardrails.schema.rail_schema import json_schema_to_rail_output
 from guardrails.types.validator import ValidatorMap
 from guardrails.utils.constants import constants
 from guardrails.utils.prompt_utils import prompt_content_for_schema, prompt_uses_xml
@@ -254,6 +253,8 @@ def get_reask_setup_for_string(
     schema_prompt_content = prompt_content_for_schema(
         output_type, output_schema, validation_map
     )
+    from guardrails.schema.rail_schema import json_schema_to_rail_output
+
     xml_output_schema = json_schema_to_rail_output(
         json_schema=output_schema, validator_map=validation_map
     )
@@ -430,6 +431,8 @@ def get_reask_setup_for_json(
     stringified_schema = prompt_content_for_schema(
         output_type, reask_schema, validation_map
     )
+    from guardrails.schema.rail_schema import json_schema_to_rail_output
+
     xml_output_schema = json_schema_to_rail_output(
         json_schema=output_schema, validator_map=validation_map
     )
@@ -1,33 +1,124 @@
+import asyncio
 import json
 import os
-from typing import Any, Iterable, Optional
+import threading
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
 
-import requests
-from guardrails_api_client.configuration import Configuration
-from guardrails_api_client.api_client import ApiClient
-from guardrails_api_client.api.guard_api import GuardApi
-from guardrails_api_client.api.validate_api import ValidateApi
 from guardrails_api_client.models import (
+    Call as ICall,
     Guard,
+    Reask,
     ValidatePayload,
     ValidationOutcome as IValidationOutcome,
+    ValidationOutcomeValidatedOutput,
+    ValidationSummary,
 )
 
-from guardrails_api_client.exceptions import BadRequestException
 from guardrails.errors import ValidationError
 
 from guardrails.logger import logger
 
+if TYPE_CHECKING:
+    import httpx
+    import requests
+    from guardrails_api_client.api_client import ApiClient
+    from guardrails_api_client.api.guard_api import GuardApi
+    from guardrails_api_client.api.validate_api import ValidateApi
+
+POOL_SIZE_ENV_VAR = "GUARDRAILS_API_POOL_SIZE"
+# Connections kept open to the server, per client
+DEFAULT_POOL_SIZE = 10
+
+# Sessions shared by every client in the process, by pool size, so guards
+#   talking to the same server reuse each other's connections.
+_sessions: Dict[int, "requests.Session"] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(pool_size: int = DEFAULT_POOL_SIZE) -> "requests.Session":
+    """Returns the process-wide HTTP session with a connection pool of
+    pool_size."""
+    session = _sessions.get(pool_size)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(pool_size)
+            if session is None:
+                # Imported here, like the API's clients, since guards that
+                #   don't talk to a server never need them
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=pool_size, pool_maxsize=pool_size
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _sessions[pool_size] = session
+    return session
+
+
+def parse_validation_outcome(data: Dict[str, Any]) -> IValidationOutcome:
+    """Like IValidationOutcome.from_dict, but takes the validated output as
+    is, rather than serializing it back to JSON and trying each of the types
+    it could be in turn."""
+    validated_output = data.get("validatedOutput")
+    validation_summaries = data.get("validationSummaries")
+    reask = data.get("reask")
+    return IValidationOutcome.model_validate(
+        {
+            "callId": data.get("callId"),
+            "rawLlmOutput": data.get("rawLlmOutput"),
+            "validationSummaries": (
+                [ValidationSummary.from_dict(item) for item in validation_summaries]
+                if validation_summaries is not None
+                else None
+            ),
+            "validatedOutput": (
+                ValidationOutcomeValidatedOutput.model_construct(
+                    actual_instance=validated_output
+                )
+                if validated_output is not None
+                else None
+            ),
+            "reask": Reask.from_dict(reask) if reask is not None else None,
+            "validationPassed": data.get("validationPassed"),
+            "error": data.get("error"),
+        }
+    )
+
 
 class GuardrailsApiClient:
-    _api_client: ApiClient
-    _guard_api: GuardApi
-    _validate_api: ValidateApi
+    _api_client: "ApiClient"
+    _guard_api: "GuardApi"
+    _validate_api: "ValidateApi"
+    # One async client per event loop, since connections belong to the loop
+    #   they were opened on
+    _async_clients: (
+        "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"  # noqa: E501
+    )
+    _async_client_closers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGenerator[None, None]]"  # noqa: E501
     timeout: float
     base_url: str
     api_key: str
+    pool_size: int
 
-    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        pool_size: Optional[int] = None,
+    ):
         self.base_url = (
             base_url
             if base_url is not None
@@ -36,12 +127,25 @@ class GuardrailsApiClient:
         self.api_key = (
             api_key if api_key is not None else os.environ.get("GUARDRAILS_API_KEY", "")
         )
-        self.timeout = 300
-        self._api_client = ApiClient(
-            configuration=Configuration(api_key=self.api_key, host=self.base_url)
+        self.pool_size = (
+            pool_size
+            if pool_size is not None
+            else int(os.environ.get(POOL_SIZE_ENV_VAR, DEFAULT_POOL_SIZE))
         )
+        self.timeout = 300
+
+        from guardrails_api_client.api_client import ApiClient
+        from guardrails_api_client.api.guard_api import GuardApi
+        from guardrails_api_client.api.validate_api import ValidateApi
+        from guardrails_api_client.configuration import Configuration
+
+        configuration = Configuration(api_key=self.api_key, host=self.base_url)
+        configuration.connection_pool_maxsize = self.pool_size
+        self._api_client = ApiClient(configuration=configuration)
         self._guard_api = GuardApi(self._api_client)
         self._validate_api = ValidateApi(self._api_client)
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._async_client_closers = weakref.WeakKeyDictionary()
 
     def upsert_guard(self, guard: Guard):
         self._guard_api.update_guard(
@@ -55,25 +159,47 @@ class GuardrailsApiClient:
             logger.error(f"Error fetching guard {guard_name}: {e}")
             return None
 
+    def _validate_url(self, guard: Guard) -> str:
+        return f"{self.base_url}/guards/{guard.name}/validate"
+
+    def _history_url(self, guard_name: str, call_id: str) -> str:
+        return f"{self.base_url}/guards/{guard_name}/history/{call_id}"
+
+    def _headers(self, openai_api_key: Optional[str] = None) -> Dict[str, str]:
+        _openai_api_key = (
+            openai_api_key
+            if openai_api_key is not None
+            else os.environ.get("OPENAI_API_KEY")
+        )
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        if _openai_api_key is not None:
+            headers["x-openai-api-key"] = _openai_api_key
+        return headers
+
+    @staticmethod
+    def _raise_for_status(status_code: int, reason: str, text: str):
+        if status_code == 400:
+            raise ValidationError(text)
+        if status_code >= 400:
+            raise ValueError(
+                f"status_code: {status_code} reason: {reason} text: {text}"
+            )
+
     def validate(
         self,
         guard: Guard,
         payload: ValidatePayload,
         openai_api_key: Optional[str] = None,
-    ):
-        try:
-            _openai_api_key = (
-                openai_api_key
-                if openai_api_key is not None
-                else os.environ.get("OPENAI_API_KEY")
-            )
-            return self._validate_api.validate(
-                guard_name=guard.name,
-                validate_payload=payload,
-                x_openai_api_key=_openai_api_key,
-            )
-        except BadRequestException as e:
-            raise ValidationError(f"{e.body}")
+    ) -> Optional[IValidationOutcome]:
+        resp = get_session(self.pool_size).post(
+            self._validate_url(guard),
+            json=payload.to_dict(),
+            headers=self._headers(openai_api_key),
+            timeout=self.timeout,
+        )
+        self._raise_for_status(resp.status_code, resp.reason, resp.text)
+        body = resp.json()
+        return parse_validation_outcome(body) if body else None
 
     def stream_validate(
         self,
@@ -81,30 +207,106 @@ class GuardrailsApiClient:
         payload: ValidatePayload,
         openai_api_key: Optional[str] = None,
     ) -> Iterable[Any]:
-        _openai_api_key = (
-            openai_api_key
-            if openai_api_key is not None
-            else os.environ.get("OPENAI_API_KEY")
+        with get_session(self.pool_size).post(
+            self._validate_url(guard),
+            json=payload.to_dict(),
+            headers=self._headers(openai_api_key),
+            stream=True,
+            timeout=self.timeout,
+        ) as resp:
+            if not resp.ok:
+                self._raise_for_status(resp.status_code, resp.reason, resp.text)
+            for line in resp.iter_lines():
+                if line:
+                    yield parse_validation_outcome(json.loads(line))
+
+    def get_history(self, guard_name: str, call_id: str) -> List[ICall]:
+        resp = get_session(self.pool_size).get(
+            self._history_url(guard_name, call_id),
+            headers=self._headers(),
+            timeout=self.timeout,
         )
+        self._raise_for_status(resp.status_code, resp.reason, resp.text)
+        return [ICall.from_dict(call) for call in resp.json() or []]
 
-        url = f"{self.base_url}/guards/{guard.name}/validate"
-        headers = {
-            "Content-Type": "application/json",
-            "x-openai-api-key": _openai_api_key,
-        }
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """The async client for the running event loop.
 
-        s = requests.Session()
+        Its pooled connections belong to the loop they were opened on, so
+        each loop gets its own client, e.g. each call to asyncio.run.  The
+        client is closed when its loop shuts down.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            # Imported here since only async guards talking to a server need it
+            import httpx
 
-        with s.post(url, json=payload.to_dict(), headers=headers, stream=True) as resp:
-            for line in resp.iter_lines():
-                if not resp.ok:
-                    raise ValueError(
-                        f"status_code: {resp.status_code}"
-                        " reason: {resp.reason} text: {resp.text}"
-                    )
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                ),
+            )
+            self._async_clients[loop] = client
+            # Once started, the loop keeps track of it and closes it on shutdown
+            closer = self._close_on_loop_shutdown(loop, client)
+            self._async_client_closers[loop] = closer
+            asyncio.ensure_future(closer.asend(None))
+        return client
+
+    async def _close_on_loop_shutdown(
+        self, loop: asyncio.AbstractEventLoop, client: "httpx.AsyncClient"
+    ) -> AsyncGenerator[None, None]:
+        """Closes the client when its loop shuts down its async generators,
+        e.g. at the end of asyncio.run, while the loop can still close its
+        connections."""
+        try:
+            yield
+        finally:
+            await client.aclose()
+            if self._async_clients.get(loop) is client:
+                del self._async_clients[loop]
+            self._async_client_closers.pop(loop, None)
+
+    async def async_validate(
+        self,
+        guard: Guard,
+        payload: ValidatePayload,
+        openai_api_key: Optional[str] = None,
+    ) -> Optional[IValidationOutcome]:
+        resp = await self._get_async_client().post(
+            self._validate_url(guard),
+            json=payload.to_dict(),
+            headers=self._headers(openai_api_key),
+        )
+        self._raise_for_status(resp.status_code, resp.reason_phrase, resp.text)
+        body = resp.json()
+        return parse_validation_outcome(body) if body else None
+
+    async def async_stream_validate(
+        self,
+        guard: Guard,
+        payload: ValidatePayload,
+        openai_api_key: Optional[str] = None,
+    ) -> AsyncIterable[IValidationOutcome]:
+        async with self._get_async_client().stream(
+            "POST",
+            self._validate_url(guard),
+            json=payload.to_dict(),
+            headers=self._headers(openai_api_key),
+        ) as resp:
+            if resp.status_code >= 400:
+                await resp.aread()
+                self._raise_for_status(resp.status_code, resp.reason_phrase, resp.text)
+            async for line in resp.aiter_lines():
                 if line:
-                    json_output = json.loads(line)
-                    yield IValidationOutcome.from_dict(json_output)
+                    yield parse_validation_outcome(json.loads(line))
 
-    def get_history(self, guard_name: str, call_id: str):
-        return self._guard_api.get_guard_history(guard_name, call_id)
+    async def aclose(self):
+        """Closes the running event loop's async client and its
+        connections."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
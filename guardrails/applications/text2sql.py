@@ -1,15 +1,16 @@
 import asyncio
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from string import Template
-from typing import Callable, Dict, Optional, Type, cast
+from typing import Callable, Dict, List, Optional, Type, Union, cast, overload
 
 from guardrails.classes import ValidationOutcome
 from guardrails.document_store import DocumentStoreBase, EphemeralDocumentStore
 from guardrails.embedding import EmbeddingBase, OpenAIEmbedding
 from guardrails.guard import Guard
 from guardrails.utils.openai_utils import get_static_openai_create_func
-from guardrails.utils.sql_utils import create_sql_driver
+from guardrails.utils.sql_utils import DEFAULT_SCHEMA_TTL, create_sql_driver
 from guardrails.vectordb import Faiss, VectorDBBase
 
 REASK_PROMPT = """
@@ -74,6 +75,9 @@ class Text2Sql:
         llm_api: Optional[Callable] = None,
         llm_api_kwargs: Optional[Dict] = None,
         num_relevant_examples: int = 2,
+        schema_ttl: Optional[float] = DEFAULT_SCHEMA_TTL,
+        validation_mode: str = "execute",
+        max_concurrency: int = 4,
     ):
         """Initialize the text2sql application.
 
@@ -87,6 +91,13 @@ class Text2Sql:
             rail_spec: Path to the rail specification. Defaults to "text2sql.rail".
             example_formatter: Fn to format examples. Defaults to example_formatter.
             reask_prompt: Prompt to use for reasking. Defaults to REASK_PROMPT.
+            schema_ttl: Seconds to reuse the database schema for before
+                inspecting it again. None reuses it for the app's lifetime.
+            validation_mode: How the SQL driver validates queries, "execute"
+                to run them or "explain" to only plan them. Defaults to
+                "execute".
+            max_concurrency: How many questions of a batch are sent to the
+                LLM at once. Defaults to 4.
         """
         if llm_api is None:
             llm_api = get_static_openai_create_func()
@@ -94,10 +105,18 @@ class Text2Sql:
         self.example_formatter = example_formatter
         self.llm_api = llm_api
         self.llm_api_kwargs = llm_api_kwargs or {"max_tokens": 512}
+        self.max_concurrency = max_concurrency
 
         # Initialize the SQL driver.
-        self.sql_driver = create_sql_driver(conn=conn_str, schema_file=schema_file)
-        self.sql_schema = self.sql_driver.get_schema()
+        self.sql_driver = create_sql_driver(
+            conn=conn_str,
+            schema_file=schema_file,
+            schema_ttl=schema_ttl,
+            validation_mode=validation_mode,
+        )
+        self._sql_schema: Optional[str] = None
+        # Inspect the schema up front, so the first question isn't slower
+        self.sql_driver.get_schema()
 
         # Number of relevant examples to use for the LLM.
         self.num_relevant_examples = num_relevant_examples
@@ -170,40 +189,93 @@ class Text2Sql:
     def output_schema_formatter(output) -> str:
         return json.dumps({"generated_sql": output}, indent=4)
 
-    def __call__(self, text: str) -> Optional[str]:
-        """Run text2sql on a text query and return the SQL query."""
+    @property
+    def sql_schema(self) -> str:
+        """The database schema, re-inspected once the snapshot expires.
 
-        if self.store is not None:
-            similar_examples = self.store.search(text, self.num_relevant_examples)
-            similar_examples_prompt = "\n".join(
+        Setting it pins the schema given to the LLM to that value.
+        """
+        if self._sql_schema is not None:
+            return self._sql_schema
+        return self.sql_driver.get_schema()
+
+    @sql_schema.setter
+    def sql_schema(self, sql_schema: str):
+        self._sql_schema = sql_schema
+
+    def _examples_prompts(self, texts: List[str]) -> List[str]:
+        """Finds the examples most similar to each text, with one search for
+        all of them."""
+        if self.store is None:
+            return ["" for _ in texts]
+        similar_examples_per_text = self.store.search_batch(
+            texts, self.num_relevant_examples
+        )
+        return [
+            "\n".join(
                 self.example_formatter(example.text, example.metadata["ctx"])
                 for example in similar_examples
             )
-        else:
-            similar_examples_prompt = ""
+            for similar_examples in similar_examples_per_text
+        ]
+
+    def _generate_sql(self, text: str, examples: str, db_info: str) -> Optional[str]:
+        try:
+            response = self.guard(
+                self.llm_api,
+                prompt_params={
+                    "nl_instruction": text,
+                    "examples": examples,
+                    "db_info": db_info,
+                },
+                **self.llm_api_kwargs,
+            )
+            response = cast(ValidationOutcome, response)
+            validated_output: Dict = cast(Dict, response.validated_output)
+            return validated_output["generated_sql"]
+        except TypeError:
+            return None
 
+    @overload
+    def __call__(self, text: str) -> Optional[str]: ...
+
+    @overload
+    def __call__(self, text: List[str]) -> List[Optional[str]]: ...
+
+    def __call__(
+        self, text: Union[str, List[str]]
+    ) -> Union[Optional[str], List[Optional[str]]]:
+        """Run text2sql on a text query and return the SQL query.
+
+        Given a list of text queries, returns a list of SQL queries. The
+        queries share one example search and one schema lookup, and up to
+        `max_concurrency` of them are sent to the LLM at once.
+        """
         if asyncio.iscoroutinefunction(self.llm_api):
             raise ValueError(
                 "Async API is not supported in Text2SQL application. "
                 "Please use a synchronous API."
             )
+
+        texts = [text] if isinstance(text, str) else text
+        if self.llm_api is None:
+            outputs: List[Optional[str]] = [None for _ in texts]
         else:
-            if self.llm_api is None:
-                return None
-            try:
-                response = self.guard(
-                    self.llm_api,
-                    prompt_params={
-                        "nl_instruction": text,
-                        "examples": similar_examples_prompt,
-                        "db_info": str(self.sql_schema),
-                    },
-                    **self.llm_api_kwargs,
-                )
-                response = cast(ValidationOutcome, response)
-                validated_output: Dict = cast(Dict, response.validated_output)
-                output = validated_output["generated_sql"]
-            except TypeError:
-                output = None
-
-            return output
+            db_info = str(self.sql_schema)
+            examples_prompts = self._examples_prompts(texts)
+            if self.max_concurrency > 1 and len(texts) > 1:
+                with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                    outputs = list(
+                        executor.map(
+                            self._generate_sql,
+                            texts,
+                            examples_prompts,
+                            [db_info] * len(texts),
+                        )
+                    )
+            else:
+                outputs = [
+                    self._generate_sql(t, examples, db_info)
+                    for t, examples in zip(texts, examples_prompts)
+                ]
+        return outputs[0] if isinstance(text, str) else outputs
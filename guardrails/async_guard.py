@@ -390,10 +390,11 @@ class AsyncGuard(Guard, Generic[OT]):
             The raw text output from the LLM and the validated output.
         """
         api = get_async_llm_ask(llm_api, *args, **kwargs)  # type: ignore
+        execution_plan = self._get_execution_plan()
         if kwargs.get("stream", False):
             runner = AsyncStreamRunner(
                 output_type=self._output_type,
-                output_schema=self.output_schema.to_dict(),
+                output_schema=execution_plan.output_schema,
                 num_reasks=num_reasks,
                 validation_map=self._validator_map,
                 prompt=prompt,
@@ -406,6 +407,8 @@ class AsyncGuard(Guard, Generic[OT]):
                 full_schema_reask=full_schema_reask,
                 disable_tracer=(not self._allow_metrics_collection),
                 exec_options=self._exec_opts,
+                short_circuit_validation=self._short_circuit_validation,
+                execution_plan=execution_plan,
             )
             # Here we have an async generator
             async_generator = runner.async_run(
@@ -415,7 +418,7 @@ class AsyncGuard(Guard, Generic[OT]):
         else:
             runner = AsyncRunner(
                 output_type=self._output_type,
-                output_schema=self.output_schema.to_dict(),
+                output_schema=execution_plan.output_schema,
                 num_reasks=num_reasks,
                 validation_map=self._validator_map,
                 prompt=prompt,
@@ -428,6 +431,8 @@ class AsyncGuard(Guard, Generic[OT]):
                 full_schema_reask=full_schema_reask,
                 disable_tracer=(not self._allow_metrics_collection),
                 exec_options=self._exec_opts,
+                short_circuit_validation=self._short_circuit_validation,
+                execution_plan=execution_plan,
             )
             # Why are we using a different method here instead of just overriding?
             call = await runner.async_run(
@@ -565,19 +570,53 @@ class AsyncGuard(Guard, Generic[OT]):
             **kwargs,
         )
 
+    async def _single_server_call(
+        self, *, payload: Dict[str, Any]
+    ) -> ValidationOutcome[OT]:
+        if self._api_client:
+            validation_output: Optional[
+                IValidationOutcome
+            ] = await self._api_client.async_validate(
+                guard=self,  # type: ignore
+                payload=ValidatePayload.from_dict(payload),  # type: ignore
+                openai_api_key=get_call_kwarg("api_key"),
+            )
+            if not validation_output:
+                return ValidationOutcome[OT](
+                    call_id="0",  # type: ignore
+                    raw_llm_output=None,
+                    validated_output=None,
+                    validation_passed=False,
+                    error="The response from the server was empty!",
+                )
+
+            self._defer_server_history(validation_output.call_id)
+
+            validated_output = (
+                cast(OT, validation_output.validated_output.actual_instance)
+                if validation_output.validated_output
+                else None
+            )
+            return ValidationOutcome[OT](
+                call_id=validation_output.call_id,  # type: ignore
+                raw_llm_output=validation_output.raw_llm_output,
+                validated_output=validated_output,
+                validation_passed=(validation_output.validation_passed is True),
+            )
+        else:
+            raise ValueError("AsyncGuard does not have an api client!")
+
     async def _stream_server_call(
         self, *, payload: Dict[str, Any]
     ) -> AsyncIterable[ValidationOutcome[OT]]:
-        # TODO: Once server side supports async streaming, this function will need to
-        # yield async generators, not generators
         if self._api_client:
             validation_output: Optional[IValidationOutcome] = None
-            response = self._api_client.stream_validate(
+            response = self._api_client.async_stream_validate(
                 guard=self,  # type: ignore
                 payload=ValidatePayload.from_dict(payload),  # type: ignore
                 openai_api_key=get_call_kwarg("api_key"),
             )
-            for fragment in response:
+            async for fragment in response:
                 validation_output = fragment
                 if validation_output is None:
                     yield ValidationOutcome[OT](
@@ -600,12 +639,7 @@ class AsyncGuard(Guard, Generic[OT]):
                         validation_passed=(validation_output.validation_passed is True),
                     )
             if validation_output:
-                guard_history = self._api_client.get_history(
-                    self.name, validation_output.call_id
-                )
-                self.history.extend(
-                    [Call.from_interface(call) for call in guard_history]
-                )
+                self._defer_server_history(validation_output.call_id)
         else:
             raise ValueError("AsyncGuard does not have an api client!")
 
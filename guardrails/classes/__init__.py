@@ -1,3 +1,6 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from guardrails.classes.credentials import Credentials
 from guardrails.classes.input_type import InputType
 from guardrails.classes.output_type import OT
@@ -7,7 +10,16 @@ from guardrails.classes.validation.validation_result import (
     FailResult,
     ErrorSpan,
 )
-from guardrails.classes.validation_outcome import ValidationOutcome
+
+if TYPE_CHECKING:
+    from guardrails.classes.validation_outcome import ValidationOutcome
+
+# ValidationOutcome depends on guardrails.actions and guardrails.prompt, which
+#   themselves import submodules of this package, so it's only imported when
+#   first used.
+_LAZY_IMPORTS = {
+    "ValidationOutcome": ("guardrails.classes.validation_outcome", "ValidationOutcome"),
+}
 
 __all__ = [
     "Credentials",
@@ -19,3 +31,12 @@ __all__ = [
     "FailResult",
     "ValidationOutcome",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_IMPORTS[name]
+    value = getattr(importlib.import_module(module_name), attribute)
+    globals()[name] = value
+    return value
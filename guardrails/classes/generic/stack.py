@@ -1,4 +1,5 @@
-from typing import List, Optional, TypeVar
+from functools import wraps
+from typing import Callable, Iterable, List, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -102,3 +103,69 @@ class Stack(List[T]):
     def length(self) -> int:
         """Returns the number of items in the Stack."""
         return len(self)
+
+
+class LazyStack(Stack[T]):
+    """A Stack whose items can be supplied by loaders that only run the first
+    time the stack is read or changed, e.g. to avoid fetching items nobody
+    looks at.
+
+    Loaded items come before any added after the loader was deferred.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._loaders: List[Callable[[], Iterable[T]]] = []
+
+    def defer(self, loader: Callable[[], Iterable[T]]) -> None:
+        """Adds the items the loader returns once the stack is next used."""
+        self._loaders.append(loader)
+
+    def load(self) -> None:
+        """Runs any deferred loaders now."""
+        while self._loaders:
+            loader = self._loaders.pop(0)
+            list.extend(self, loader())
+
+    def clear(self) -> None:
+        """Removes all items, including any not loaded yet."""
+        self._loaders.clear()
+        super().clear()
+
+
+def _loads_first(method: Callable) -> Callable:
+    @wraps(method)
+    def wrapper(self: LazyStack, *args, **kwargs):
+        if self._loaders:
+            self.load()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+# Everything that reads or changes the items, so deferred items are in place
+for _name in [
+    "__add__",
+    "__contains__",
+    "__delitem__",
+    "__eq__",
+    "__getitem__",
+    "__iadd__",
+    "__iter__",
+    "__len__",
+    "__ne__",
+    "__repr__",
+    "__reversed__",
+    "__setitem__",
+    "append",
+    "copy",
+    "count",
+    "extend",
+    "index",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+]:
+    setattr(LazyStack, _name, _loads_first(getattr(Stack, _name)))
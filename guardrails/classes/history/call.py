@@ -217,6 +217,15 @@ class Call(ICall, ArbitraryModel):
             return sum(iteration_tokens)
         return None
 
+    @property
+    def timings(self) -> Dict[str, int]:
+        """The nanoseconds spent in each stage, across all iterations."""
+        totals: Dict[str, int] = {}
+        for iteration in self.iterations:
+            for stage, duration in iteration.timings.items():
+                totals[stage] = totals.get(stage, 0) + duration
+        return totals
+
     @property
     def raw_outputs(self) -> Stack[str]:
         """The exact outputs from all LLM calls."""
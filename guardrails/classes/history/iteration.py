@@ -1,3 +1,4 @@
+from time import perf_counter_ns
 from typing import Any, Dict, List, Optional, Sequence, Union
 from builtins import id as object_id
 from pydantic import Field
@@ -10,6 +11,7 @@ from guardrails_api_client import Iteration as IIteration
 from guardrails.classes.generic.stack import Stack
 from guardrails.classes.history.inputs import Inputs
 from guardrails.classes.history.outputs import Outputs
+from guardrails.classes.history.timings import Stage
 from guardrails.classes.generic.arbitrary_model import ArbitraryModel
 from guardrails.logger import get_scope_handler
 from guardrails.prompt.prompt import Prompt
@@ -29,6 +31,8 @@ class Iteration(IIteration, ArbitraryModel):
         index (int): The index of this iteration within the Call.
         inputs (Inputs): The inputs for the validation loop.
         outputs (Outputs): The outputs from the validation loop.
+        timings (Dict[str, int]): The nanoseconds spent in each Stage
+            of the iteration, by stage name.
     """
 
     # I think these should be containered since their names slightly overlap with
@@ -40,6 +44,10 @@ class Iteration(IIteration, ArbitraryModel):
     outputs: Outputs = Field(
         description="The outputs from the iteration/step.", default_factory=Outputs
     )
+    timings: Dict[str, int] = Field(
+        description="The nanoseconds spent in each stage of the iteration/step.",
+        default_factory=dict,
+    )
 
     def __init__(
         self,
@@ -61,6 +69,18 @@ class Iteration(IIteration, ArbitraryModel):
         self.inputs = inputs
         self.outputs = outputs
 
+    def add_timing(self, stage: Stage, start: int) -> int:
+        """Adds the time since start, from `time.perf_counter_ns`, to the
+        stage's total.
+
+        Returns the current `perf_counter_ns`, to start timing the next
+        stage from.
+        """
+        now = perf_counter_ns()
+        timings = self.timings
+        timings[stage.value] = timings.get(stage.value, 0) + now - start
+        return now
+
     @property
     def logs(self) -> Stack[str]:
         """Returns the logs from this iteration as a stack."""
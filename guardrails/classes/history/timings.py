@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class Stage(str, Enum):
+    """The stages of a guard run that are timed on each Iteration."""
+
+    PREPARE = "prepare"
+    LLM_CALL = "llm_call"
+    PARSE = "parse"
+    SCHEMA_VALIDATION = "schema_validation"
+    VALIDATION = "validation"
+    INTROSPECT = "introspect"
+    REASK_SETUP = "reask_setup"
@@ -1,5 +1,6 @@
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
-from langchain_core.messages import BaseMessage
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
 
-InputType = TypeVar("InputType", str, BaseMessage)
+InputType = TypeVar("InputType", str, "BaseMessage")
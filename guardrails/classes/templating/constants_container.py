@@ -1,13 +1,22 @@
 import os
-from lxml import etree as ET
+from typing import Dict, Optional
 
 
 class ConstantsContainer:
     def __init__(self):
-        self._constants = {}
-        self.fill_constants()
+        # Read from constants.xml on first use, rather than on import
+        self._loaded_constants: Optional[Dict[str, Optional[str]]] = None
+
+    @property
+    def _constants(self) -> Dict[str, Optional[str]]:
+        if self._loaded_constants is None:
+            self._loaded_constants = {}
+            self.fill_constants()
+        return self._loaded_constants
 
     def fill_constants(self) -> None:
+        from lxml import etree as ET
+
         self_file_path = os.path.dirname(__file__)
         self_dirname = os.path.dirname(self_file_path)
         constants_file = os.path.abspath(
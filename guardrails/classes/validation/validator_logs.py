@@ -7,6 +7,7 @@ from guardrails_api_client import (
     ValidatorLogValidationResult,
 )
 from guardrails.classes.generic.arbitrary_model import ArbitraryModel
+from guardrails.constants import not_run_status
 from guardrails.classes.validation.validation_result import ValidationResult
 from guardrails.utils.casting_utils import to_int
 
@@ -37,6 +38,19 @@ class ValidatorLogs(IValidatorLog, ArbitraryModel):
     instance_id: Optional[int] = None
     property_path: str
 
+    @property
+    def status(self) -> str:
+        """The outcome of this validator execution.
+
+        OneOf: pass, fail, not run
+
+        A validator is "not run" when it was skipped or cancelled
+        because another validator triggered a terminal on fail action.
+        """
+        if self.validation_result is None:
+            return not_run_status
+        return self.validation_result.outcome
+
     def to_interface(self) -> IValidatorLog:
         start_time = self.start_time.isoformat() if self.start_time else None
         end_time = self.end_time.isoformat() if self.end_time else None
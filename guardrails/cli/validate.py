@@ -1,12 +1,46 @@
+import asyncio
 import json
-from typing import Dict, List, Union
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import IO, Any, Deque, Dict, Iterable, List, Optional, TextIO, Union
 
 import typer
 
-from guardrails import Guard
+from guardrails import AsyncGuard, Guard
 from guardrails.cli.guardrails import guardrails
 from guardrails.cli.telemetry import trace_if_enabled
 
+DEFAULT_BATCH_CONCURRENCY = 16
+
+
+@dataclass
+class BatchSummary:
+    records: int = 0
+    passed: int = 0
+    failed: int = 0
+    errored: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Records validated per second."""
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def failure_rate(self) -> float:
+        """The fraction of records that failed validation or errored."""
+        return (self.failed + self.errored) / self.records if self.records else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"Validated {self.records} records in {self.elapsed:.2f}s"
+            f" ({self.throughput:.1f} records/s):"
+            f" {self.passed} passed, {self.failed} failed, {self.errored} errored"
+            f" ({self.failure_rate:.2%} failure rate)"
+        )
+
 
 def validate_llm_output(rail: str, llm_output: str) -> Union[str, Dict, List, None]:
     """Validate guardrails.yml file."""
@@ -15,20 +49,156 @@ def validate_llm_output(rail: str, llm_output: str) -> Union[str, Dict, List, No
     return result.validated_output
 
 
+def _parse_record(line: str) -> Dict[str, Any]:
+    """A batch record is either a JSON string holding the LLM output, or an
+    object with an `llm_output` and optionally `metadata` for the
+    validators."""
+    record = json.loads(line)
+    if isinstance(record, str):
+        return {"llm_output": record}
+    if not isinstance(record, dict) or not isinstance(record.get("llm_output"), str):
+        raise ValueError(
+            "Each record must be a string or an object with an 'llm_output' string."
+        )
+    return record
+
+
+async def _validate_record(guard: AsyncGuard, line: str) -> Dict[str, Any]:
+    try:
+        record = _parse_record(line)
+        outcome = await guard.parse(
+            record["llm_output"], metadata=record.get("metadata")
+        )
+        return {
+            "validation_passed": outcome.validation_passed,
+            "validated_output": outcome.validated_output,
+            "error": outcome.error,
+        }
+    except Exception as e:
+        return {"validation_passed": False, "validated_output": None, "error": str(e)}
+
+
+async def _validate_batch(
+    guard: AsyncGuard,
+    lines: Iterable[str],
+    output: TextIO,
+    concurrency: int,
+    summary: BatchSummary,
+) -> None:
+    # Up to `concurrency` records are validated at once, but results are
+    #   written as soon as every record before them is done, so the output
+    #   keeps the input's order without holding the whole batch in memory.
+    pending: Deque["asyncio.Task[Dict[str, Any]]"] = deque()
+
+    async def write_next():
+        result = await pending.popleft()
+        output.write(json.dumps(result, default=str) + "\n")
+        summary.records += 1
+        if result["error"] is not None:
+            summary.errored += 1
+        elif result["validation_passed"]:
+            summary.passed += 1
+        else:
+            summary.failed += 1
+        # The outcome has been written, so the guard doesn't need to keep
+        #   its call around; otherwise history grows with every record.
+        guard.history.clear()
+
+    records = iter(lines)
+    while True:
+        # Reading can block, e.g. on stdin, so it's done off the event loop
+        #   to let the records already started keep running meanwhile.
+        line = await asyncio.to_thread(next, records, None)
+        if line is None:
+            break
+        if not line.strip():
+            continue
+        if len(pending) >= concurrency:
+            await write_next()
+        pending.append(asyncio.ensure_future(_validate_record(guard, line)))
+    while pending:
+        await write_next()
+    output.flush()
+
+
+def validate_batch(
+    rail: str,
+    lines: Iterable[str],
+    output: TextIO,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> BatchSummary:
+    """Validates each JSONL record in `lines` against the rail spec, writing
+    one JSON result per record to `output` in the same order.
+
+    The rail spec is only parsed once, and its guard is shared by every
+    record.
+
+    Args:
+        rail: Path to the rail spec.
+        lines: JSONL records, see `_parse_record`.
+        output: Where to write the JSONL results.
+        concurrency: How many records to validate at once.
+
+    Returns:
+        Counts of the records that passed, failed, or errored, and how long
+        they took.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+    guard = AsyncGuard.from_rail(rail)
+    summary = BatchSummary()
+    start = time.perf_counter()
+    asyncio.run(_validate_batch(guard, lines, output, concurrency, summary))
+    summary.elapsed = time.perf_counter() - start
+    return summary
+
+
 @guardrails.command()
 def validate(
     rail: str = typer.Argument(
         ..., help="Path to the rail spec.", exists=True, file_okay=True, dir_okay=False
     ),
-    llm_output: str = typer.Argument(..., help="String of llm output."),
+    llm_output: Optional[str] = typer.Argument(
+        None, help="String of llm output. Not used with --batch."
+    ),
     out: str = typer.Option(
         default=".rail_output",
         help="Path to the compiled output directory.",
         file_okay=True,
         dir_okay=False,
     ),
+    batch: Optional[str] = typer.Option(
+        None,
+        "--batch",
+        help="Path to a JSONL file of llm outputs to validate, or - for stdin."
+        " Each line is a JSON string, or an object with an 'llm_output' and"
+        " optionally 'metadata'. Results are written to stdout as JSONL, in the"
+        " same order, followed by a summary on stderr.",
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_BATCH_CONCURRENCY,
+        "--concurrency",
+        min=1,
+        help="How many records to validate at once with --batch. This only"
+        " speeds up validators that wait on I/O, e.g. calls to a model or an"
+        " API; CPU-bound validators still run one record at a time.",
+    ),
 ):
     """Validate the output of an LLM against a `rail` spec."""
+    if batch is not None:
+        trace_if_enabled("validate/batch")
+        input_file: IO[str] = sys.stdin if batch == "-" else open(batch, "r")
+        try:
+            summary = validate_batch(rail, input_file, sys.stdout, concurrency)
+        finally:
+            if input_file is not sys.stdin:
+                input_file.close()
+        typer.echo(str(summary), err=True)
+        return summary
+
+    if llm_output is None:
+        raise typer.BadParameter("Provide an llm output, or records with --batch.")
+
     trace_if_enabled("validate")
     result = validate_llm_output(rail, llm_output)
     # Result is a dictionary, log it to a file
@@ -1,4 +1,5 @@
 import hashlib
+import os
 from abc import ABC, abstractmethod
 from collections import namedtuple
 from dataclasses import dataclass
@@ -6,13 +7,18 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import Field
 
-from guardrails.vectordb import VectorDBBase
+from guardrails.vectordb import MemmapVectorDB, VectorDBBase
 
 try:
     from sqlalchemy.exc import IntegrityError
 except ImportError:
     pass
 
+# The most vector indexes looked up in a single `IN (...)` clause
+MAX_IN_CLAUSE_SIZE = 500
+
+METADATA_FILE_NAME = "metadata.db"
+
 
 @dataclass
 class Document:
@@ -79,6 +85,19 @@ class DocumentStoreBase(ABC):
         """
         ...
 
+    def search_batch(self, queries: List[str], k: int = 4) -> List[List[Page]]:
+        """Searches for pages which contain text similar to each of the
+        queries.
+
+        Args:
+            queries: Texts to search for.
+            k: Number of similar pages to return per query.
+
+        Returns:
+            List[List[Page]] The similar pages for each query, in order.
+        """
+        return [self.search(query, k) for query in queries]
+
     @abstractmethod
     def add_text(self, text: str, meta: Dict[Any, Any]) -> str:
         """Adds a text to the store.
@@ -113,7 +132,7 @@ class DocumentStoreBase(ABC):
 
 try:
     import sqlalchemy
-    from sqlalchemy.orm import Mapped, Session, declarative_base, mapped_column
+    from sqlalchemy.orm import Mapped, declarative_base, mapped_column, sessionmaker
 
     class RealEphemeralDocumentStore(DocumentStoreBase):
         """EphemeralDocumentStore is a document store that stores the documents
@@ -163,6 +182,14 @@ try:
             filtered_ids = list(filter(lambda x: x != -1, vector_db_indexes))
             return self._storage.get_pages_for_for_indexes(filtered_ids)
 
+        def search_batch(self, queries: List[str], k: int = 4) -> List[List[Page]]:
+            vector_db_indexes = self._vector_db.similarity_search_batch(queries, k)
+            filtered_ids = [
+                [index for index in indexes if index != -1]
+                for indexes in vector_db_indexes
+            ]
+            return self._storage.get_pages_for_indexes_batch(filtered_ids)
+
         def search_with_threshold(
             self, query: str, threshold: float, k: int = 4
         ) -> List[Page]:
@@ -175,6 +202,39 @@ try:
         def flush(self, path: Optional[str] = None):
             self._vector_db.save(path)
 
+    class RealPersistentDocumentStore(RealEphemeralDocumentStore):
+        """PersistentDocumentStore is a document store that keeps its vectors
+        in a memory-mapped MemmapVectorDB and their metadata in SQLite.
+
+        Documents are persisted as they're added, so there's no need to
+        flush. Workers can open the same store with a read-only
+        MemmapVectorDB to search it without each loading a copy.
+        """
+
+        def __init__(self, vector_db: MemmapVectorDB, path: Optional[str] = None):
+            """Creates a new PersistentDocumentStore.
+
+            Args:
+                vector_db: MemmapVectorDB instance to use for storing the vectors.
+                path: Path to the database file to store metadata in.
+                    Defaults to a file next to the vectors.
+            """
+            self._vector_db = vector_db
+            if path is None:
+                path = os.path.join(vector_db._path, METADATA_FILE_NAME)  # type: ignore
+            self._storage = RealSQLMetadataStore(path, read_only=vector_db.read_only)
+            if not vector_db.read_only:
+                # Metadata is written before the vectors, so drop the pages
+                #   of an add whose vectors were never committed.
+                with vector_db.write_lock():
+                    self._storage.delete_pages_from_index(vector_db.last_index())
+
+        def add_document(self, document: Document):
+            # Pages are numbered from the index of the next vector, so no
+            #   other writer can add vectors until this document's are in.
+            with self._vector_db.write_lock():  # type: ignore
+                super().add_document(document)
+
     Base = declarative_base()
 
     class RealSqlDocument(Base):
@@ -184,55 +244,91 @@ try:
         page_num: Mapped[int] = mapped_column(sqlalchemy.Integer, primary_key=True)  # type: ignore
         text: Mapped[str] = mapped_column(sqlalchemy.String)  # type: ignore
         meta: Mapped[dict] = mapped_column(sqlalchemy.PickleType)  # type: ignore
-        vector_index: Mapped[int] = mapped_column(sqlalchemy.Integer)  # type: ignore
+        vector_index: Mapped[int] = mapped_column(sqlalchemy.Integer, index=True)  # type: ignore
 
     class RealSQLMetadataStore:
-        def __init__(self, path: Optional[str] = None):
-            conn = f"sqlite:///{path}" if path is not None else "sqlite://"
+        def __init__(self, path: Optional[str] = None, read_only: bool = False):
+            if read_only:
+                if path is None:
+                    raise ValueError("A path is required to open a read-only store.")
+                conn = f"sqlite:///file:{path}?mode=ro&uri=true"
+            else:
+                conn = f"sqlite:///{path}" if path is not None else "sqlite://"
             self._engine = sqlalchemy.create_engine(conn)  # type: ignore
-            RealSqlDocument.metadata.create_all(self._engine, checkfirst=True)
+            if not read_only:
+                RealSqlDocument.metadata.create_all(self._engine, checkfirst=True)
+                # create_all skips tables that already exist, so databases made
+                #   before vector_index was indexed need the index added here.
+                for index in RealSqlDocument.__table__.indexes:  # type: ignore
+                    index.create(self._engine, checkfirst=True)
+            self._session_factory = sessionmaker(self._engine)
 
         def add_docs(self, docs: List[Document], vdb_last_index: int):
+            rows = []
             vector_id = vdb_last_index
-            with Session(self._engine) as session:
-                for doc in docs:
-                    for page_num, text in doc.pages.items():
-                        session.add(
-                            RealSqlDocument(
-                                id=doc.id,
-                                page_num=page_num,
-                                text=text,
-                                meta=doc.metadata,
-                                vector_index=vector_id,
-                            )
-                        )
-                        vector_id += 1
+            for doc in docs:
+                for page_num, text in doc.pages.items():
+                    rows.append(
+                        {
+                            "id": doc.id,
+                            "page_num": page_num,
+                            "text": text,
+                            "meta": doc.metadata,
+                            "vector_index": vector_id,
+                        }
+                    )
+                    vector_id += 1
+            if not rows:
+                return
 
-                session.commit()
+            # A single executemany rather than one INSERT per page
+            with self._session_factory.begin() as session:
+                session.execute(sqlalchemy.insert(RealSqlDocument), rows)
+
+        def delete_pages_from_index(self, vector_index: int):
+            """Deletes the pages of every vector from vector_index on."""
+            with self._session_factory.begin() as session:
+                session.execute(
+                    sqlalchemy.delete(RealSqlDocument).where(
+                        RealSqlDocument.vector_index >= vector_index
+                    )
+                )
 
         def get_pages_for_for_indexes(self, indexes: List[int]) -> List[Page]:
-            pages: List[Page] = []
-            with Session(self._engine) as session:
-                for index in indexes:
+            return self.get_pages_for_indexes_batch([indexes])[0]
+
+        def get_pages_for_indexes_batch(
+            self, indexes_per_query: List[List[int]]
+        ) -> List[List[Page]]:
+            """Looks up the pages for several searches at once, with one
+            query for all of their vector indexes."""
+            all_indexes = list({i for indexes in indexes_per_query for i in indexes})
+            pages_by_index: Dict[int, Page] = {}
+            with self._session_factory() as session:
+                # Stay well under SQLite's limit on bound parameters
+                for start in range(0, len(all_indexes), MAX_IN_CLAUSE_SIZE):
                     query = sqlalchemy.select(RealSqlDocument).where(
-                        RealSqlDocument.vector_index == index
-                    )
-                    sql_docs = session.execute(query)
-                    sql_doc = sql_docs.first()
-                    if sql_doc is None:
-                        continue
-                    sql_doc = sql_doc[0]
-                    pages.append(
-                        Page(
-                            PageCoordinates(sql_doc.id, sql_doc.page_num),
-                            sql_doc.text,
-                            sql_doc.meta,
+                        RealSqlDocument.vector_index.in_(
+                            all_indexes[start : start + MAX_IN_CLAUSE_SIZE]
                         )
                     )
+                    for sql_doc in session.scalars(query):
+                        pages_by_index.setdefault(
+                            sql_doc.vector_index,
+                            Page(
+                                PageCoordinates(sql_doc.id, sql_doc.page_num),
+                                sql_doc.text,
+                                sql_doc.meta,
+                            ),
+                        )
 
-            return pages
+            return [
+                [pages_by_index[i] for i in indexes if i in pages_by_index]
+                for indexes in indexes_per_query
+            ]
 
     EphemeralDocumentStore = RealEphemeralDocumentStore
+    PersistentDocumentStore = RealPersistentDocumentStore
     SQLDocument = RealSqlDocument
     SQLMetadataStore = RealSQLMetadataStore
 except ImportError:
@@ -246,6 +342,13 @@ except ImportError:
                 "Please install it using `poetry add SqlAlchemy`"
             )
 
+    class FallbackPersistentDocumentStore:
+        def __init__(self, *args, **kwargs):
+            raise ImportError(
+                "SQLAlchemy is required for PersistentDocumentStore"
+                "Please install it using `poetry add SqlAlchemy`"
+            )
+
     class FallbackSQLDocument:
         def __init__(self, *args, **kwargs):
             raise ImportError(
@@ -261,5 +364,6 @@ except ImportError:
             )
 
     EphemeralDocumentStore = FallbackEphemeralDocumentStore
+    PersistentDocumentStore = FallbackPersistentDocumentStore
     SQLDocument = FallbackSQLDocument
     SQLMetadataStore = FallbackSQLMetadataStore
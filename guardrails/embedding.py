@@ -1,10 +1,18 @@
 from abc import ABC, abstractmethod
-from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
 from itertools import islice
-from typing import Callable, List, Optional
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Tuple, Union
 
+from guardrails.stores.embedding_cache import EmbeddingCache
 from guardrails.utils.openai_utils import OpenAIClient
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# What an embedding API returns for a batch of texts
+Embeddings = Union[List[List[float]], "np.ndarray"]
+
 
 class EmbeddingBase(ABC):
     """Base class for embedding models."""
@@ -14,7 +22,23 @@ class EmbeddingBase(ABC):
         model: Optional[str] = None,
         encoding_name: Optional[str] = None,
         max_tokens: Optional[int] = None,
+        batch_size: int = 2048,
+        max_batch_tokens: Optional[int] = None,
+        max_concurrency: int = 1,
+        cache: Optional[EmbeddingCache] = None,
     ):
+        """
+        Args:
+            model: The embedding model to use.
+            encoding_name: The tiktoken encoding used to split long texts.
+            max_tokens: The maximum number of tokens the model accepts per input.
+            batch_size: The maximum number of inputs sent in one request.
+            max_batch_tokens: The maximum number of tokens sent in one request.
+                Defaults to None, i.e. only batch_size limits a request.
+            max_concurrency: How many requests `embed` may send at once.
+            cache: Where to look up embeddings of texts that were seen before.
+                Defaults to None, i.e. every text is embedded.
+        """
         try:
             import numpy  # noqa: F401
         except ImportError:
@@ -26,29 +50,131 @@ class EmbeddingBase(ABC):
         self._model = model
         self._encoding_name = encoding_name
         self._max_tokens = max_tokens
+        self._batch_size = batch_size
+        self._max_batch_tokens = max_batch_tokens
+        self._max_concurrency = max_concurrency
+        self._cache = cache
 
     @abstractmethod
-    def embed(self, texts: List[str]) -> List[List[float]]:
-        """Embeds a list of texts and returns a list of vectors of floats."""
+    def embed(self, texts: List[str]) -> "np.ndarray":
+        """Embeds a list of texts and returns a 2D float32 array with one
+        vector per text."""
         ...
 
     @abstractmethod
-    def embed_query(self, query: str) -> List[float]:
-        """Embeds a single query and returns a vector of floats."""
+    def embed_query(self, query: str) -> "np.ndarray":
+        """Embeds a single query and returns a float32 vector."""
         ...
 
+    def embed_queries(self, queries: List[str]) -> "np.ndarray":
+        """Embeds several queries and returns a 2D float32 array with one
+        vector per query.
+
+        Subclasses should override this to embed all the queries in as
+        few requests as possible.
+        """
+        import numpy as np
+
+        if not queries:
+            return self._empty_embeddings()
+        return np.stack([self.embed_query(query) for query in queries])
+
+    def _empty_embeddings(self) -> "np.ndarray":
+        """The embeddings of no texts: a float32 array with no rows.
+
+        It has no columns either, since output_dim can be unknown or take a
+        call to the model.
+        """
+        import numpy as np
+
+        return np.empty((0, 0), dtype=np.float32)
+
+    def _cached_embed(
+        self,
+        texts: List[str],
+        embed_fn: Callable[[List[str]], Embeddings],
+        encoding_name: Optional[str],
+    ) -> "np.ndarray":
+        """Embeds the texts that aren't in the cache yet with `embed_fn`, and
+        returns the embeddings of all texts as a 2D float32 array."""
+        import numpy as np
+
+        if not texts:
+            return self._empty_embeddings()
+        if self._cache is None:
+            return np.asarray(embed_fn(texts), dtype=np.float32)
+
+        keys = [EmbeddingCache.get_key(self._model, encoding_name, t) for t in texts]
+        embeddings = [self._cache.get(key) for key in keys]
+
+        # Embed each missing text only once, even if it's repeated
+        missing = {
+            key: text
+            for key, text, embedding in zip(keys, texts, embeddings)
+            if embedding is None
+        }
+        if missing:
+            new_embeddings = dict(
+                zip(
+                    missing,
+                    np.asarray(embed_fn(list(missing.values())), dtype=np.float32),
+                )
+            )
+            for key, embedding in new_embeddings.items():
+                self._cache.set(key, embedding)
+            embeddings = [
+                embedding if embedding is not None else new_embeddings[key]
+                for key, embedding in zip(keys, embeddings)
+            ]
+        return np.stack(embeddings)  # type: ignore
+
+    def _get_embeddings_in_batches(
+        self, texts: List[str], embedder: Callable[[List[str]], Embeddings]
+    ) -> List[List[float]]:
+        """Embeds texts that are known to fit the model as-is, `batch_size`
+        texts per request."""
+        embeddings = []
+        for batch in self._batched(texts, self._batch_size):
+            embeddings.extend(embedder(batch))
+        return embeddings
+
     def _len_safe_get_embedding(
-        self, text, embedder: Callable[[str], List[float]], average=True
-    ) -> List[float]:
+        self, text: str, embedder: Callable[[List[str]], Embeddings], average=True
+    ) -> "np.ndarray":
         """Gets the embedding for a text, but splits it into chunks if it is
         too long.
 
+        All chunks are embedded with a single call to `embedder`.
+
         Args:
             text: Text to embed.
-            embedder: Embedding function to use.
+            embedder: Embedding function that embeds a batch of texts.
             average: Whether to average the embeddings of the chunks.
         Returns:
-            List[float] Embedding of the text.
+            np.ndarray Embedding of the text as a float32 vector.
+        """
+        embeddings = self._len_safe_get_embeddings([text], embedder, average=average)
+        return embeddings[0].flatten()
+
+    def _len_safe_get_embeddings(
+        self,
+        texts: List[str],
+        embedder: Callable[[List[str]], Embeddings],
+        average=True,
+    ) -> Union["np.ndarray", List["np.ndarray"]]:
+        """Gets the embeddings for many texts at once.
+
+        Texts that are too long are split into chunks, and the chunks of
+        all texts are packed into as few calls to `embedder` as the batch
+        limits allow.
+
+        Args:
+            texts: Texts to embed.
+            embedder: Embedding function that embeds a batch of texts.
+            average: Whether to average the embeddings of each text's chunks.
+        Returns:
+            np.ndarray A 2D float32 array with the embedding of each text if
+                averaging, otherwise a list of each text's chunk embeddings.
         """
         try:
             import numpy as np
@@ -58,38 +184,95 @@ class EmbeddingBase(ABC):
                 "Please install it with `poetry add numpy`."
             )
 
-        chunk_embeddings_list = []
-        chunk_lens = []
+        if not texts:
+            return self._empty_embeddings() if average else []
 
-        for chunk in EmbeddingBase._chunked_tokens(
-            text=text, encoding_name=self._encoding_name, chunk_length=self._max_tokens
-        ):
-            chunk_embeddings_list.append(embedder(chunk))
-            chunk_lens.append(len(chunk))
-
-        if average:
-            chunk_embeddings = np.average(
-                chunk_embeddings_list, axis=0, weights=chunk_lens
+        chunks: List[str] = []
+        chunk_token_counts: List[int] = []
+        chunks_per_text: List[int] = []
+        for text in texts:
+            text_chunks = list(
+                EmbeddingBase._chunked_tokens_with_counts(
+                    text=text,
+                    encoding_name=self._encoding_name,
+                    chunk_length=self._max_tokens,
+                )
             )
-            chunk_embeddings = chunk_embeddings / np.linalg.norm(
-                chunk_embeddings
-            )  # normalizes length to 1
+            if not text_chunks:
+                raise ValueError("Cannot embed an empty text.")
+            chunks.extend(chunk for chunk, _ in text_chunks)
+            chunk_token_counts.extend(count for _, count in text_chunks)
+            chunks_per_text.append(len(text_chunks))
+
+        batches = [
+            chunks[start:end] for start, end in self._batch_bounds(chunk_token_counts)
+        ]
+        if self._max_concurrency > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+                batch_embeddings = list(executor.map(embedder, batches))
         else:
-            chunk_embeddings = np.array(chunk_embeddings_list)
-        return chunk_embeddings.flatten().tolist()
+            batch_embeddings = [embedder(batch) for batch in batches]
+        chunk_embeddings = np.concatenate(
+            [np.asarray(batch, dtype=np.float32) for batch in batch_embeddings]
+        )
+
+        text_starts = np.cumsum([0] + chunks_per_text[:-1])
+        if not average:
+            return np.split(chunk_embeddings, text_starts[1:])
+
+        # Average each text's chunks weighted by their length,
+        #   then normalize the length to 1.
+        weights = np.array([len(chunk) for chunk in chunks], dtype=np.float32)
+        weighted_sums = np.add.reduceat(
+            chunk_embeddings * weights[:, np.newaxis], text_starts, axis=0
+        )
+        embeddings = weighted_sums / np.add.reduceat(weights, text_starts)[:, None]
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings
+
+    def _batch_bounds(self, token_counts: List[int]) -> Iterator[Tuple[int, int]]:
+        """Splits inputs with the given token counts into consecutive batches
+        that respect batch_size and max_batch_tokens.
+
+        Yields the start and end index of each batch.
+        """
+        start = 0
+        batch_tokens = 0
+        for i, count in enumerate(token_counts):
+            batch_full = i - start >= self._batch_size or (
+                self._max_batch_tokens is not None
+                and batch_tokens + count > self._max_batch_tokens
+            )
+            if batch_full and i > start:
+                yield start, i
+                start = i
+                batch_tokens = 0
+            batch_tokens += count
+        if start < len(token_counts):
+            yield start, len(token_counts)
 
     @staticmethod
     def _chunked_tokens(text, encoding_name, chunk_length):
         """Calculates the number of tokens and chunks them into chunks of
         tokens."""
+        for chunk, _ in EmbeddingBase._chunked_tokens_with_counts(
+            text=text, encoding_name=encoding_name, chunk_length=chunk_length
+        ):
+            yield chunk
+
+    @staticmethod
+    def _chunked_tokens_with_counts(
+        text, encoding_name, chunk_length
+    ) -> Iterator[Tuple[str, int]]:
+        """Like `_chunked_tokens`, but also yields the number of tokens in each
+        chunk."""
         import tiktoken
 
         encoding = tiktoken.get_encoding(encoding_name)
         tokens = encoding.encode(text)
-        chunks_iterator = EmbeddingBase._batched(iterable=tokens, n=chunk_length)
         # Detokenize the chunks
-        for chunk in chunks_iterator:
-            yield encoding.decode(chunk)
+        for chunk in EmbeddingBase._batched(iterable=tokens, n=chunk_length):
+            yield encoding.decode(chunk), len(chunk)
 
     @staticmethod
     def _batched(iterable, n):
@@ -118,29 +301,53 @@ class OpenAIEmbedding(EmbeddingBase):
         max_tokens: int = 8191,
         api_key: Optional[str] = None,
         api_base: Optional[str] = None,
+        batch_size: int = 2048,
+        max_batch_tokens: Optional[int] = 300_000,
+        max_concurrency: int = 1,
+        cache: Optional[EmbeddingCache] = None,
     ):
-        super().__init__(model, encoding_name, max_tokens)
+        super().__init__(
+            model,
+            encoding_name,
+            max_tokens,
+            batch_size=batch_size,
+            max_batch_tokens=max_batch_tokens,
+            max_concurrency=max_concurrency,
+            cache=cache,
+        )
         self._model = model
         self.api_key = api_key
         self.api_base = api_base
 
-    def embed(self, texts: List[str]) -> List[List[float]]:
-        embeddings = []
-        for text in texts:
-            embeddings.append(super()._len_safe_get_embedding(text, self.embed_query))
-
-        return embeddings
+    def embed(self, texts: List[str]) -> "np.ndarray":
+        return self._cached_embed(
+            texts,
+            partial(self._len_safe_get_embeddings, embedder=self._get_embedding),
+            self._encoding_name,
+        )
 
-    def embed_query(self, query: str) -> List[float]:
-        resp = self._get_embedding([query])
+    def embed_query(self, query: str) -> "np.ndarray":
+        # Queries aren't chunked, so they're cached without an encoding
+        resp = self._cached_embed([query], self._get_embedding, None)
         return resp[0]
 
-    def _get_embedding(self, texts: List[str]) -> List[List[float]]:
-        client = OpenAIClient(
+    def embed_queries(self, queries: List[str]) -> "np.ndarray":
+        return self._cached_embed(
+            queries,
+            partial(self._get_embeddings_in_batches, embedder=self._get_embedding),
+            None,
+        )
+
+    @cached_property
+    def _client(self) -> OpenAIClient:
+        # One client, and so one connection pool, per embedder
+        return OpenAIClient(
             api_key=self.api_key,
             api_base=self.api_base,
         )
-        return client.create_embedding(
+
+    def _get_embedding(self, texts: List[str]) -> List[List[float]]:
+        return self._client.create_embedding(
             model=self._model,
             input=texts,
         )
@@ -173,6 +380,10 @@ class ManifestEmbedding(EmbeddingBase):
         engine: Optional[str] = "text-embedding-ada-002",
         encoding_name: Optional[str] = "cl100k_base",
         max_tokens: Optional[int] = 8191,
+        batch_size: int = 2048,
+        max_batch_tokens: Optional[int] = None,
+        max_concurrency: int = 1,
+        cache: Optional[EmbeddingCache] = None,
     ):
         try:
             from manifest import Manifest  # type: ignore
@@ -181,7 +392,15 @@ class ManifestEmbedding(EmbeddingBase):
                 "The `manifest` package is not installed. "
                 "Install with `poetry add manifest-ml`"
             )
-        super().__init__(engine, encoding_name, max_tokens)
+        super().__init__(
+            engine,
+            encoding_name,
+            max_tokens,
+            batch_size=batch_size,
+            max_batch_tokens=max_batch_tokens,
+            max_concurrency=max_concurrency,
+            cache=cache,
+        )
         self._client_name = client_name
         self._client_connection = client_connection
         self._cache_name = cache_name
@@ -197,17 +416,25 @@ class ManifestEmbedding(EmbeddingBase):
         manifest_args = {k: v for k, v in manifest_args.items() if v is not None}
         self._manifest = Manifest(**manifest_args)
 
-    def embed(self, texts: List[str]) -> List[List[float]]:
-        embeddings = []
-        for text in texts:
-            embeddings.append(super()._len_safe_get_embedding(text, self.embed_query))
-
-        return embeddings
+    def embed(self, texts: List[str]) -> "np.ndarray":
+        return self._cached_embed(
+            texts,
+            partial(self._len_safe_get_embeddings, embedder=self._get_embedding),
+            self._encoding_name,
+        )
 
-    def embed_query(self, query: str) -> List[float]:
-        resp = self._get_embedding([query])
+    def embed_query(self, query: str) -> "np.ndarray":
+        # Queries aren't chunked, so they're cached without an encoding
+        resp = self._cached_embed([query], self._get_embedding, None)
         return resp[0]
 
+    def embed_queries(self, queries: List[str]) -> "np.ndarray":
+        return self._cached_embed(
+            queries,
+            partial(self._get_embeddings_in_batches, embedder=self._get_embedding),
+            None,
+        )
+
     def _get_embedding(self, texts: List[str]) -> List[List[float]]:
         embeddings = self._manifest.run(texts)
         return embeddings  # type: ignore
@@ -1,8 +1,10 @@
 import contextvars
+import copy
 import json
 import os
 from builtins import id as object_id
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
@@ -17,7 +19,6 @@ from typing import (
     overload,
 )
 import warnings
-from langchain_core.runnables import Runnable
 
 from guardrails_api_client import (
     Guard as IGuard,
@@ -37,6 +38,7 @@ from guardrails.classes.validation_outcome import ValidationOutcome
 from guardrails.classes.credentials import Credentials
 from guardrails.classes.execution import GuardExecutionOptions
 from guardrails.classes.generic import Stack
+from guardrails.classes.generic.stack import LazyStack
 from guardrails.classes.history import Call
 from guardrails.classes.history.call_inputs import CallInputs
 from guardrails.classes.output_type import OutputTypes
@@ -50,9 +52,9 @@ from guardrails.llm_providers import (
 )
 from guardrails.logger import logger, set_scope
 from guardrails.run import Runner, StreamRunner
+from guardrails.run.execution_plan import ExecutionPlan
 from guardrails.schema.primitive_schema import primitive_to_schema
 from guardrails.schema.pydantic_schema import pydantic_model_to_schema
-from guardrails.schema.rail_schema import rail_file_to_schema, rail_string_to_schema
 from guardrails.schema.validator import SchemaValidationError, validate_json_schema
 from guardrails.stores.context import (
     Tracer,
@@ -95,6 +97,9 @@ from guardrails.utils.structured_data_utils import (
 from guardrails.settings import settings
 from guardrails.decorators.experimental import experimental
 
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+
 
 class Guard(IGuard, Generic[OT]):
     """The Guard class.
@@ -194,6 +199,10 @@ class Guard(IGuard, Generic[OT]):
         self._api_client: Optional[GuardrailsApiClient] = None
         self._allow_metrics_collection: Optional[bool] = None
         self._output_formatter: Optional[BaseFormatter] = None
+        self._short_circuit_validation: bool = True
+        self._execution_plan: Optional[ExecutionPlan] = None
+        # The output schema the plan was built from, to tell when it changes
+        self._execution_plan_schema: Optional[Dict[str, Any]] = None
 
         # Gaurdrails As A Service Initialization
         if settings.use_server:
@@ -242,6 +251,7 @@ class Guard(IGuard, Generic[OT]):
         num_reasks: Optional[int] = None,
         tracer: Optional[Tracer] = None,
         allow_metrics_collection: Optional[bool] = None,
+        short_circuit_validation: Optional[bool] = None,
     ):
         """Configure the Guard.
 
@@ -254,12 +264,20 @@ class Guard(IGuard, Generic[OT]):
                 Guardrails to collect anonymous metrics.
                 Defaults to None, and falls back to waht is
                     set via the `guardrails configure` command.
+            short_circuit_validation (bool, optional): Whether to cancel
+                outstanding validators once an `exception`, `refrain`, or
+                `filter` validator fails. Cancelled validators are logged
+                as "not run". Defaults to None, which leaves the current
+                setting (enabled) unchanged.
         """
         if num_reasks:
             self._set_num_reasks(num_reasks)
         if tracer:
             self._set_tracer(tracer)
+        if short_circuit_validation is not None:
+            self._short_circuit_validation = short_circuit_validation
         self._configure_hub_telemtry(allow_metrics_collection)
+        self._invalidate_execution_plan()
 
     def _set_num_reasks(self, num_reasks: Optional[int] = None) -> None:
         # Configure may check if num_reasks is none, but this method still needs to be
@@ -328,8 +346,38 @@ class Guard(IGuard, Generic[OT]):
                 validator = parse_validator_reference(ref)
                 if validator:
                     entry.append(validator)
+                    # The plan's schema strings describe the validators
+                    self._invalidate_execution_plan()
                 self._validator_map[ref.on] = entry  # type: ignore
 
+    def _has_current_execution_plan(self) -> bool:
+        # Compared by value, since the schema can also be changed in place
+        return (
+            self._execution_plan is not None
+            and self._execution_plan_schema == self.output_schema.to_dict()
+        )
+
+    def _invalidate_execution_plan(self) -> None:
+        self._execution_plan = None
+        self._execution_plan_schema = None
+
+    def _get_execution_plan(self) -> ExecutionPlan:
+        """Get the execution state shared by every call to this Guard.
+
+        It is rebuilt after `use()`, `use_many()`, `configure()`, or
+        when the output schema changes.
+        """
+        if not self._has_current_execution_plan():
+            output_schema = self.output_schema.to_dict()
+            self._execution_plan = ExecutionPlan(
+                self._output_type,
+                output_schema,
+                self._validator_map,
+            )
+            # A copy, so changes to nested parts of the schema are noticed
+            self._execution_plan_schema = copy.deepcopy(output_schema)
+        return self._execution_plan  # type: ignore
+
     def _fill_validators(self):
         self._validators = [
             v
@@ -432,6 +480,8 @@ class Guard(IGuard, Generic[OT]):
         #   and therefore the Validators, are initialized
         cls._set_tracer(cls, tracer)  # type: ignore
 
+        from guardrails.schema.rail_schema import rail_file_to_schema
+
         schema = rail_file_to_schema(rail_file)
         return cls._from_rail_schema(
             schema,
@@ -481,6 +531,8 @@ class Guard(IGuard, Generic[OT]):
         #   and therefore the Validators, are initialized
         cls._set_tracer(cls, tracer)  # type: ignore
 
+        from guardrails.schema.rail_schema import rail_string_to_schema
+
         schema = rail_string_to_schema(rail_string)
         return cls._from_rail_schema(
             schema,
@@ -879,12 +931,14 @@ class Guard(IGuard, Generic[OT]):
             # Type suppression here? ArbitraryCallable is a subclass of PromptCallable!?
             api = self._output_formatter.wrap_callable(api)  # type: ignore
 
+        execution_plan = self._get_execution_plan()
+
         # Check whether stream is set
         if kwargs.get("stream", False):
             # If stream is True, use StreamRunner
             runner = StreamRunner(
                 output_type=self._output_type,
-                output_schema=self.output_schema.to_dict(),
+                output_schema=execution_plan.output_schema,
                 num_reasks=num_reasks,
                 validation_map=self._validator_map,
                 prompt=prompt,
@@ -897,13 +951,15 @@ class Guard(IGuard, Generic[OT]):
                 full_schema_reask=full_schema_reask,
                 disable_tracer=(not self._allow_metrics_collection),
                 exec_options=self._exec_opts,
+                short_circuit_validation=self._short_circuit_validation,
+                execution_plan=execution_plan,
             )
             return runner(call_log=call_log, prompt_params=prompt_params)
         else:
             # Otherwise, use Runner
             runner = Runner(
                 output_type=self._output_type,
-                output_schema=self.output_schema.to_dict(),
+                output_schema=execution_plan.output_schema,
                 num_reasks=num_reasks,
                 validation_map=self._validator_map,
                 prompt=prompt,
@@ -916,6 +972,8 @@ class Guard(IGuard, Generic[OT]):
                 full_schema_reask=full_schema_reask,
                 disable_tracer=(not self._allow_metrics_collection),
                 exec_options=self._exec_opts,
+                short_circuit_validation=self._short_circuit_validation,
+                execution_plan=execution_plan,
             )
             call = runner(call_log=call_log, prompt_params=prompt_params)
             return ValidationOutcome[OT].from_guard_history(call)
@@ -1081,6 +1139,7 @@ class Guard(IGuard, Generic[OT]):
         self._validator_map[on] = self._validator_map.get(on, [])
         self._validator_map[on].append(validator)
         self._validators.append(validator)
+        self._invalidate_execution_plan()
 
     @overload
     def use(self, validator: Validator, *, on: str = "output") -> "Guard": ...
@@ -1172,6 +1231,29 @@ class Guard(IGuard, Generic[OT]):
         else:
             raise ValueError("Using the Guardrails server is not enabled!")
 
+    def _defer_server_history(self, call_id: str) -> None:
+        """Adds the server's record of the call to history the next time
+        history is used, instead of fetching it after every validation.
+
+        Set `settings.fetch_server_history` to False to never fetch it.
+        """
+        if settings.fetch_server_history is False or not self._api_client:
+            return
+        if not isinstance(self.history, LazyStack):
+            self.history = LazyStack(*self.history)
+        api_client = self._api_client
+        guard_name = self.name
+
+        def load_history() -> List[Call]:
+            try:
+                guard_history = api_client.get_history(guard_name, call_id)
+            except Exception as e:
+                logger.error(f"Error fetching history for call {call_id}: {e}")
+                return []
+            return [Call.from_interface(call) for call in guard_history]
+
+        self.history.defer(load_history)
+
     def _single_server_call(self, *, payload: Dict[str, Any]) -> ValidationOutcome[OT]:
         if settings.use_server and self._api_client:
             validation_output: IValidationOutcome = self._api_client.validate(
@@ -1188,10 +1270,7 @@ class Guard(IGuard, Generic[OT]):
                     error="The response from the server was empty!",
                 )
 
-            guard_history = self._api_client.get_history(
-                self.name, validation_output.call_id
-            )
-            self.history.extend([Call.from_interface(call) for call in guard_history])
+            self._defer_server_history(validation_output.call_id)
 
             # TODO: See if the below statement is still true
             # Our interfaces are too different for this to work right now.
@@ -1247,12 +1326,7 @@ class Guard(IGuard, Generic[OT]):
                         validation_passed=(validation_output.validation_passed is True),
                     )
             if validation_output:
-                guard_history = self._api_client.get_history(
-                    self.name, validation_output.call_id
-                )
-                self.history.extend(
-                    [Call.from_interface(call) for call in guard_history]
-                )
+                self._defer_server_history(validation_output.call_id)
         else:
             raise ValueError("Guard does not have an api client!")
 
@@ -1320,7 +1394,7 @@ class Guard(IGuard, Generic[OT]):
                 self._api_client = GuardrailsApiClient(api_key=api_key)
             self.upsert_guard()
 
-    def to_runnable(self) -> Runnable:
+    def to_runnable(self) -> "Runnable":
         """Convert a Guard to a LangChain Runnable."""
         from guardrails.integrations.langchain.guard_runnable import GuardRunnable
 
@@ -1,8 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from string import Template
 from typing import Callable, cast, List
 
+from guardrails_hub_types import Manifest
+
 from guardrails.hub.validator_package_service import (
+    MANIFEST_CACHE_TTL,
     ValidatorPackageService,
     ValidatorModuleType,
 )
@@ -31,6 +35,71 @@ def default_local_models_confirm():
     )
 
 
+# Validators fetched, built and set up at once by install_multiple
+DEFAULT_MAX_WORKERS = 4
+
+
+def _should_install_local_models(
+    module_manifest: Manifest,
+    install_local_models=None,
+    install_local_models_confirm: Callable = default_local_models_confirm,
+) -> bool:
+    """Whether to run the validator's post-install setup, which downloads
+    the models it needs for local inference."""
+    has_rc_file = Credentials.has_rc_file()
+    use_remote_endpoint = False
+    module_has_endpoint = (
+        module_manifest.tags and module_manifest.tags.has_guardrails_endpoint
+    )
+
+    try:
+        if has_rc_file:
+            # if we do want to remote then we don't want to install local models
+            use_remote_endpoint = (
+                Credentials.from_rc_file(cli_logger).use_remote_inferencing
+                and module_has_endpoint
+            )
+        elif install_local_models is None and module_has_endpoint:
+            install_local_models = install_local_models_confirm()
+    except AttributeError:
+        pass
+
+    install_local_models = (
+        install_local_models if install_local_models is not None else True
+    )
+    return not use_remote_endpoint and install_local_models is True
+
+
+def _log_install_success(package_uri: str, module_manifest: Manifest, quiet: bool):
+    quiet_printer = console.print if not quiet else lambda x: None
+
+    module_name = ValidatorPackageService.get_module_name(package_uri)
+    console.print(f"✅Successfully installed {module_name}!\n\n")
+    success_message_cli = Template(
+        "[bold]Import validator:[/bold]\n"
+        "from guardrails.hub import ${export}\n\n"
+        "[bold]Get more info:[/bold]\n"
+        "https://hub.guardrailsai.com/validator/${id}\n"
+    ).safe_substitute(
+        module_name=package_uri,
+        id=module_manifest.id,
+        export=module_manifest.exports[0],
+    )
+    success_message_logger = Template(
+        "✅Successfully installed ${module_name}!\n\n"
+        "Import validator:\n"
+        "from guardrails.hub import ${export}\n\n"
+        "Get more info:\n"
+        "https://hub.guardrailsai.com/validator/${id}\n"
+    ).safe_substitute(
+        module_name=package_uri,
+        id=module_manifest.id,
+        export=module_manifest.exports[0],
+    )
+    quiet_printer(success_message_cli)  # type: ignore
+    cli_logger.log(level=LEVELS.get("SPAM"), msg=success_message_logger)  # type: ignore
+
+
 def install(
     package_uri: str,
     install_local_models=None,
@@ -58,10 +127,8 @@ def install(
     """
 
     verbose_printer = console.print
-    quiet_printer = console.print if not quiet else lambda x: None
 
     # 1. Validation
-    has_rc_file = Credentials.has_rc_file()
     module_name = ValidatorPackageService.get_module_name(package_uri)
 
     installing_msg = f"Installing {package_uri}..."
@@ -92,28 +159,10 @@ def install(
             logger=cli_logger,
         )
 
-    use_remote_endpoint = False
-    module_has_endpoint = (
-        module_manifest.tags and module_manifest.tags.has_guardrails_endpoint
-    )
-
-    try:
-        if has_rc_file:
-            # if we do want to remote then we don't want to install local models
-            use_remote_endpoint = (
-                Credentials.from_rc_file(cli_logger).use_remote_inferencing
-                and module_has_endpoint
-            )
-        elif install_local_models is None and module_has_endpoint:
-            install_local_models = install_local_models_confirm()
-    except AttributeError:
-        pass
-
     # 4. Post Installation
-    install_local_models = (
-        install_local_models if install_local_models is not None else True
-    )
-    if not use_remote_endpoint and install_local_models is True:
+    if _should_install_local_models(
+        module_manifest, install_local_models, install_local_models_confirm
+    ):
         cli_logger.log(
             level=LEVELS.get("SPAM"),  # type: ignore
             msg="Installing models locally!",
@@ -140,30 +189,7 @@ def install(
     # Print success messages
     cli_logger.info("Installation complete")
 
-    verbose_printer(f"✅Successfully installed {module_name}!\n\n")
-    success_message_cli = Template(
-        "[bold]Import validator:[/bold]\n"
-        "from guardrails.hub import ${export}\n\n"
-        "[bold]Get more info:[/bold]\n"
-        "https://hub.guardrailsai.com/validator/${id}\n"
-    ).safe_substitute(
-        module_name=package_uri,
-        id=module_manifest.id,
-        export=module_manifest.exports[0],
-    )
-    success_message_logger = Template(
-        "✅Successfully installed ${module_name}!\n\n"
-        "Import validator:\n"
-        "from guardrails.hub import ${export}\n\n"
-        "Get more info:\n"
-        "https://hub.guardrailsai.com/validator/${id}\n"
-    ).safe_substitute(
-        module_name=package_uri,
-        id=module_manifest.id,
-        export=module_manifest.exports[0],
-    )
-    quiet_printer(success_message_cli)  # type: ignore
-    cli_logger.log(level=LEVELS.get("SPAM"), msg=success_message_logger)  # type: ignore
+    _log_install_success(package_uri, module_manifest, quiet)
 
     # Not a fan of this but allows the installation to be used in create command as is
     installed_module.__validator_exports__ = module_manifest.exports
@@ -177,30 +203,165 @@ def install_multiple(
     quiet: bool = True,
     upgrade: bool = False,  # Add the upgrade parameter here
     install_local_models_confirm: Callable = default_local_models_confirm,
+    max_workers: int = DEFAULT_MAX_WORKERS,
 ) -> List[ValidatorModuleType]:
     """Install multiple validator packages from hub URIs.
 
+    Unlike calling `install` for each of several packages, every manifest
+    is fetched up front, the packages are built and installed in parallel,
+    their dependencies are installed with a single pip invocation, and
+    their post-install setup runs in parallel.  Manifests and built packages
+    are cached (see GUARDRAILS_HUB_CACHE_DIR), and validators already
+    installed from the same commit are skipped, so reinstalling an unchanged
+    set of validators does nothing.
+
     Args:
         package_uris (List[str]): List of URIs of the packages to install.
         install_local_models (bool): Whether to install local models or not.
         quiet (bool): Whether to suppress output or not.
         upgrade (bool): Whether to upgrade to the latest package version.
+            Also bypasses the cache.
         install_local_models_confirm (Callable): A function to confirm the
             installation of local models.
+        max_workers (int): How many packages to fetch, build and set up at
+            once.
 
     Returns:
         List[ValidatorModuleType]: List of installed validator modules.
     """
-    installed_modules = []
-
+    # 1. Validation
+    module_names = [
+        ValidatorPackageService.get_module_name(package_uri)
+        for package_uri in package_uris
+    ]
     for package_uri in package_uris:
-        installed_module = install(
-            package_uri,
-            install_local_models=install_local_models,
-            quiet=quiet,
-            upgrade=upgrade,  # Pass upgrade here
-            install_local_models_confirm=install_local_models_confirm,
+        installing_msg = f"Installing {package_uri}..."
+        cli_logger.log(
+            level=LEVELS.get("SPAM"),  # type: ignore
+            msg=installing_msg,
         )
+        console.print(installing_msg)
+
+    # Define Loader for UX purposes
+    loader = console.status if not quiet else do_nothing_context
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # 2. Prep Installation
+        with loader("Fetching manifests", spinner="bouncingBar"):
+            manifest_ttl = 0 if upgrade else MANIFEST_CACHE_TTL
+            module_manifests = list(
+                executor.map(
+                    lambda name: ValidatorPackageService.get_cached_manifest(
+                        name, ttl=manifest_ttl
+                    ),
+                    module_names,
+                )
+            )
+            # Branches move, so builds and installs are matched by commit
+            install_urls = list(
+                executor.map(
+                    lambda module_manifest: (
+                        ValidatorPackageService.get_pinned_install_url(
+                            module_manifest, logger=cli_logger
+                        )
+                    ),
+                    module_manifests,
+                )
+            )
+            site_packages = ValidatorPackageService.get_site_packages_location()
+
+        # May ask, so decide for every validator before installing any
+        run_post_installs = [
+            _should_install_local_models(
+                module_manifest, install_local_models, install_local_models_confirm
+            )
+            for module_manifest in module_manifests
+        ]
+
+        to_install = [
+            (module_manifest, install_url, run_post_install)
+            for module_manifest, install_url, run_post_install in zip(
+                module_manifests, install_urls, run_post_installs
+            )
+            if upgrade
+            or not ValidatorPackageService.is_installed(
+                module_manifest, site_packages, install_url
+            )
+        ]
+        if len(to_install) < len(module_manifests):
+            cli_logger.log(
+                level=LEVELS.get("SPAM"),  # type: ignore
+                msg=f"{len(module_manifests) - len(to_install)} validators are"
+                " already installed from the same commit, skipping them.",
+            )
+
+        # 3. Install - Pip Installation of the modules, then all of their
+        #   dependencies at once
+        with loader("Downloading dependencies", spinner="bouncingBar"):
+            install_specs = executor.map(
+                lambda entry: ValidatorPackageService.install_hub_module_from_cache(
+                    entry[0],
+                    site_packages,
+                    entry[1],
+                    quiet=quiet,
+                    upgrade=upgrade,
+                    logger=cli_logger,
+                ),
+                to_install,
+            )
+            ValidatorPackageService.install_requirements(
+                [spec for specs in install_specs for spec in specs],
+                quiet=quiet,
+                logger=cli_logger,
+            )
+
+        # 4. Post Installation
+        post_installs = [
+            module_manifest
+            for module_manifest, _, run_post_install in to_install
+            if run_post_install
+        ]
+        if post_installs:
+            cli_logger.log(
+                level=LEVELS.get("SPAM"),  # type: ignore
+                msg="Installing models locally!",
+            )
+            with loader("Running post-install setup", spinner="bouncingBar"):
+                list(
+                    executor.map(
+                        lambda module_manifest: (
+                            ValidatorPackageService.run_post_install(
+                                module_manifest, site_packages, logger=cli_logger
+                            )
+                        ),
+                        post_installs,
+                    )
+                )
+        if len(post_installs) < len(to_install):
+            cli_logger.log(
+                level=LEVELS.get("SPAM"),  # type: ignore
+                msg="Skipping post install for some validators, models will not be "
+                "downloaded for local inference.",
+            )
+
+    for module_manifest, install_url, _ in to_install:
+        ValidatorPackageService.write_install_record(
+            module_manifest, site_packages, install_url
+        )
+
+    # 5. Get Validator Class for the installed modules
+    installed_modules = []
+    for package_uri, module_manifest in zip(package_uris, module_manifests):
+        ValidatorPackageService.add_to_hub_inits(module_manifest, site_packages)
+        installed_module = ValidatorPackageService.get_validator_from_manifest(
+            module_manifest
+        )
+        installed_module = cast(ValidatorModuleType, installed_module)
+        _log_install_success(package_uri, module_manifest, quiet)
+        installed_module.__validator_exports__ = module_manifest.exports
         installed_modules.append(installed_module)
 
+    # Print success messages
+    cli_logger.info("Installation complete")
+
     return installed_modules
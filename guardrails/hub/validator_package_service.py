@@ -1,15 +1,26 @@
+import glob
+import hashlib
 import importlib
+import json
 import os
+import re
+import shutil
+import time
+from os.path import expanduser
 from pathlib import Path
 import subprocess
 import sys
 
-from typing import List, Literal
+from typing import List, Literal, Optional
 from types import ModuleType
 from pydash.strings import snake_case
 
 from guardrails.classes.generic.stack import Stack
 from guardrails.logger import logger as guardrails_logger
+from guardrails.utils.hub_registry_utils import (
+    build_hub_registry_index,
+    write_hub_registry_index,
+)
 
 
 from guardrails.cli.hub.utils import pip_process
@@ -20,6 +31,18 @@ from guardrails.cli.server.hub_client import get_validator_manifest
 json_format: Literal["json"] = "json"
 string_format: Literal["string"] = "string"
 
+# Where install_multiple keeps manifests and built validator wheels, so
+#   installing the same validator versions again doesn't go back to the hub
+#   or rebuild them from git.
+HUB_CACHE_DIR_ENV_VAR = "GUARDRAILS_HUB_CACHE_DIR"
+DEFAULT_HUB_CACHE_DIR = os.path.join(expanduser("~"), ".cache", "guardrails", "hub")
+MANIFEST_CACHE_TTL = 60 * 60  # seconds
+GIT_LS_REMOTE_TIMEOUT = 60  # seconds
+COMMIT_SHA = re.compile(r"^[0-9a-f]{40}$")
+
+# Written into a validator's hub directory once it's installed
+INSTALL_RECORD_FILE_NAME = ".install_record.json"
+
 
 class ValidatorModuleType(ModuleType):
     __validator_exports__: List[str]
@@ -157,6 +180,28 @@ class ValidatorPackageService:
                 namespace_init.write(import_line)
                 namespace_init.close()
 
+        ValidatorPackageService.update_hub_registry_index(manifest, site_packages)
+
+    @staticmethod
+    def update_hub_registry_index(manifest: Manifest, site_packages: str):
+        """Rebuilds the index get_validator_class uses to import only the
+        module that registers a validator, rather than all of
+        guardrails.hub."""
+        org_package = ValidatorPackageService.get_org_and_package_dirs(manifest)
+        module_path = ".".join(
+            ["guardrails", "hub", *org_package, manifest.module_name]
+        )
+        hub_directory = os.path.join(site_packages, "guardrails", "hub")
+        try:
+            index = build_hub_registry_index(
+                hub_directory, known={manifest.id: module_path}
+            )
+            write_hub_registry_index(hub_directory, index)
+        except OSError as e:
+            # Without an up to date index, validators are found by importing
+            #   all of guardrails.hub instead
+            guardrails_logger.debug(f"Failed to update the hub registry index: {e}")
+
     @staticmethod
     def get_module_path(package_name):
         try:
@@ -203,6 +248,52 @@ class ValidatorPackageService:
 
         return git_url
 
+    @staticmethod
+    def get_pinned_install_url(
+        manifest: Manifest, logger=guardrails_logger
+    ) -> Optional[str]:
+        """The install URL with its branch, or the default branch, resolved to
+        the commit it currently points to.
+
+        Builds and installs are only reused for the same commit, since the
+        branch may have moved on since.  Returns None if the commit can't be
+        found, e.g. git isn't installed.
+        """
+        repo_url = manifest.repository.url
+        if repo_url.startswith("git+"):
+            repo_url = repo_url[len("git+") :]
+        ref = manifest.repository.branch or "HEAD"
+        if COMMIT_SHA.match(ref):
+            return f"git+{repo_url}@{ref}"
+
+        try:
+            result = subprocess.run(
+                ["git", "ls-remote", repo_url, ref],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=GIT_LS_REMOTE_TIMEOUT,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(f"Failed to resolve {ref} of {repo_url}: {e}")
+            return None
+
+        commits = {}
+        for line in result.stdout.splitlines():
+            commit, _, ref_name = line.partition("\t")
+            commits[ref_name] = commit
+        # An annotated tag's ^{} entry is the commit, rather than the tag
+        for ref_name in [
+            ref,
+            f"refs/heads/{ref}",
+            f"refs/tags/{ref}^{{}}",
+            f"refs/tags/{ref}",
+        ]:
+            if COMMIT_SHA.match(commits.get(ref_name, "")):
+                return f"git+{repo_url}@{commits[ref_name]}"
+        logger.debug(f"Failed to resolve {ref} of {repo_url}")
+        return None
+
     @staticmethod
     def run_post_install(
         manifest: Manifest, site_packages: str, logger=guardrails_logger
@@ -282,6 +373,20 @@ class ValidatorPackageService:
             logger.info(download_output)
 
         # Install validator module's dependencies in normal site-packages directory
+        install_specs = ValidatorPackageService.get_install_specs(
+            install_directory, quiet=quiet, logger=logger
+        )
+        for install_spec in install_specs:
+            dep_install_output = pip_process("install", install_spec, quiet=quiet)
+            if not quiet:
+                logger.info(dep_install_output)
+
+    @staticmethod
+    def get_install_specs(
+        install_directory: str, quiet: bool = False, logger=guardrails_logger
+    ) -> List[str]:
+        """The pip install specs of the dependencies of the validator package
+        installed in install_directory, without its extras."""
         inspect_output = pip_process(
             "inspect",
             flags=[f"--path={install_directory}"],
@@ -302,20 +407,179 @@ class ValidatorPackageService:
             .get("requires_dist", [])  # type: ignore
         )
         requirements = list(filter(lambda dep: "extra" not in dep, dependencies))
+        install_specs = []
         for req in requirements:
             if "git+" in req:
-                install_spec = req.replace(" ", "")
-                dep_install_output = pip_process("install", install_spec, quiet=quiet)
-                if not quiet:
-                    logger.info(dep_install_output)
+                install_specs.append(req.replace(" ", ""))
             else:
                 req_info = Stack(*req.split(" "))
                 name = req_info.at(0, "").strip()  # type: ignore
                 versions = req_info.at(1, "").strip("()")  # type: ignore
                 if name:
-                    install_spec = name if not versions else f"{name}{versions}"
-                    dep_install_output = pip_process(
-                        "install", install_spec, quiet=quiet
-                    )
-                    if not quiet:
-                        logger.info(dep_install_output)
+                    install_specs.append(name if not versions else f"{name}{versions}")
+        return install_specs
+
+    @staticmethod
+    def install_requirements(
+        install_specs: List[str], quiet: bool = False, logger=guardrails_logger
+    ):
+        """Installs the dependencies of several validators with a single pip
+        invocation, so pip resolves them together."""
+        # Keep the first occurrence of each, in order
+        install_specs = list(dict.fromkeys(install_specs))
+        if not install_specs:
+            return
+        dep_install_output = pip_process("install", flags=install_specs, quiet=quiet)
+        if not quiet:
+            logger.info(dep_install_output)
+
+    @staticmethod
+    def get_cache_directory() -> str:
+        return os.environ.get(HUB_CACHE_DIR_ENV_VAR) or DEFAULT_HUB_CACHE_DIR
+
+    @staticmethod
+    def get_cached_manifest(
+        module_name: str, ttl: float = MANIFEST_CACHE_TTL
+    ) -> Manifest:
+        """Like get_validator_manifest, but reuses a manifest fetched within
+        the last `ttl` seconds."""
+        manifest_path = (
+            os.path.join(
+                ValidatorPackageService.get_cache_directory(),
+                "manifests",
+                *module_name.split("/"),
+            )
+            + ".json"
+        )
+        try:
+            if time.time() - os.path.getmtime(manifest_path) < ttl:
+                with open(manifest_path, "r") as manifest_file:
+                    return Manifest.from_json(manifest_file.read())
+        except (OSError, ValueError):
+            pass
+
+        manifest = get_validator_manifest(module_name)
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        # Write then rename, so concurrent installs never read half a manifest
+        temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as manifest_file:
+            manifest_file.write(manifest.to_json())
+        os.replace(temp_path, manifest_path)
+        return manifest
+
+    @staticmethod
+    def get_cached_wheel(
+        manifest: Manifest, install_url: str, quiet: bool = False, upgrade: bool = False
+    ) -> str:
+        """Builds the validator package's wheel the first time it's installed
+        and returns the path to it, keyed by its install URL.
+
+        The install URL should be pinned to a commit with
+        get_pinned_install_url, so a moving branch isn't served from the
+        cache.
+        """
+        url_hash = hashlib.sha256(install_url.encode("utf-8")).hexdigest()[:16]
+        wheel_directory = os.path.join(
+            ValidatorPackageService.get_cache_directory(), "wheels", url_hash
+        )
+        if upgrade:
+            shutil.rmtree(wheel_directory, ignore_errors=True)
+
+        wheels = glob.glob(os.path.join(wheel_directory, "*.whl"))
+        if not wheels:
+            pip_flags = [f"--wheel-dir={wheel_directory}", "--no-deps"]
+            if quiet:
+                pip_flags.append("-q")
+            pip_process("wheel", install_url, pip_flags, quiet=quiet)
+            wheels = glob.glob(os.path.join(wheel_directory, "*.whl"))
+        if not wheels:
+            raise FailedPackageInstallation(
+                f"Failed to build a wheel for {manifest.id} from {install_url}"
+            )
+        return max(wheels, key=os.path.getmtime)
+
+    @staticmethod
+    def install_hub_module_from_cache(
+        module_manifest: Manifest,
+        site_packages: str,
+        install_url: Optional[str],
+        quiet: bool = False,
+        upgrade: bool = False,
+        logger=guardrails_logger,
+    ) -> List[str]:
+        """Installs the validator package from its cached wheel, without its
+        dependencies.
+
+        Args:
+            install_url: The install URL pinned to a commit, from
+                get_pinned_install_url.  If None, the package is installed
+                straight from its repository without caching it.
+
+        Returns:
+            The pip install specs of its dependencies, to be installed
+            together with those of other validators via install_requirements.
+        """
+        if install_url is None:
+            package = ValidatorPackageService.get_install_url(module_manifest)
+        else:
+            package = ValidatorPackageService.get_cached_wheel(
+                module_manifest, install_url, quiet=quiet, upgrade=upgrade
+            )
+        install_directory = ValidatorPackageService.get_hub_directory(
+            module_manifest, site_packages
+        )
+
+        pip_flags = [f"--target={install_directory}", "--no-deps"]
+        # A different version may already be there
+        if upgrade or os.path.isdir(install_directory):
+            pip_flags.append("--upgrade")
+        if quiet:
+            pip_flags.append("-q")
+
+        download_output = pip_process("install", package, pip_flags, quiet=quiet)
+        if not quiet:
+            logger.info(download_output)
+
+        return ValidatorPackageService.get_install_specs(
+            install_directory, quiet=quiet, logger=logger
+        )
+
+    @staticmethod
+    def get_install_record_path(manifest: Manifest, site_packages: str) -> str:
+        return os.path.join(
+            ValidatorPackageService.get_hub_directory(manifest, site_packages),
+            INSTALL_RECORD_FILE_NAME,
+        )
+
+    @staticmethod
+    def is_installed(
+        manifest: Manifest, site_packages: str, install_url: Optional[str]
+    ) -> bool:
+        """Whether this version of the validator, i.e. its install URL pinned
+        to a commit, was already installed by install_multiple."""
+        if install_url is None:
+            return False
+        record_path = ValidatorPackageService.get_install_record_path(
+            manifest, site_packages
+        )
+        try:
+            with open(record_path, "r") as record_file:
+                record = json.load(record_file)
+        except (OSError, ValueError):
+            return False
+        return isinstance(record, dict) and record.get("install_url") == install_url
+
+    @staticmethod
+    def write_install_record(
+        manifest: Manifest, site_packages: str, install_url: Optional[str]
+    ):
+        record_path = ValidatorPackageService.get_install_record_path(
+            manifest, site_packages
+        )
+        if install_url is None:
+            # Not pinned to a commit, so it can't be known to be up to date
+            if os.path.exists(record_path):
+                os.remove(record_path)
+            return
+        with open(record_path, "w") as record_file:
+            json.dump({"id": manifest.id, "install_url": install_url}, record_file)
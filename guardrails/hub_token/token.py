@@ -1,7 +1,5 @@
 import os
 from guardrails.classes.credentials import Credentials
-import jwt
-from jwt import ExpiredSignatureError, DecodeError
 from typing import Optional
 
 FIND_NEW_TOKEN = "You can find a new token at https://hub.guardrailsai.com/keys"
@@ -37,6 +35,9 @@ VALIDATOR_HUB_SERVICE = os.getenv(
 
 
 def get_jwt_token(creds: Credentials) -> Optional[str]:
+    import jwt
+    from jwt import ExpiredSignatureError, DecodeError
+
     token = creds.token
 
     # check for jwt expiration
@@ -1,14 +1,85 @@
 """Class for representing a prompt entry."""
 
 import re
+from functools import lru_cache
 from string import Template
-from typing import List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
 import regex
 
 from guardrails.classes.templating.namespace_template import NamespaceTemplate
 from guardrails.utils.constants import constants
-from guardrails.utils.templating_utils import get_template_variables
+
+
+class Placeholder(NamedTuple):
+    """A `$name` or `${name}` variable in a prompt template, or an escaped
+    `$$` if it has no name."""
+
+    name: Optional[str]
+    text: str
+
+
+# A template split into its literal text and the placeholders between it
+Segments = Tuple[Union[str, Placeholder], ...]
+
+
+class CompiledTemplate(NamedTuple):
+    """A prompt template with its constants substituted."""
+
+    segments: Segments
+    format_instructions_start: Optional[int]
+
+
+def split_template(text: str) -> Segments:
+    """Splits a template the way `Template.safe_substitute` reads it."""
+    segments: List[Union[str, Placeholder]] = []
+    literal_start = 0
+    for match in Template.pattern.finditer(text):
+        name = match.group("named") or match.group("braced")
+        if name is None and match.group("escaped") is None:
+            # Invalid placeholders are left as they are
+            continue
+        segments.extend(
+            (text[literal_start : match.start()], Placeholder(name, match.group()))
+        )
+        literal_start = match.end()
+    segments.append(text[literal_start:])
+    return tuple(segment for segment in segments if segment)
+
+
+def substitute_segments(segments: Segments, mapping: Dict[str, Any]) -> Segments:
+    """Fills in the variables that are in the mapping, leaving the rest, and
+    unescapes `$$`."""
+    substituted: List[Union[str, Placeholder]] = []
+    for segment in segments:
+        if isinstance(segment, Placeholder):
+            if segment.name is None:
+                segment = Template.delimiter
+            elif segment.name in mapping:
+                segment = str(mapping[segment.name])
+            else:
+                substituted.append(segment)
+                continue
+        if substituted and isinstance(substituted[-1], str):
+            substituted[-1] += segment
+        else:
+            substituted.append(segment)
+    return tuple(substituted)
+
+
+# Runners build prompts from the same handful of template strings on every
+#   step, so the regex scans below only need to happen once per template.
+@lru_cache(maxsize=256)
+def compile_template(source: str) -> CompiledTemplate:
+    if "${gr." not in source:
+        # Nothing to substitute, e.g. an already formatted prompt
+        return CompiledTemplate(
+            segments=split_template(source), format_instructions_start=0
+        )
+    return CompiledTemplate(
+        segments=split_template(BasePrompt.substitute_constants(source)),
+        format_instructions_start=BasePrompt.get_format_instructions_idx(source),
+    )
 
 
 class BasePrompt:
@@ -23,20 +94,41 @@ class BasePrompt:
     ):
         """Initialize and substitute constants in the prompt."""
         self._source = source
-        self.format_instructions_start = self.get_format_instructions_idx(source)
 
         # FIXME: Why is this happening on init instead of on format?
         # Substitute constants in the prompt.
-        source = self.substitute_constants(source)
+        compiled_template = compile_template(source)
+        self.format_instructions_start = compiled_template.format_instructions_start
+        segments = compiled_template.segments
 
         # FIXME: Why is this happening on init instead of on format?
         # If an output schema is provided, substitute it in the prompt.
         if output_schema or xml_output_schema:
-            self.source = Template(source).safe_substitute(
-                output_schema=output_schema, xml_output_schema=xml_output_schema
+            segments = substitute_segments(
+                segments,
+                {
+                    "output_schema": output_schema,
+                    "xml_output_schema": xml_output_schema,
+                },
             )
-        else:
-            self.source = source
+        self._set_segments(segments)
+
+    @classmethod
+    def _from_segments(cls, segments: Segments):
+        """Creates a prompt from a template that was already compiled, e.g.
+        one that was just formatted."""
+        prompt = cls.__new__(cls)
+        prompt.format_instructions_start = 0
+        prompt._set_segments(segments)
+        prompt._source = prompt.source
+        return prompt
+
+    def _set_segments(self, segments: Segments) -> None:
+        self._segments = segments
+        self._source_text = "".join(
+            segment if isinstance(segment, str) else segment.text
+            for segment in segments
+        )
 
     def __repr__(self) -> str:
         # Truncate the prompt to 50 characters and add ellipsis if it's longer.
@@ -48,15 +140,25 @@ class BasePrompt:
     def __str__(self) -> str:
         return self.source
 
+    @property
+    def source(self) -> str:
+        return self._source_text
+
+    @source.setter
+    def source(self, source: str) -> None:
+        self._set_segments(split_template(source))
+
     @property
     def variable_names(self):
-        return get_template_variables(self.source)
+        names = (s.name for s in self._segments if isinstance(s, Placeholder))
+        return list(dict.fromkeys(name for name in names if name is not None))
 
     @property
     def format_instructions(self):
         return self.source[self.format_instructions_start :]
 
-    def substitute_constants(self, text: str) -> str:
+    @staticmethod
+    def substitute_constants(text: str) -> str:
         """Substitute constants in the prompt."""
         # Substitute constants by reading the constants file.
         # Regex to extract all occurrences of ${gr.<constant_name>}
@@ -82,7 +184,8 @@ class BasePrompt:
         for var in self.variable_names:
             self.source = self.source.replace(f"{{{var}}}", f"{{{var}:}}")
 
-    def get_format_instructions_idx(self, text: str) -> Optional[int]:
+    @staticmethod
+    def get_format_instructions_idx(text: str) -> Optional[int]:
         """Get the index of the first format instruction in the prompt.
 
         It checks to see where the first instance of any constant is in the text.
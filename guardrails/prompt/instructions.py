@@ -1,10 +1,6 @@
 """Instructions to the LLM, to be passed in the prompt."""
 
-from string import Template
-
-from guardrails.utils.templating_utils import get_template_variables
-
-from .base_prompt import BasePrompt
+from .base_prompt import BasePrompt, substitute_segments
 
 
 class Instructions(BasePrompt):
@@ -27,12 +23,7 @@ class Instructions(BasePrompt):
 
     def format(self, **kwargs) -> "Instructions":
         """Format the prompt using the given keyword arguments."""
-        # Only use the keyword arguments that are present in the prompt.
-        vars = get_template_variables(self.source)
-        filtered_kwargs = {k: v for k, v in kwargs.items() if k in vars}
-
         # Return another instance of the class with the formatted prompt.
-        formatted_instructions = Template(self.source).safe_substitute(
-            **filtered_kwargs
-        )
-        return Instructions(formatted_instructions)
+        # Variables that aren't in the prompt are ignored, and variables that
+        #   aren't given are left as they are.
+        return Instructions._from_segments(substitute_segments(self._segments, kwargs))
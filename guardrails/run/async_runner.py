@@ -1,19 +1,25 @@
-import copy
 from functools import partial
+from time import perf_counter_ns
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 
 from guardrails import validator_service
 from guardrails.classes.execution.guard_execution_options import GuardExecutionOptions
 from guardrails.classes.history import Call, Inputs, Iteration, Outputs
+from guardrails.classes.history.timings import Stage
 from guardrails.classes.output_type import OutputTypes
 from guardrails.constants import fail_status
 from guardrails.errors import ValidationError
 from guardrails.llm_providers import AsyncPromptCallableBase, PromptCallableBase
 from guardrails.logger import set_scope
 from guardrails.prompt import Instructions, Prompt
+from guardrails.run.execution_plan import ExecutionPlan
 from guardrails.run.runner import Runner
-from guardrails.run.utils import msg_history_source, msg_history_string
+from guardrails.run.utils import (
+    msg_history_source,
+    msg_history_string,
+    replace_msg_content,
+)
 from guardrails.schema.validator import schema_validation
 from guardrails.types.pydantic import ModelOrListOfModels
 from guardrails.types.validator import ValidatorMap
@@ -23,6 +29,7 @@ from guardrails.utils.prompt_utils import prompt_uses_xml
 from guardrails.run.utils import preprocess_prompt
 from guardrails.actions.reask import NonParseableReAsk, ReAsk
 from guardrails.telemetry import trace_async_call, trace_async_step
+from guardrails.telemetry.stage_timings import stage_timings
 
 
 class AsyncRunner(Runner):
@@ -43,6 +50,8 @@ class AsyncRunner(Runner):
         full_schema_reask: bool = False,
         disable_tracer: Optional[bool] = True,
         exec_options: Optional[GuardExecutionOptions] = None,
+        short_circuit_validation: bool = True,
+        execution_plan: Optional[ExecutionPlan] = None,
     ):
         super().__init__(
             output_type=output_type,
@@ -59,6 +68,8 @@ class AsyncRunner(Runner):
             full_schema_reask=full_schema_reask,
             disable_tracer=disable_tracer,
             exec_options=exec_options,
+            short_circuit_validation=short_circuit_validation,
+            execution_plan=execution_plan,
         )
         self.api: Optional[AsyncPromptCallableBase] = api
 
@@ -115,6 +126,7 @@ class AsyncRunner(Runner):
                     break
 
                 # Get new prompt and output schema.
+                start = perf_counter_ns()
                 (
                     prompt,
                     instructions,
@@ -128,6 +140,7 @@ class AsyncRunner(Runner):
                     prompt_params=prompt_params,
                     include_instructions=include_instructions,
                 )
+                iteration.add_timing(Stage.REASK_SETUP, start)
 
             # Log how many times we reasked
             # Use the HubTelemetry singleton
@@ -146,6 +159,8 @@ class AsyncRunner(Runner):
             # Because Pydantic v1 doesn't respect property setters
             call_log.exception = e
             raise e
+        finally:
+            stage_timings.observe_call(call_log)
 
         return call_log
 
@@ -184,6 +199,7 @@ class AsyncRunner(Runner):
         set_scope(str(id(iteration)))
         call_log.iterations.push(iteration)
 
+        start = perf_counter_ns()
         try:
             # Prepare: run pre-processing, and input validation.
             if output is not None:
@@ -204,17 +220,20 @@ class AsyncRunner(Runner):
             iteration.inputs.instructions = instructions
             iteration.inputs.prompt = prompt
             iteration.inputs.msg_history = msg_history
+            start = iteration.add_timing(Stage.PREPARE, start)
 
             # Call: run the API.
             llm_response = await self.async_call(
                 instructions, prompt, msg_history, api, output
             )
+            start = iteration.add_timing(Stage.LLM_CALL, start)
 
             iteration.outputs.llm_response_info = llm_response
             output = llm_response.output
 
             # Parse: parse the output.
             parsed_output, parsing_error = self.parse(output, output_schema)
+            start = iteration.add_timing(Stage.PARSE, start)
             if parsing_error:
                 # Parsing errors are captured and not raised
                 #   because they are recoverable
@@ -234,10 +253,12 @@ class AsyncRunner(Runner):
                 iteration.outputs.validation_response = validated_output
 
                 # Introspect: inspect validated output for reasks.
+                start = perf_counter_ns()
                 reasks, valid_output = self.introspect(validated_output)
                 iteration.outputs.guarded_output = valid_output
 
             iteration.outputs.reasks = reasks  # type: ignore  # pyright and pydantic don't agree
+            iteration.add_timing(Stage.INTROSPECT, start)
 
         except Exception as e:
             error_message = str(e)
@@ -299,7 +320,9 @@ class AsyncRunner(Runner):
         if parsed_output is None:
             return None
 
+        start = perf_counter_ns()
         skeleton_reask = schema_validation(parsed_output, output_schema, **kwargs)
+        start = iteration.add_timing(Stage.SCHEMA_VALIDATION, start)
         if skeleton_reask:
             return skeleton_reask
 
@@ -312,6 +335,7 @@ class AsyncRunner(Runner):
             validator_map=self.validation_map,
             iteration=iteration,
             disable_tracer=self._disable_tracer,
+            short_circuit=self.short_circuit_validation,
             path="$",
             stream=stream,
             **kwargs,
@@ -319,6 +343,7 @@ class AsyncRunner(Runner):
         validated_output = validator_service.post_process_validation(
             validated_output, attempt_number, iteration, self.output_type
         )
+        iteration.add_timing(Stage.VALIDATION, start)
 
         return validated_output
 
@@ -356,13 +381,11 @@ class AsyncRunner(Runner):
             prompt, instructions = None, None
 
             # Runner.prepare_msg_history
-            formatted_msg_history = []
-
             # Format any variables in the message history with the prompt params.
-            for msg in msg_history:
-                msg_copy = copy.deepcopy(msg)
-                msg_copy["content"] = msg_copy["content"].format(**prompt_params)
-                formatted_msg_history.append(msg_copy)
+            formatted_msg_history = [
+                replace_msg_content(msg, msg["content"].format(**prompt_params))
+                for msg in msg_history
+            ]
 
             if "msg_history" in self.validation_map:
                 # Runner.validate_msg_history
@@ -380,6 +403,7 @@ class AsyncRunner(Runner):
                     validator_map=self.validation_map,
                     iteration=iteration,
                     disable_tracer=self._disable_tracer,
+                    short_circuit=self.short_circuit_validation,
                     path="msg_history",
                 )
                 validated_msg_history = validator_service.post_process_validation(
@@ -438,6 +462,7 @@ class AsyncRunner(Runner):
                     validator_map=self.validation_map,
                     iteration=iteration,
                     disable_tracer=self._disable_tracer,
+                    short_circuit=self.short_circuit_validation,
                     path="prompt",
                 )
                 validated_prompt = validator_service.post_process_validation(
@@ -469,6 +494,7 @@ class AsyncRunner(Runner):
                     validator_map=self.validation_map,
                     iteration=iteration,
                     disable_tracer=self._disable_tracer,
+                    short_circuit=self.short_circuit_validation,
                     path="instructions",
                 )
                 validated_instructions = validator_service.post_process_validation(
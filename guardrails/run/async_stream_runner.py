@@ -1,3 +1,4 @@
+from time import perf_counter_ns
 from typing import (
     Any,
     AsyncIterable,
@@ -12,6 +13,7 @@ from typing import (
 from guardrails.actions.reask import SkeletonReAsk
 from guardrails.classes import ValidationOutcome
 from guardrails.classes.history import Call, Inputs, Iteration, Outputs
+from guardrails.classes.history.timings import Stage
 from guardrails.classes.output_type import OutputTypes
 from guardrails.constants import pass_status
 from guardrails.llm_providers import (
@@ -27,6 +29,7 @@ from guardrails.prompt import Instructions, Prompt
 from guardrails.run import StreamRunner
 from guardrails.run.async_runner import AsyncRunner
 from guardrails.telemetry import trace_async_stream_step
+from guardrails.telemetry.stage_timings import stage_timings
 
 
 class AsyncStreamRunner(AsyncRunner, StreamRunner):
@@ -96,6 +99,7 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
         )
         set_scope(str(id(iteration)))
         call_log.iterations.push(iteration)
+        start = perf_counter_ns()
         if output is not None:
             instructions = None
             prompt = None
@@ -114,10 +118,12 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
         iteration.inputs.prompt = prompt
         iteration.inputs.instructions = instructions
         iteration.inputs.msg_history = msg_history
+        start = iteration.add_timing(Stage.PREPARE, start)
 
         llm_response = await self.async_call(
             instructions, prompt, msg_history, api, output
         )
+        iteration.add_timing(Stage.LLM_CALL, start)
         iteration.outputs.llm_response_info = llm_response
         stream_output = llm_response.async_stream_output
         if not stream_output:
@@ -137,9 +143,11 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
                 _ = self.is_last_chunk(chunk, api)
                 fragment += chunk_text
 
+                start = perf_counter_ns()
                 parsed_chunk, move_to_next = self.parse(
                     chunk_text, output_schema, verified=verified
                 )
+                iteration.add_timing(Stage.PARSE, start)
                 if move_to_next:
                     continue
                 validated_fragment = await self.async_validate(
@@ -175,9 +183,11 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
                 chunk_text = self.get_chunk_text(chunk, api)
                 fragment += chunk_text
 
+                start = perf_counter_ns()
                 parsed_fragment, move_to_next = self.parse(
                     fragment, output_schema, verified=verified
                 )
+                iteration.add_timing(Stage.PARSE, start)
                 if move_to_next:
                     continue
                 validated_fragment = await self.async_validate(
@@ -216,6 +226,7 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
         iteration.outputs.parsed_output = parsed_fragment or fragment  # type: ignore
         iteration.outputs.validation_response = validation_response
         iteration.outputs.guarded_output = valid_op
+        stage_timings.observe_call(call_log)
 
     def get_chunk_text(self, chunk: Any, api: Union[PromptCallableBase, None]) -> str:
         """Get the text from a chunk."""
@@ -0,0 +1,77 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Tuple, Type, TypeVar
+
+from guardrails.classes.output_type import OutputTypes
+from guardrails.prompt.base_prompt import BasePrompt
+from guardrails.types import ValidatorMap
+from guardrails.utils.prompt_utils import prompt_content_for_schema
+
+P = TypeVar("P", bound=BasePrompt)
+
+
+class ExecutionPlan:
+    """The parts of a Runner's setup that only depend on the Guard, not on
+    the inputs to a particular call.
+
+    A Guard builds one of these on its first call and reuses it until
+    its schema, validators, or configuration change.
+
+    Args:
+        output_type: The output type of the Guard.
+        output_schema: The Guard's output schema as a JSON Schema dict.
+        validation_map: The Guard's validators keyed by the path they run on.
+    """
+
+    # Enough for a handful of prompts, instructions, and messages per Guard
+    #   without growing unbounded when every call uses a different prompt.
+    MAX_CACHED_PROMPTS = 128
+
+    def __init__(
+        self,
+        output_type: OutputTypes,
+        output_schema: Dict[str, Any],
+        validation_map: ValidatorMap,
+    ):
+        self.output_type = output_type
+        self.output_schema = output_schema
+        self.validation_map = validation_map
+
+        # Imported here so lxml is only loaded once a Guard is called
+        from guardrails.schema.rail_schema import json_schema_to_rail_output
+
+        self.stringified_output_schema = prompt_content_for_schema(
+            output_type, output_schema, validation_map
+        )
+        self.xml_output_schema = json_schema_to_rail_output(
+            json_schema=output_schema, validator_map=validation_map
+        )
+        self._prompts: OrderedDict[Tuple[Type[BasePrompt], str], BasePrompt] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get_prompt(self, prompt_class: Type[P], source: str) -> P:
+        """Get a Prompt, Instructions, etc. for the given source text with the
+        output schema substituted in.
+
+        Prompts are not modified after they're created, so the same
+        instance is shared between calls.
+        """
+        key = (prompt_class, source)
+        with self._lock:
+            prompt = self._prompts.get(key)
+            if prompt is not None:
+                self._prompts.move_to_end(key)
+                return prompt  # type: ignore
+
+        prompt = prompt_class(
+            source,
+            output_schema=self.stringified_output_schema,
+            xml_output_schema=self.xml_output_schema,
+        )
+        with self._lock:
+            self._prompts[key] = prompt
+            if len(self._prompts) > self.MAX_CACHED_PROMPTS:
+                self._prompts.popitem(last=False)
+        return prompt
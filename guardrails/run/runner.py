@@ -1,5 +1,6 @@
 import copy
 from functools import partial
+from time import perf_counter_ns
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 
@@ -7,6 +8,7 @@ from guardrails import validator_service
 from guardrails.actions.reask import get_reask_setup
 from guardrails.classes.execution.guard_execution_options import GuardExecutionOptions
 from guardrails.classes.history import Call, Inputs, Iteration, Outputs
+from guardrails.classes.history.timings import Stage
 from guardrails.classes.output_type import OutputTypes
 from guardrails.constants import fail_status
 from guardrails.errors import ValidationError
@@ -16,8 +18,12 @@ from guardrails.llm_providers import (
 )
 from guardrails.logger import set_scope
 from guardrails.prompt import Instructions, Prompt
-from guardrails.run.utils import msg_history_source, msg_history_string
-from guardrails.schema.rail_schema import json_schema_to_rail_output
+from guardrails.run.execution_plan import ExecutionPlan
+from guardrails.run.utils import (
+    msg_history_source,
+    msg_history_string,
+    replace_msg_content,
+)
 from guardrails.schema.validator import schema_validation
 from guardrails.types import ModelOrListOfModels, ValidatorMap, MessageHistory
 from guardrails.utils.exception_utils import UserFacingException
@@ -30,11 +36,11 @@ from guardrails.utils.parsing_utils import (
 )
 from guardrails.run.utils import preprocess_prompt
 from guardrails.utils.prompt_utils import (
-    prompt_content_for_schema,
     prompt_uses_xml,
 )
 from guardrails.actions.reask import NonParseableReAsk, ReAsk, introspect
 from guardrails.telemetry import trace_call, trace_step
+from guardrails.telemetry.stage_timings import stage_timings
 
 
 class Runner:
@@ -76,6 +82,9 @@ class Runner:
     # Internal Metrics Collection
     disable_tracer: Optional[bool] = True
 
+    # Cancel sibling validators once a terminal on fail action fires
+    short_circuit_validation: bool = True
+
     # QUESTION: Are any of these init args actually necessary for initialization?
     # ANSWER: _Maybe_ prompt, instructions, and msg_history for Prompt initialization
     #   but even that can happen at execution time.
@@ -97,50 +106,45 @@ class Runner:
         full_schema_reask: bool = False,
         disable_tracer: Optional[bool] = True,
         exec_options: Optional[GuardExecutionOptions] = None,
+        short_circuit_validation: bool = True,
+        execution_plan: Optional[ExecutionPlan] = None,
     ):
         # Validation Inputs
         self.output_type = output_type
         self.output_schema = output_schema
         self.validation_map = validation_map
         self.metadata = metadata or {}
-        self.exec_options = copy.deepcopy(exec_options) or GuardExecutionOptions()
+        self.short_circuit_validation = short_circuit_validation
+        # Only top level fields are reassigned below, so a shallow copy is enough
+        #   to keep the Guard's options untouched.
+        self.exec_options = (
+            copy.copy(exec_options) if exec_options else GuardExecutionOptions()
+        )
 
         # LLM Inputs
 
-        stringified_output_schema = prompt_content_for_schema(
-            output_type, output_schema, validation_map
-        )
-        xml_output_schema = json_schema_to_rail_output(
-            json_schema=output_schema, validator_map=validation_map
-        )
+        # The schema strings substituted into prompts are the same on every call
+        #   so the Guard passes in a plan it prepared earlier when it can.
+        if execution_plan is None:
+            execution_plan = ExecutionPlan(output_type, output_schema, validation_map)
+        self.execution_plan = execution_plan
+
         if prompt:
             self.exec_options.prompt = prompt
-            self.prompt = Prompt(
-                prompt,
-                output_schema=stringified_output_schema,
-                xml_output_schema=xml_output_schema,
-            )
+            self.prompt = execution_plan.get_prompt(Prompt, prompt)
 
         if instructions:
             self.exec_options.instructions = instructions
-            self.instructions = Instructions(
-                instructions,
-                output_schema=stringified_output_schema,
-                xml_output_schema=xml_output_schema,
-            )
+            self.instructions = execution_plan.get_prompt(Instructions, instructions)
 
         if msg_history:
             self.exec_options.msg_history = msg_history
-            msg_history_copy = []
-            for msg in msg_history:
-                msg_copy = copy.deepcopy(msg)
-                msg_copy["content"] = Prompt(
-                    msg_copy["content"],
-                    output_schema=stringified_output_schema,
-                    xml_output_schema=xml_output_schema,
+            self.msg_history = [
+                replace_msg_content(
+                    msg, execution_plan.get_prompt(Prompt, msg["content"])
                 )
-                msg_history_copy.append(msg_copy)
-            self.msg_history = msg_history_copy
+                for msg in msg_history
+            ]
 
         self.base_model = base_model
 
@@ -211,6 +215,7 @@ class Runner:
                     break
 
                 # Get new prompt and output schema.
+                start = perf_counter_ns()
                 (prompt, instructions, output_schema, msg_history) = (
                     self.prepare_to_loop(
                         iteration.reasks,
@@ -221,6 +226,7 @@ class Runner:
                         include_instructions=include_instructions,
                     )
                 )
+                iteration.add_timing(Stage.REASK_SETUP, start)
 
             # Log how many times we reasked
             # Use the HubTelemetry singleton
@@ -240,6 +246,8 @@ class Runner:
             # Because Pydantic v1 doesn't respect property setters
             call_log.exception = e
             raise e
+        finally:
+            stage_timings.observe_call(call_log)
         return call_log
 
     @trace_step
@@ -276,6 +284,7 @@ class Runner:
         set_scope(str(id(iteration)))
         call_log.iterations.push(iteration)
 
+        start = perf_counter_ns()
         try:
             # Prepare: run pre-processing, and input validation.
             if output is not None:
@@ -296,15 +305,18 @@ class Runner:
             iteration.inputs.instructions = instructions
             iteration.inputs.prompt = prompt
             iteration.inputs.msg_history = msg_history
+            start = iteration.add_timing(Stage.PREPARE, start)
 
             # Call: run the API.
             llm_response = self.call(instructions, prompt, msg_history, api, output)
+            start = iteration.add_timing(Stage.LLM_CALL, start)
 
             iteration.outputs.llm_response_info = llm_response
             raw_output = llm_response.output
 
             # Parse: parse the output.
             parsed_output, parsing_error = self.parse(raw_output, output_schema)
+            start = iteration.add_timing(Stage.PARSE, start)
             if parsing_error or isinstance(parsed_output, ReAsk):
                 iteration.outputs.exception = parsing_error  # type: ignore
                 iteration.outputs.error = str(parsing_error)
@@ -323,10 +335,12 @@ class Runner:
                 iteration.outputs.validation_response = validated_output
 
                 # Introspect: inspect validated output for reasks.
+                start = perf_counter_ns()
                 reasks, valid_output = self.introspect(validated_output)
                 iteration.outputs.guarded_output = valid_output
 
             iteration.outputs.reasks = list(reasks)
+            iteration.add_timing(Stage.INTROSPECT, start)
 
         except Exception as e:
             error_message = str(e)
@@ -350,6 +364,7 @@ class Runner:
             validator_map=self.validation_map,
             iteration=iteration,
             disable_tracer=self._disable_tracer,
+            short_circuit=self.short_circuit_validation,
             path="msg_history",
         )
         validated_msg_history = validator_service.post_process_validation(
@@ -371,12 +386,11 @@ class Runner:
         prompt_params: Dict,
         attempt_number: int,
     ) -> MessageHistory:
-        formatted_msg_history: MessageHistory = []
         # Format any variables in the message history with the prompt params.
-        for msg in msg_history:
-            msg_copy = copy.deepcopy(msg)
-            msg_copy["content"] = msg_copy["content"].format(**prompt_params)
-            formatted_msg_history.append(msg_copy)
+        formatted_msg_history: MessageHistory = [
+            replace_msg_content(msg, msg["content"].format(**prompt_params))
+            for msg in msg_history
+        ]
 
         # validate msg_history
         if "msg_history" in self.validation_map:
@@ -396,6 +410,7 @@ class Runner:
             validator_map=self.validation_map,
             iteration=iteration,
             disable_tracer=self._disable_tracer,
+            short_circuit=self.short_circuit_validation,
             path="prompt",
         )
 
@@ -425,6 +440,7 @@ class Runner:
             validator_map=self.validation_map,
             iteration=iteration,
             disable_tracer=self._disable_tracer,
+            short_circuit=self.short_circuit_validation,
             path="instructions",
         )
         validated_instructions = validator_service.post_process_validation(
@@ -586,7 +602,9 @@ class Runner:
         if parsed_output is None:
             return None
 
+        start = perf_counter_ns()
         skeleton_reask = schema_validation(parsed_output, output_schema, **kwargs)
+        start = iteration.add_timing(Stage.SCHEMA_VALIDATION, start)
         if skeleton_reask:
             return skeleton_reask
 
@@ -599,6 +617,7 @@ class Runner:
             validator_map=self.validation_map,
             iteration=iteration,
             disable_tracer=self._disable_tracer,
+            short_circuit=self.short_circuit_validation,
             path="$",
             stream=stream,
             **kwargs,
@@ -607,6 +626,7 @@ class Runner:
         validated_output = validator_service.post_process_validation(
             validated_output, attempt_number, iteration, self.output_type
         )
+        iteration.add_timing(Stage.VALIDATION, start)
 
         return validated_output
 
@@ -1,7 +1,9 @@
+from time import perf_counter_ns
 from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Union, cast
 
 from guardrails import validator_service
 from guardrails.classes.history import Call, Inputs, Iteration, Outputs
+from guardrails.classes.history.timings import Stage
 from guardrails.classes.output_type import OT, OutputTypes
 from guardrails.classes.validation_outcome import ValidationOutcome
 from guardrails.llm_providers import (
@@ -20,6 +22,7 @@ from guardrails.utils.parsing_utils import (
 from guardrails.actions.reask import ReAsk, SkeletonReAsk
 from guardrails.constants import pass_status
 from guardrails.telemetry import trace_stream_step
+from guardrails.telemetry.stage_timings import stage_timings
 
 
 class StreamRunner(Runner):
@@ -105,6 +108,7 @@ class StreamRunner(Runner):
             call_id=call_log.id, index=index, inputs=inputs, outputs=outputs
         )
         call_log.iterations.push(iteration)
+        start = perf_counter_ns()
 
         # Prepare: run pre-processing, and input validation.
         if output is not None:
@@ -125,9 +129,11 @@ class StreamRunner(Runner):
         iteration.inputs.prompt = prompt
         iteration.inputs.instructions = instructions
         iteration.inputs.msg_history = msg_history
+        start = iteration.add_timing(Stage.PREPARE, start)
 
         # Call: run the API that returns a generator wrapped in LLMResponse
         llm_response = self.call(instructions, prompt, msg_history, api, output)
+        iteration.add_timing(Stage.LLM_CALL, start)
 
         iteration.outputs.llm_response_info = llm_response
 
@@ -155,9 +161,11 @@ class StreamRunner(Runner):
                     fragment += chunk_text
                     finished = self.is_last_chunk(chunk, api)
                     # 2. Parse the chunk
+                    start = perf_counter_ns()
                     parsed_chunk, move_to_next = self.parse(
                         chunk_text, output_schema, verified=verified
                     )
+                    iteration.add_timing(Stage.PARSE, start)
                     nonlocal parsed_fragment
                     # ignore types because output schema guarantees a string
                     parsed_fragment += parsed_chunk  # type: ignore
@@ -212,9 +220,11 @@ class StreamRunner(Runner):
                 fragment += chunk_text
 
                 # 2. Parse the fragment
+                start = perf_counter_ns()
                 parsed_fragment, move_to_next = self.parse(
                     fragment, output_schema, verified=verified
                 )
+                iteration.add_timing(Stage.PARSE, start)
                 if move_to_next:
                     # Continue to next chunk
                     continue
@@ -258,6 +268,7 @@ class StreamRunner(Runner):
         iteration.outputs.parsed_output = parsed_fragment or fragment  # type: ignore
         iteration.outputs.validation_response = validation_response
         iteration.outputs.guarded_output = valid_op
+        stage_timings.observe_call(call_log)
 
     def is_last_chunk(self, chunk: Any, api: Union[PromptCallableBase, None]) -> bool:
         """Detect if chunk is final chunk."""
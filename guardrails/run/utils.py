@@ -1,6 +1,5 @@
-import copy
 from string import Template
-from typing import Dict, cast, Optional, Tuple
+from typing import Any, Dict, cast, Optional, Tuple
 
 from guardrails.classes.output_type import OutputTypes
 from guardrails.llm_providers import (
@@ -15,30 +14,29 @@ from guardrails.types.inputs import MessageHistory
 from guardrails.prompt.instructions import Instructions
 
 
+def replace_msg_content(msg: Dict[str, Any], content: Any) -> Dict[str, Any]:
+    """Copy a message with new content.
+
+    Only the top level dict is copied; everything besides the content is
+    shared with the original message, which is left untouched.
+    """
+    return {**msg, "content": content}
+
+
+def _msg_content_source(msg: Dict[str, Any]) -> str:
+    content = msg["content"]
+    return content.source if isinstance(content, Prompt) else content
+
+
 def msg_history_source(msg_history: MessageHistory) -> MessageHistory:
-    msg_history_copy = []
-    for msg in msg_history:
-        msg_copy = copy.deepcopy(msg)
-        content = (
-            msg["content"].source
-            if isinstance(msg["content"], Prompt)
-            else msg["content"]
-        )
-        msg_copy["content"] = content
-        msg_history_copy.append(cast(Dict[str, str], msg_copy))
-    return msg_history_copy
+    return [
+        cast(Dict[str, str], replace_msg_content(msg, _msg_content_source(msg)))
+        for msg in msg_history
+    ]
 
 
 def msg_history_string(msg_history: MessageHistory) -> str:
-    msg_history_copy = ""
-    for msg in msg_history:
-        content = (
-            msg["content"].source
-            if isinstance(msg["content"], Prompt)
-            else msg["content"]
-        )
-        msg_history_copy += content
-    return msg_history_copy
+    return "".join(_msg_content_source(msg) for msg in msg_history)
 
 
 def preprocess_prompt_for_string_output(
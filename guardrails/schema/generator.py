@@ -1,15 +1,23 @@
-import jsonref
 import re
 import rstr
 from builtins import max as get_max
-from typing import Any, Dict, List, Optional, Union, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
 from pydash import upper_first, snake_case, camel_case, start_case, uniq_with, is_equal
-from faker import Faker
 from random import randint, randrange, uniform
 from guardrails_api_client import SimpleTypes
 from guardrails.utils.safe_get import safe_get
 
-fake = Faker()
+if TYPE_CHECKING:
+    from faker import Faker
+
+
+@lru_cache(maxsize=None)
+def get_fake() -> "Faker":
+    """A shared Faker, created on first use as creating one is slow."""
+    from faker import Faker
+
+    return Faker()
 
 
 def get_decimal_places(num: Union[int, float]) -> int:
@@ -30,22 +38,22 @@ def is_number(value: Any) -> bool:
 
 
 def gen_sentence_case():
-    words = " ".join(fake.words(2))
+    words = " ".join(get_fake().words(2))
     return upper_first(words)
 
 
 def gen_snake_case():
-    words = " ".join(fake.words(2))
+    words = " ".join(get_fake().words(2))
     return snake_case(words)
 
 
 def gen_camel_case():
-    words = " ".join(fake.words(2))
+    words = " ".join(get_fake().words(2))
     return camel_case(words)
 
 
 def gen_title_case():
-    words = " ".join(fake.words(2))
+    words = " ".join(get_fake().words(2))
     return start_case(words)
 
 
@@ -94,6 +102,7 @@ def gen_num(schema: Dict[str, Any]) -> Union[int, float]:
 
 
 def gen_formatted_string(format: str, default: str) -> str:
+    fake = get_fake()
     value = default
     if format == "date":
         value = fake.date("YYYY-MM-DD")
@@ -124,6 +133,7 @@ def gen_formatted_string(format: str, default: str) -> str:
 
 def gen_string(schema: Dict[str, Any], *, property_name: Optional[str] = None) -> str:
     # Look at format first, then pattern; not xor
+    fake = get_fake()
     gen_func = fake.word
     # Lazy attempt to choose a relevant faker function
     if (
@@ -215,7 +225,7 @@ def gen_from_type(
     if schema_type == SimpleTypes.ARRAY:
         return gen_array(schema, property_name=property_name)
     elif schema_type == SimpleTypes.BOOLEAN:
-        return fake.boolean()
+        return get_fake().boolean()
     elif schema_type == SimpleTypes.INTEGER:
         return gen_num(schema)
     elif schema_type == SimpleTypes.NULL:
@@ -346,5 +356,7 @@ def generate_example(
     json_schema: Dict[str, Any], *, property_name: Optional[str] = None
 ) -> Any:
     """Takes a json schema and generates a sample object."""
+    import jsonref
+
     dereferenced_schema = cast(Dict[str, Any], jsonref.replace_refs(json_schema))
     return _generate_example(dereferenced_schema, property_name=property_name)
@@ -1,5 +1,4 @@
 from guardrails_api_client.models.simple_types import SimpleTypes
-import jsonref
 from typing import Any, Dict, List, Optional, Set, Union, cast
 
 from guardrails.utils.safe_get import safe_get
@@ -143,5 +142,7 @@ def get_all_paths(
 ) -> Set[str]:
     """Takes a JSON Schema and returns all possible JSONPaths within that
     schema."""
+    import jsonref
+
     dereferenced_schema = cast(Dict[str, Any], jsonref.replace_refs(json_schema))
     return _get_all_paths(dereferenced_schema, paths=paths, json_path=json_path)
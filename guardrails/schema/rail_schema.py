@@ -1,4 +1,3 @@
-import jsonref
 import warnings
 from dataclasses import dataclass
 from string import Template
@@ -966,6 +965,8 @@ def json_schema_to_rail_output(
     Limited support. Only guaranteed to work for JSON Schemas that were
     derived from RAIL.
     """
+    import jsonref
+
     dereferenced_json_schema = cast(Dict[str, Any], jsonref.replace_refs(json_schema))
     output_element = build_element(
         dereferenced_json_schema,
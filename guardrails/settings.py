@@ -13,6 +13,12 @@ class Settings:
     environment variables or by instantiating a TracerProvider.
     """
     disable_tracing: Optional[bool]
+    """Whether to fetch the history of calls validated on the server.
+
+    It is only fetched once a guard's history is used; set this to False
+    to never fetch it.
+    """
+    fetch_server_history: Optional[bool]
 
     def __new__(cls) -> "Settings":
         if cls._instance is None:
@@ -25,6 +31,7 @@ class Settings:
     def _initialize(self):
         self.use_server = None
         self.disable_tracing = None
+        self.fetch_server_history = None
 
 
 settings = Settings()
@@ -0,0 +1,156 @@
+"""embedding_cache.py.
+
+A cache of embeddings keyed by the model, the tokenizer encoding, and a
+hash of the embedded text.
+
+Embeddings are kept in a bounded in-memory LRU.  When a path is given,
+they are also written to disk as float32 vectors in a single append-only
+binary file with a small text index next to it.  The binary file is read
+through a memory map, so restarts and other workers on the same host can
+reuse embeddings without calling the embedding API again.
+"""
+
+import hashlib
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+DEFAULT_MAX_SIZE = 4096
+VECTORS_FILE_NAME = "embeddings.f32"
+INDEX_FILE_NAME = "embeddings.idx"
+
+
+class EmbeddingCache:
+    """Caches embeddings in memory and, optionally, on disk.
+
+    Args:
+        path (str, optional): A directory to persist embeddings to.
+            Defaults to None, i.e. embeddings are only cached in memory.
+        max_size (int): The maximum number of embeddings kept in memory.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_size: int = DEFAULT_MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+        self._entries: OrderedDict[str, "np.ndarray"] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # key -> (byte offset, dimensions) in the vectors file
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._index_position = 0
+        self._mmap: Optional[mmap.mmap] = None
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+            self._vectors_path = os.path.join(path, VECTORS_FILE_NAME)
+            self._index_path = os.path.join(path, INDEX_FILE_NAME)
+            for file_path in (self._vectors_path, self._index_path):
+                open(file_path, "ab").close()
+            self._refresh_index()
+
+    @staticmethod
+    def get_key(model: Optional[str], encoding_name: Optional[str], text: str) -> str:
+        """A hex digest of the model, the encoding used to chunk the text,
+        and the text itself."""
+        key = hashlib.sha256(f"{model}\0{encoding_name}\0".encode("utf-8"))
+        key.update(text.encode("utf-8"))
+        return key.hexdigest()
+
+    def get(self, key: str) -> Optional["np.ndarray"]:
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                return embedding
+            if self.path is None:
+                return None
+            embedding = self._read_from_disk(key)
+            if embedding is not None:
+                self._remember(key, embedding)
+            return embedding
+
+    def set(self, key: str, embedding: "np.ndarray") -> None:
+        import numpy as np
+
+        embedding = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            self._remember(key, embedding)
+            if self.path is not None and key not in self._index:
+                self._write_to_disk(key, embedding)
+
+    def clear(self) -> None:
+        """Clear the in-memory tier.
+
+        Embeddings already written to disk are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: str, embedding: "np.ndarray") -> None:
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _refresh_index(self) -> None:
+        """Read any index entries written since we last looked, including
+        those written by other processes."""
+        with open(self._index_path, "rb") as index_file:
+            index_file.seek(self._index_position)
+            for line in index_file:
+                if not line.endswith(b"\n"):
+                    # Partially written by another process; read it next time
+                    break
+                self._index_position += len(line)
+                key, offset, dims = line.decode("utf-8").split()
+                self._index[key] = (int(offset), int(dims))
+
+    def _read_from_disk(self, key: str) -> Optional["np.ndarray"]:
+        import numpy as np
+
+        location = self._index.get(key)
+        if location is None:
+            self._refresh_index()
+            location = self._index.get(key)
+            if location is None:
+                return None
+
+        offset, dims = location
+        end = offset + dims * 4
+        if self._mmap is None or len(self._mmap) < end:
+            if self._mmap is not None:
+                self._mmap.close()
+            with open(self._vectors_path, "rb") as vectors_file:
+                self._mmap = mmap.mmap(
+                    vectors_file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+        # Copy out of the map so it can be remapped when the file grows
+        vector = np.frombuffer(self._mmap, dtype="<f4", count=dims, offset=offset)
+        return vector.astype(np.float32)
+
+    def _write_to_disk(self, key: str, embedding: "np.ndarray") -> None:
+        data = embedding.astype("<f4", copy=False).tobytes()
+        with open(self._index_path, "ab") as index_file:
+            if fcntl is not None:
+                # Serialize writers across processes; the index lock guards both
+                fcntl.flock(index_file.fileno(), fcntl.LOCK_EX)
+            try:
+                with open(self._vectors_path, "ab") as vectors_file:
+                    offset = vectors_file.seek(0, os.SEEK_END)
+                    vectors_file.write(data)
+                # Only index vectors once they're fully written
+                index_file.write(f"{key} {offset} {len(embedding)}\n".encode("utf-8"))
+                index_file.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(index_file.fileno(), fcntl.LOCK_UN)
+        self._index[key] = (offset, len(embedding))
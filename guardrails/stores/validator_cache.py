@@ -0,0 +1,315 @@
+"""validator_cache.py.
+
+A process-wide cache of ValidationResults for validators that opt in by
+setting `cacheable = True`.  A cacheable validator promises that its
+result only depends on its class, its init kwargs, the value being
+validated, and the metadata keys it declares in `required_metadata_keys`.
+
+Results are kept in a bounded in-memory LRU by default.  A SQLite
+backend can be configured instead so that multiple workers on the same
+host share one cache.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from opentelemetry import trace
+
+from guardrails.classes.validation.validation_result import (
+    FailResult,
+    PassResult,
+    ValidationResult,
+)
+from guardrails.logger import logger
+
+DEFAULT_MAX_SIZE = 1024
+
+
+def result_to_dict(result: ValidationResult) -> Dict[str, Any]:
+    result_dict = result.to_dict()
+    if isinstance(result, PassResult):
+        # A value_override of None is an override too, so record whether
+        #   there is one rather than going by the value
+        result_dict["hasValueOverride"] = (
+            result.value_override is not PassResult.ValueOverrideSentinel
+        )
+    return result_dict
+
+
+def result_from_dict(result_dict: Dict[str, Any]) -> ValidationResult:
+    if result_dict.get("outcome") == "fail":
+        return FailResult.from_dict(result_dict)
+    value_override = result_dict.get("valueOverride")
+    has_value_override = result_dict.get("hasValueOverride", value_override is not None)
+    return PassResult(
+        metadata=result_dict.get("metadata"),
+        validated_chunk=result_dict.get("validatedChunk"),
+        value_override=(
+            value_override if has_value_override else PassResult.ValueOverrideSentinel
+        ),
+    )
+
+
+class ValidatorCacheBackend:
+    """Base class for validator cache storage."""
+
+    def get(self, key: str) -> Optional[ValidationResult]:
+        raise NotImplementedError
+
+    def set(self, key: str, result: ValidationResult) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class InMemoryValidatorCacheBackend(ValidatorCacheBackend):
+    """A thread-safe LRU with an optional time-to-live."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, Tuple[Optional[float], ValidationResult]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ValidationResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at is not None and expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Hand out copies; results are mutated further down the line
+        return result.model_copy(deep=True)
+
+    def set(self, key: str, result: ValidationResult) -> None:
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, result.model_copy(deep=True))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteValidatorCacheBackend(ValidatorCacheBackend):
+    """Stores cached results in a SQLite database on local disk so they can
+    be shared between processes.
+
+    Like the SQLiteTraceHandler, this uses WAL journaling so readers
+    are not blocked by writers.
+    """
+
+    CREATE_COMMAND = """
+        CREATE TABLE IF NOT EXISTS validator_cache (
+            key TEXT PRIMARY KEY,
+            result TEXT NOT NULL,
+            expires_at REAL,
+            last_used REAL NOT NULL
+        );
+    """
+    # Only prune every so often; it's a full table scan.
+    PRUNE_INTERVAL = 100
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: Optional[float] = None,
+    ):
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self._writes_since_prune = 0
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode = wal")
+        self.db.execute("PRAGMA synchronous = OFF")
+        with self.db:
+            self.db.execute(SQLiteValidatorCacheBackend.CREATE_COMMAND)
+
+    def get(self, key: str) -> Optional[ValidationResult]:
+        now = time.time()
+        with self._lock:
+            row = self.db.execute(
+                "SELECT result, expires_at FROM validator_cache WHERE key = ?;",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            serialized_result, expires_at = row
+            if expires_at is not None and expires_at < now:
+                self.db.execute("DELETE FROM validator_cache WHERE key = ?;", (key,))
+                return None
+            self.db.execute(
+                "UPDATE validator_cache SET last_used = ? WHERE key = ?;", (now, key)
+            )
+        return result_from_dict(json.loads(serialized_result))
+
+    def set(self, key: str, result: ValidationResult) -> None:
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        serialized_result = json.dumps(result_to_dict(result))
+        with self._lock:
+            self.db.execute(
+                """
+                INSERT OR REPLACE INTO validator_cache (
+                    key, result, expires_at, last_used
+                ) VALUES (?, ?, ?, ?);
+                """,
+                (key, serialized_result, expires_at, now),
+            )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= self.PRUNE_INTERVAL:
+                self._prune()
+
+    def _prune(self) -> None:
+        self._writes_since_prune = 0
+        self.db.execute(
+            "DELETE FROM validator_cache WHERE expires_at IS NOT NULL "
+            "AND expires_at < ?;",
+            (time.time(),),
+        )
+        self.db.execute(
+            """
+            DELETE FROM validator_cache WHERE key NOT IN (
+                SELECT key FROM validator_cache ORDER BY last_used DESC LIMIT ?
+            );
+            """,
+            (self.max_size,),
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self.db.execute("DELETE FROM validator_cache;")
+
+
+class ValidatorCache:
+    """Process-wide cache of validation results for cacheable validators.
+
+    Use `validator_cache.configure(...)` to change the size, time-to-
+    live, or storage backend.
+    """
+
+    def __init__(self, backend: Optional[ValidatorCacheBackend] = None):
+        self.backend = backend or InMemoryValidatorCacheBackend()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        *,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        backend: Optional[ValidatorCacheBackend] = None,
+    ) -> None:
+        """Configure the cache.
+
+        Args:
+            max_size (int, optional): The maximum number of results to keep.
+                Defaults to 1024.
+            ttl (float, optional): How many seconds a result stays valid.
+                Defaults to None, i.e. results never expire.
+            backend (ValidatorCacheBackend, optional): Where to store results,
+                e.g. a SQLiteValidatorCacheBackend to share results between
+                workers. Overrides max_size and ttl.
+        """
+        if backend is None:
+            backend = InMemoryValidatorCacheBackend(
+                max_size=max_size if max_size is not None else DEFAULT_MAX_SIZE,
+                ttl=ttl,
+            )
+        with self._lock:
+            self.backend = backend
+            self.hits = 0
+            self.misses = 0
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    @staticmethod
+    def get_cache_key(
+        validator: Any, value: Any, metadata: Optional[Dict]
+    ) -> Optional[str]:
+        """A stable hash of everything a cacheable validator's result depends
+        on.
+
+        Returns None if any of the inputs can't be serialized, in which
+        case the result isn't cached.
+        """
+        metadata = metadata or {}
+        validator_class = validator.__class__
+        try:
+            serialized_inputs = json.dumps(
+                {
+                    "validator": f"{validator_class.__module__}."
+                    f"{validator_class.__qualname__}",
+                    "rail_alias": validator.rail_alias,
+                    "kwargs": validator.get_args(),
+                    "value": value,
+                    "metadata": {
+                        key: metadata.get(key)
+                        for key in validator.required_metadata_keys
+                    },
+                },
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(serialized_inputs.encode("utf-8")).hexdigest()
+
+    def cached(
+        self, validator: Any, validate_func: Callable[..., ValidationResult]
+    ) -> Callable[..., ValidationResult]:
+        """Wrap a validator's validate method to consult the cache first."""
+
+        def cached_validate(value: Any, metadata: Optional[Dict]) -> ValidationResult:
+            key = self.get_cache_key(validator, value, metadata)
+            if key is None:
+                return validate_func(value, metadata)
+
+            result = self.backend.get(key)
+            cache_hit = result is not None
+            with self._lock:
+                if cache_hit:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+                hits, misses = self.hits, self.misses
+            if not cache_hit:
+                result = validate_func(value, metadata)
+                if isinstance(result, ValidationResult):
+                    try:
+                        self.backend.set(key, result)
+                    except Exception as e:
+                        logger.debug(f"Unable to cache validation result: {e}")
+
+            # This runs inside the validator's span
+            validator_span = trace.get_current_span()
+            if validator_span.is_recording():
+                validator_span.set_attribute("validator.cache.hit", cache_hit)
+                validator_span.set_attribute("validator.cache.hits", hits)
+                validator_span.set_attribute("validator.cache.misses", misses)
+            return result  # type: ignore
+
+        return cached_validate
+
+
+validator_cache = ValidatorCache()
@@ -1,12 +1,6 @@
 from opentelemetry import trace
 from opentelemetry.trace import Tracer
 
-# TODO: Make the option between GRPC and HTTP configurable
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-
 import threading
 
 from guardrails.version import GUARDRAILS_VERSION
@@ -27,6 +21,14 @@ class DefaultOtelCollectorTracer:
         return cls._instance
 
     def _initialize(self, resource_name: str):
+        # TODO: Make the option between GRPC and HTTP configurable
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+            OTLPSpanExporter,
+        )
+        from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
         resource = Resource(attributes={SERVICE_NAME: resource_name})
 
         traceProvider = TracerProvider(resource=resource)
@@ -4,16 +4,6 @@ import sys
 from opentelemetry import trace
 from opentelemetry.trace import Tracer
 
-# TODO: Make the option between GRPC and HTTP configurable
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import (
-    BatchSpanProcessor,
-    ConsoleSpanExporter,
-    SimpleSpanProcessor,
-)
-
 import threading
 
 from guardrails.version import GUARDRAILS_VERSION
@@ -34,6 +24,18 @@ class DefaultOtlpTracer:
         return cls._instance
 
     def _initialize(self, resource_name: str):
+        # TODO: Make the option between GRPC and HTTP configurable
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+        from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            BatchSpanProcessor,
+            ConsoleSpanExporter,
+            SimpleSpanProcessor,
+        )
+
         envvars_exist = os.environ.get("OTEL_EXPORTER_OTLP_PROTOCOL") and (
             os.environ.get("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT")
             or os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT")
@@ -14,7 +14,8 @@ def trace_operation(
     conventions."""
     current_span = get_span()
 
-    if current_span is None:
+    # Nothing reads the attributes of a span that isn't recording
+    if current_span is None or not current_span.is_recording():
         return
 
     ser_input_mime_type = serialize(input_mime_type)
@@ -73,7 +74,8 @@ def trace_llm_call(
     """Traces an LLM call using OpenInference semantic conventions."""
     current_span = get_span()
 
-    if current_span is None:
+    # Nothing reads the attributes of a span that isn't recording
+    if current_span is None or not current_span.is_recording():
         return
 
     ser_function_call = serialize(function_call)
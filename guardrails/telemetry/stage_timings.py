@@ -0,0 +1,109 @@
+"""stage_timings.py.
+
+Histograms of how long each stage of a guard run takes, built from the
+`perf_counter_ns` timings the runners record on every Iteration, so guard
+latency can be broken down without an OpenTelemetry exporter.
+
+Every finished Call is added to the process-wide `stage_timings`, which
+can be rendered in the Prometheus text format, e.g. to serve from a
+/metrics endpoint:
+
+    from guardrails.telemetry.stage_timings import stage_timings
+
+    stage_timings.to_prometheus()
+"""
+
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, List, Sequence
+
+if TYPE_CHECKING:
+    from guardrails.classes.history import Call
+
+METRIC_NAME = "guardrails_stage_duration_seconds"
+
+# Upper bounds, in seconds, from sub-millisecond validators to slow LLM calls
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class StageTimingHistograms:
+    """A histogram of durations per stage.
+
+    Args:
+        buckets: The upper bound of each bucket, in seconds.
+        name: The metric name to export the histograms under.
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_BUCKETS, name: str = METRIC_NAME
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.name = name
+        self._bucket_bounds = [int(bound * 1e9) for bound in self.buckets]
+        self._lock = threading.Lock()
+        # stage -> observations in each bucket, and past the last one
+        self._counts: Dict[str, List[int]] = {}
+        self._sums: Dict[str, int] = {}
+
+    def observe(self, stage: str, duration_ns: int) -> None:
+        bucket = bisect_left(self._bucket_bounds, duration_ns)
+        with self._lock:
+            counts = self._counts.get(stage)
+            if counts is None:
+                counts = self._counts[stage] = [0] * (len(self.buckets) + 1)
+                self._sums[stage] = 0
+            counts[bucket] += 1
+            self._sums[stage] += duration_ns
+
+    def observe_call(self, call: "Call") -> None:
+        """Adds the time the call spent in each stage."""
+        for stage, duration_ns in call.timings.items():
+            self.observe(stage, duration_ns)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._sums.clear()
+
+    def to_prometheus(self) -> str:
+        """The histograms in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {self.name} Time spent in each stage of a guard run.",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            stages = sorted(self._counts)
+            counts = {stage: list(self._counts[stage]) for stage in stages}
+            sums = dict(self._sums)
+        for stage in stages:
+            cumulative = 0
+            bounds = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, counts[stage]):
+                cumulative += count
+                lines.append(
+                    f'{self.name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}'
+                )
+            lines.append(f'{self.name}_sum{{stage="{stage}"}} {sums[stage] / 1e9}')
+            lines.append(f'{self.name}_count{{stage="{stage}"}} {cumulative}')
+        return "\n".join(lines) + "\n"
+
+
+stage_timings = StageTimingHistograms()
@@ -1,9 +1,12 @@
+import os
+import random
 from functools import wraps
 from typing import (
     Any,
     Callable,
     Dict,
     Optional,
+    TypeVar,
 )
 
 from opentelemetry import context, trace
@@ -12,12 +15,67 @@ from opentelemetry.trace import StatusCode, Tracer, Span
 
 from guardrails.settings import settings
 from guardrails.classes.validation.validation_result import ValidationResult
+from guardrails.logger import logger
 from guardrails.telemetry.common import get_tracer, serialize
 from guardrails.telemetry.open_inference import trace_operation
 from guardrails.utils.casting_utils import to_string
 from guardrails.utils.safe_get import safe_get
 from guardrails.version import GUARDRAILS_VERSION
 
+MAX_ATTRIBUTE_LENGTH_ENV_VAR = "GUARDRAILS_TRACE_MAX_ATTRIBUTE_LENGTH"
+# Characters kept of each serialized value, input, or output on a span
+DEFAULT_MAX_ATTRIBUTE_LENGTH = 8192
+SAMPLE_RATE_ENV_VAR = "GUARDRAILS_TRACE_VALIDATOR_SAMPLE_RATE"
+# The fraction of validator spans that get their inputs and outputs recorded
+DEFAULT_SAMPLE_RATE = 1.0
+
+N = TypeVar("N", int, float)
+
+
+def number_from_env(env_var: str, default: N) -> N:
+    """Reads a number from the environment, falling back to the default with
+    a warning, rather than failing the import, if it isn't one."""
+    value = os.environ.get(env_var)
+    if value is None:
+        return default
+    try:
+        return type(default)(value)
+    except ValueError:
+        logger.warning(
+            f"Ignoring {env_var}={value!r}, it should be a number. "
+            f"Using the default of {default} instead."
+        )
+        return default
+
+
+max_attribute_length = number_from_env(
+    MAX_ATTRIBUTE_LENGTH_ENV_VAR, DEFAULT_MAX_ATTRIBUTE_LENGTH
+)
+sample_rate = number_from_env(SAMPLE_RATE_ENV_VAR, DEFAULT_SAMPLE_RATE)
+
+
+def truncate(value: str) -> str:
+    """Caps a span attribute at `max_attribute_length` characters."""
+    if max_attribute_length < 0 or len(value) <= max_attribute_length:
+        return value
+    return f"{value[:max_attribute_length]}...[truncated]"
+
+
+def serialize_attribute(value: Any) -> str:
+    if isinstance(value, str):
+        # Don't copy the whole of a large string just to cut it short
+        return truncate(value)
+    return truncate(serialize(value) or "")
+
+
+def should_record_attributes(span: Span) -> bool:
+    """Whether to build the validator's attributes for the span, which means
+    serializing its inputs and outputs.  Skipped when nothing will read
+    them, i.e. the span isn't recording, and for spans not sampled."""
+    if not span.is_recording():
+        return False
+    return sample_rate >= 1 or random.random() < sample_rate
+
 
 def add_validator_attributes(
     *args,
@@ -30,14 +88,15 @@ def add_validator_attributes(
     validation_session_id: str,
     **kwargs,
 ):
-    value_arg = serialize(safe_get(args, 0)) or ""
-    metadata_arg = serialize(safe_get(args, 1, {})) or "{}"
+    # Serialized once, and shared by the legacy and OpenInference attributes
+    value_arg = serialize_attribute(safe_get(args, 0))
+    metadata_arg = serialize_attribute(safe_get(args, 1, {})) or "{}"
 
     # Legacy Span Attributes
     validator_span.set_attribute("on_fail_descriptor", on_fail_descriptor or "noop")
     validator_span.set_attribute(
         "args",
-        to_string({k: to_string(v) for k, v in init_kwargs.items()}) or "{}",
+        truncate(to_string({k: to_string(v) for k, v in init_kwargs.items()}) or "{}"),
     )
     validator_span.set_attribute("instance_id", serialize(obj_id) or "")
     validator_span.set_attribute("input", value_arg)
@@ -52,7 +111,7 @@ def add_validator_attributes(
     validator_span.set_attribute("validator.instance_id", serialize(obj_id) or "")
     for k, v in init_kwargs.items():
         if v is not None:
-            validator_span.set_attribute(f"validator.init.{k}", serialize(v) or "")
+            validator_span.set_attribute(f"validator.init.{k}", serialize_attribute(v))
 
     ### Validator.validate ###
     validator_span.set_attribute("validator.validate.input.value", value_arg)
@@ -60,24 +119,30 @@ def add_validator_attributes(
     for k, v in kwargs.items():
         if v is not None:
             validator_span.set_attribute(
-                f"validator.validate.input.{k}", serialize(v) or ""
+                f"validator.validate.input.{k}", serialize_attribute(v)
             )
-    trace_operation(
-        input_value={"value": value_arg, "metadata": metadata_arg},
-        input_mime_type="application/json",
-    )
 
+    output_value = None
+    output_mime_type = None
     if result is not None:
         output = result.to_dict()
-        trace_operation(
-            output_value=output,
-            output_mime_type="application/json",
-        )
         for k, v in output.items():
             if v is not None:
                 validator_span.set_attribute(
-                    f"validator.validate.output.{k}", serialize(v) or ""
+                    f"validator.validate.output.{k}", serialize_attribute(v)
                 )
+        serialized_output = serialize(output) or ""
+        output_value = truncate(serialized_output)
+        # Cut short, it's no longer valid JSON
+        output_mime_type = (
+            "application/json" if output_value is serialized_output else "text/plain"
+        )
+    trace_operation(
+        input_value={"value": value_arg, "metadata": metadata_arg},
+        input_mime_type="application/json",
+        output_value=output_value,
+        output_mime_type=output_mime_type,
+    )
 
 
 def trace_validator(
@@ -102,35 +167,38 @@ def trace_validator(
                     name=validator_span_name,  # type: ignore
                     context=current_otel_context,  # type: ignore
                 ) as validator_span:
+                    record_attributes = should_record_attributes(validator_span)
                     try:
                         resp = fn(*args, **kwargs)
-                        add_validator_attributes(
-                            *args,
-                            validator_span=validator_span,
-                            validator_name=validator_name,
-                            obj_id=obj_id,
-                            on_fail_descriptor=on_fail_descriptor,
-                            result=resp,
-                            init_kwargs=init_kwargs,
-                            validation_session_id=validation_session_id,
-                            **kwargs,
-                        )
+                        if record_attributes:
+                            add_validator_attributes(
+                                *args,
+                                validator_span=validator_span,
+                                validator_name=validator_name,
+                                obj_id=obj_id,
+                                on_fail_descriptor=on_fail_descriptor,
+                                result=resp,
+                                init_kwargs=init_kwargs,
+                                validation_session_id=validation_session_id,
+                                **kwargs,
+                            )
                         return resp
                     except Exception as e:
                         validator_span.set_status(
                             status=StatusCode.ERROR, description=str(e)
                         )
-                        add_validator_attributes(
-                            *args,
-                            validator_span=validator_span,
-                            validator_name=validator_name,
-                            obj_id=obj_id,
-                            on_fail_descriptor=on_fail_descriptor,
-                            result=None,
-                            init_kwargs=init_kwargs,
-                            validation_session_id=validation_session_id,
-                            **kwargs,
-                        )
+                        if record_attributes:
+                            add_validator_attributes(
+                                *args,
+                                validator_span=validator_span,
+                                validator_name=validator_name,
+                                obj_id=obj_id,
+                                on_fail_descriptor=on_fail_descriptor,
+                                result=None,
+                                init_kwargs=init_kwargs,
+                                validation_session_id=validation_session_id,
+                                **kwargs,
+                            )
                         raise e
             else:
                 return fn(*args, **kwargs)
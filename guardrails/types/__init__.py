@@ -1,3 +1,6 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from guardrails.types.inputs import MessageHistory
 from guardrails.types.on_fail import OnFailAction
 from guardrails.types.primitives import PrimitiveTypes
@@ -7,14 +10,31 @@ from guardrails.types.pydantic import (
     ModelOrModelUnion,
 )
 from guardrails.types.rail import RailTypes
-from guardrails.types.validator import (
-    PydanticValidatorTuple,
-    PydanticValidatorSpec,
-    UseValidatorSpec,
-    UseManyValidatorTuple,
-    UseManyValidatorSpec,
-    ValidatorMap,
-)
+
+if TYPE_CHECKING:
+    from guardrails.types.validator import (
+        PydanticValidatorTuple,
+        PydanticValidatorSpec,
+        UseValidatorSpec,
+        UseManyValidatorTuple,
+        UseManyValidatorSpec,
+        ValidatorMap,
+    )
+
+# These are built from guardrails.validator_base.Validator, and validator_base
+#   imports OnFailAction from this package, so they're only imported when
+#   first used.
+_LAZY_IMPORTS = {
+    name: ("guardrails.types.validator", name)
+    for name in [
+        "PydanticValidatorTuple",
+        "PydanticValidatorSpec",
+        "UseValidatorSpec",
+        "UseManyValidatorTuple",
+        "UseManyValidatorSpec",
+        "ValidatorMap",
+    ]
+}
 
 __all__ = [
     "OnFailAction",
@@ -31,3 +51,12 @@ __all__ = [
     "UseManyValidatorSpec",
     "ValidatorMap",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_IMPORTS[name]
+    value = getattr(importlib.import_module(module_name), attribute)
+    globals()[name] = value
+    return value
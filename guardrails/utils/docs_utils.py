@@ -1,31 +1,39 @@
 import typing as t
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 
 from guardrails.prompt import Prompt
+from guardrails.utils.nltk_resources import nltk_resources
 
 try:
     import tiktoken
 except ImportError:
     tiktoken = None
 
-try:
-    import nltk  # type: ignore
-except ImportError:
-    nltk = None
 
-if nltk is not None:
-    try:
-        nltk.data.find("tokenizers/punkt")
-    except LookupError:
-        nltk.download("punkt")
+DEFAULT_ENCODING = "gpt2"
+
+# Pages each PDF worker extracts per task; enough to amortize opening the
+#   document in the worker.
+PDF_PAGES_PER_TASK = 16
+
+
+@lru_cache(maxsize=None)
+def get_encoding(encoding_name: str = DEFAULT_ENCODING):
+    """Returns the tiktoken encoding with the given name, loading it only
+    once."""
+    import tiktoken
+
+    return tiktoken.get_encoding(encoding_name)
 
 
 class TextSplitter:
     """Split the docs into chunks with token boundaries."""
 
     def __init__(self):
-        import tiktoken
-
-        self.tokenizer = tiktoken.get_encoding("gpt2")
+        self.tokenizer = get_encoding(DEFAULT_ENCODING)
 
     def split(
         self,
@@ -37,6 +45,25 @@ class TextSplitter:
     ) -> t.List[str]:
         # TODO(shreya): Add test to make sure this works correctly.
         """Split the text into chunks with token boundaries."""
+        return list(
+            self.iter_split(
+                text,
+                tokens_per_chunk=tokens_per_chunk,
+                token_overlap=token_overlap,
+                buffer=buffer,
+                prompt_template=prompt_template,
+            )
+        )
+
+    def iter_split(
+        self,
+        text: str,
+        tokens_per_chunk: int = 2048,
+        token_overlap: int = 512,
+        buffer: int = 128,
+        prompt_template: t.Optional[Prompt] = None,
+    ) -> t.Iterator[str]:
+        """Like `split`, but yields the chunks one at a time."""
 
         tokens_per_chunk -= buffer
 
@@ -46,11 +73,9 @@ class TextSplitter:
             tokens_per_chunk -= self.prompt_template_token_length(prompt_template)
 
         tokens = self.tokenizer.encode(text)
-        chunks = []
         for i in range(0, len(tokens), tokens_per_chunk - token_overlap):
             # Note: this is lossy but should be ok.
-            chunks.append(self.tokenizer.decode(tokens[i : i + tokens_per_chunk]))
-        return chunks
+            yield self.tokenizer.decode(tokens[i : i + tokens_per_chunk])
 
     def prompt_template_token_length(self, prompt_template: Prompt) -> int:
         """Exclude the tokens used in the prompt template from the text."""
@@ -69,58 +94,83 @@ class TextSplitter:
 
 
 def sentence_split(text: str) -> t.List[str]:
-    """Split the text into sentences."""
-    try:
-        from nltk import sent_tokenize  # type: ignore
-    except ImportError:
+    """Split the text into sentences.
+
+    The punkt tokenizer is loaded, and downloaded if needed, on first
+    use. See guardrails.utils.nltk_resources.
+    """
+    if not nltk_resources.is_available():
         raise ImportError(
             "nltk is required for sentence splitting. Please install it using "
             "`poetry add nltk`"
         )
+    return nltk_resources.sent_tokenize(text)
+
 
-    # Download the nltk punkt tokenizer if it's not already downloaded.
-    import nltk  # type: ignore
+def _extract_pdf_pages(path, start: int, stop: int) -> t.List[str]:
+    """Extracts the text of pages [start, stop) of the pdf at the given
+    path."""
+    import pypdfium2 as pdfium
 
+    pages = []
+    pdf = pdfium.PdfDocument(path)
     try:
-        nltk.data.find("tokenizers/punkt")
-    except LookupError:
-        nltk.download("punkt")
+        for i in range(start, min(stop, len(pdf))):
+            page = pdf.get_page(i)
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_range().replace("\r", ""))
+            [g.close() for g in (textpage, page)]
+    finally:
+        pdf.close()
+    return pages
 
-    return sent_tokenize(text)
 
+def iter_pdf_pages(path, max_workers: int = 1) -> t.Iterator[str]:
+    """Yields the text of each page of the pdf at the given path, in order.
 
-def read_pdf(path) -> str:
-    """Reads the pdf at the given path."""
+    Args:
+        path: The path to the pdf.
+        max_workers: How many processes to extract pages with. pdfium
+            can't be used from several threads, so pages are extracted
+            in separate processes when this is more than 1.
+    """
     import pypdfium2 as pdfium
 
-    content = ""
     pdf = pdfium.PdfDocument(path)
-    for i in range(len(pdf)):
-        page = pdf.get_page(i)
-        textpage = page.get_textpage()
-        content += textpage.get_text_range()
-        content += "\n"
-        [g.close() for g in (textpage, page)]
+    num_pages = len(pdf)
     pdf.close()
-    return content.replace("\r", "")
 
+    page_ranges = [
+        (start, start + PDF_PAGES_PER_TASK)
+        for start in range(0, num_pages, PDF_PAGES_PER_TASK)
+    ]
+    if max_workers <= 1 or len(page_ranges) <= 1:
+        for start, stop in page_ranges:
+            yield from _extract_pdf_pages(path, start, stop)
+        return
 
-def get_chunks_from_text(
-    text: str, chunk_strategy: str, chunk_size: int, chunk_overlap: int
-) -> t.List[str]:
-    """Get chunks of text from a string.
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        starts, stops = zip(*page_ranges)
+        for pages in executor.map(
+            _extract_pdf_pages, [path] * len(page_ranges), starts, stops
+        ):
+            yield from pages
+
+
+def read_pdf(path, max_workers: int = 1) -> str:
+    """Reads the pdf at the given path.
 
     Args:
-        text: The text to chunk.
-        chunk_strategy: The strategy to use for chunking.
-        chunk_size: The size of each chunk. If the chunk_strategy is "sentences",
-            this is the number of sentences per chunk. If the chunk_strategy is
-            "characters", this is the number of characters per chunk, and so on.
-        chunk_overlap: The number of characters to overlap between chunks. If the
-            chunk_strategy is "sentences", this is the number of sentences to overlap
-            between chunks.
+        path: The path to the pdf.
+        max_workers: How many processes to extract pages with.
+            See `iter_pdf_pages`.
     """
+    return "".join(
+        f"{page}\n" for page in iter_pdf_pages(path, max_workers=max_workers)
+    )
+
 
+def _check_chunk_strategy(chunk_strategy: str) -> None:
     nltk_error = (
         "nltk is required for sentence splitting. Please install it using "
         "`poetry add nltk`"
@@ -130,30 +180,97 @@ def get_chunks_from_text(
         "`poetry add tiktoken`"
     )
 
-    if chunk_strategy == "sentence":
-        if nltk is None:
-            raise ImportError(nltk_error)
-        atomic_chunks = nltk.sent_tokenize(text)
-    elif chunk_strategy == "word":
-        if nltk is None:
+    if chunk_strategy in ("sentence", "word"):
+        if not nltk_resources.is_available():
             raise ImportError(nltk_error)
-        atomic_chunks = nltk.word_tokenize(text)
-    elif chunk_strategy == "char":
-        atomic_chunks = list(text)
     elif chunk_strategy == "token":
         if tiktoken is None:
             raise ImportError(tiktoken_error)
-        # FIXME is this the correct way to use tiktoken?
-        atomic_chunks = tiktoken(text)  # type: ignore
-    elif chunk_strategy == "full":
-        atomic_chunks = [text]
-    else:
+    elif chunk_strategy not in ("char", "full"):
         raise ValueError(
             "chunk_strategy must be 'sentence', 'word', 'char', or 'token'."
         )
 
-    chunks = []
-    for i in range(0, len(atomic_chunks), chunk_size - chunk_overlap):
-        chunk = " ".join(atomic_chunks[i : i + chunk_size])
-        chunks.append(chunk)
-    return chunks
+
+def _iter_atomic_chunks(text: str, chunk_strategy: str) -> t.Iterable[str]:
+    """Splits the text into the smallest units the strategy chunks by."""
+    if chunk_strategy == "sentence":
+        return nltk_resources.sent_tokenize(text)
+    elif chunk_strategy == "word":
+        return nltk_resources.word_tokenize(text)
+    elif chunk_strategy == "char":
+        return iter(text)
+    elif chunk_strategy == "token":
+        encoding = get_encoding(DEFAULT_ENCODING)
+        return (encoding.decode([token]) for token in encoding.encode(text))
+    return [text]
+
+
+def _iter_windows(
+    atomic_chunks: t.Iterable[str], chunk_size: int, chunk_overlap: int
+) -> t.Iterator[str]:
+    """Joins every `chunk_size` atomic chunks, starting a new chunk every
+    `chunk_size - chunk_overlap` of them, while only holding one chunk's
+    worth in memory."""
+    step = chunk_size - chunk_overlap
+    if step < 1:
+        raise ValueError("chunk_overlap must be smaller than chunk_size.")
+
+    window: t.Deque[str] = deque()
+    to_skip = 0
+    for atomic_chunk in atomic_chunks:
+        if to_skip:
+            # Chunks don't overlap and there's a gap between them
+            to_skip -= 1
+            continue
+        window.append(atomic_chunk)
+        if len(window) == chunk_size:
+            yield " ".join(window)
+            for _ in range(min(step, chunk_size)):
+                window.popleft()
+            to_skip = max(step - chunk_size, 0)
+
+    # The last chunks are shorter, as there's nothing left to fill them
+    while window:
+        yield " ".join(window)
+        for _ in range(min(step, len(window))):
+            window.popleft()
+
+
+def iter_chunks_from_text(
+    text: t.Union[str, t.Iterable[str]],
+    chunk_strategy: str,
+    chunk_size: int,
+    chunk_overlap: int,
+) -> t.Iterator[str]:
+    """Like `get_chunks_from_text`, but yields the chunks one at a time.
+
+    The text can also be an iterable of texts, e.g. the pages from
+    `iter_pdf_pages`. Each is split on its own and the chunks run on
+    across them, so memory use doesn't grow with the size of the
+    document.
+    """
+    _check_chunk_strategy(chunk_strategy)
+    texts = [text] if isinstance(text, str) else text
+    atomic_chunks = chain.from_iterable(
+        _iter_atomic_chunks(part, chunk_strategy) for part in texts
+    )
+    return _iter_windows(atomic_chunks, chunk_size, chunk_overlap)
+
+
+def get_chunks_from_text(
+    text: str, chunk_strategy: str, chunk_size: int, chunk_overlap: int
+) -> t.List[str]:
+    """Get chunks of text from a string.
+
+    Args:
+        text: The text to chunk.
+        chunk_strategy: The strategy to use for chunking.
+        chunk_size: The size of each chunk. If the chunk_strategy is "sentences",
+            this is the number of sentences per chunk. If the chunk_strategy is
+            "characters", this is the number of characters per chunk, and so on.
+        chunk_overlap: The number of characters to overlap between chunks. If the
+            chunk_strategy is "sentences", this is the number of sentences to overlap
+            between chunks.
+    """
+    return list(iter_chunks_from_text(text, chunk_strategy, chunk_size, chunk_overlap))
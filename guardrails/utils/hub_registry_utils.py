@@ -0,0 +1,218 @@
+"""hub_registry_utils.py.
+
+An index of which guardrails.hub module registers each installed hub
+validator, so a validator that isn't registered yet can be found by
+importing just its module, instead of guardrails.hub and every installed
+validator (and their dependencies) with it.
+
+Modules that register a validator under a name that isn't a string
+literal are listed as unresolved, so a validator missing from the index
+only has to be looked for in those.
+
+The index is rebuilt from the imports in guardrails/hub/__init__.py every
+time ValidatorPackageService.add_to_hub_inits installs a validator.  It
+lives outside of guardrails.hub since importing anything from there runs
+that __init__.py.
+"""
+
+import ast
+import importlib.util
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Dict, List, Optional, Tuple
+
+HUB_REGISTRY_INDEX_FILE_NAME = "registry_index.json"
+
+# The lines add_to_hub_inits writes, e.g.
+#   from guardrails.hub.guardrails.regex_match.validator import RegexMatch
+HUB_IMPORT_LINE = re.compile(r"^from (guardrails\.hub\.[\w.]+) import ", re.MULTILINE)
+
+
+@dataclass
+class HubRegistryIndex:
+    # The module that registers each validator id
+    validators: Dict[str, str]
+    # Modules that register validators under names that aren't literals
+    unresolved: List[str] = field(default_factory=list)
+
+
+# (modified time, index) of the last index loaded, by path
+_index_cache: Dict[str, Tuple[float, HubRegistryIndex]] = {}
+
+
+def find_registered_names(path: str) -> List[str]:
+    """The names passed to `register_validator` in the Python source at
+    path, a file or a package directory, without importing it."""
+    return _find_registered_names(path)[0]
+
+
+def _find_registered_names(path: str) -> Tuple[List[str], bool]:
+    """The literal names passed to `register_validator` in the Python source
+    at path, and whether it's passed any name that isn't a literal."""
+    if os.path.isdir(path):
+        source_files = [
+            os.path.join(directory, file_name)
+            for directory, _, file_names in os.walk(path)
+            for file_name in sorted(file_names)
+            if file_name.endswith(".py")
+        ]
+    else:
+        source_files = [path]
+
+    names = []
+    unresolved = False
+    for source_file in source_files:
+        try:
+            with open(source_file, "r", encoding="utf-8") as f:
+                tree = ast.parse(f.read(), filename=source_file)
+        except (OSError, SyntaxError, ValueError):
+            continue
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call):
+                continue
+            func = node.func
+            func_name = func.attr if isinstance(func, ast.Attribute) else None
+            func_name = func.id if isinstance(func, ast.Name) else func_name
+            if func_name != "register_validator":
+                continue
+            name_args = [kw.value for kw in node.keywords if kw.arg == "name"]
+            name_args.extend(node.args[:1])
+            for arg in name_args:
+                if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                    names.append(arg.value)
+                else:
+                    unresolved = True
+    return names, unresolved
+
+
+def build_hub_registry_index(
+    hub_directory: str, known: Optional[Dict[str, str]] = None
+) -> HubRegistryIndex:
+    """Maps each validator id registered by a module imported in the hub's
+    __init__.py to that module, and lists the modules that register names
+    that aren't literals.
+
+    Args:
+        hub_directory: The directory of the guardrails.hub package.
+        known: Validator ids already known to belong to a module, e.g.
+            from a manifest.
+    """
+    index = HubRegistryIndex(validators=dict(known or {}))
+    try:
+        with open(os.path.join(hub_directory, "__init__.py"), "r") as hub_init:
+            module_names = HUB_IMPORT_LINE.findall(hub_init.read())
+    except OSError:
+        module_names = []
+
+    for module_name in module_names:
+        relative_parts = module_name.split(".")[2:]
+        module_path = os.path.join(hub_directory, *relative_parts)
+        if not os.path.isdir(module_path):
+            module_path = f"{module_path}.py"
+        names, unresolved = _find_registered_names(module_path)
+        for name in names:
+            index.validators.setdefault(name, module_name)
+        if unresolved and module_name not in index.unresolved:
+            index.unresolved.append(module_name)
+    return index
+
+
+def write_hub_registry_index(hub_directory: str, index: HubRegistryIndex) -> None:
+    index_path = os.path.join(hub_directory, HUB_REGISTRY_INDEX_FILE_NAME)
+    # Write then rename, so a guard being built never reads half an index
+    temp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as index_file:
+        json.dump(
+            {"validators": index.validators, "unresolved": index.unresolved},
+            index_file,
+            indent=2,
+            sort_keys=True,
+        )
+    os.replace(temp_path, index_path)
+
+
+def get_hub_directory() -> Optional[str]:
+    """The directory of the guardrails.hub package, found without
+    importing it."""
+    spec = importlib.util.find_spec("guardrails.hub")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return list(spec.submodule_search_locations)[0]
+
+
+def import_hub_module(
+    module_name: str, hub_directory: Optional[str] = None
+) -> ModuleType:
+    """Imports a guardrails.hub module, e.g. one from the index, without
+    running the hub's __init__.py, which imports every installed validator.
+
+    The module is loaded from its file and added to sys.modules, so its
+    relative imports, and any later import of it, find it there.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    hub_directory = hub_directory or get_hub_directory()
+    if hub_directory is None:
+        raise ImportError(f"Could not find guardrails.hub to import {module_name}")
+
+    module_path = os.path.join(hub_directory, *module_name.split(".")[2:])
+    if os.path.isdir(module_path):
+        spec = importlib.util.spec_from_file_location(
+            module_name,
+            os.path.join(module_path, "__init__.py"),
+            submodule_search_locations=[module_path],
+        )
+    else:
+        spec = importlib.util.spec_from_file_location(module_name, f"{module_path}.py")
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not find {module_name} in {hub_directory}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    parent_name, _, child_name = module_name.rpartition(".")
+    parent = sys.modules.get(parent_name)
+    if parent is not None:
+        setattr(parent, child_name, module)
+    return module
+
+
+def load_hub_registry_index() -> Optional[HubRegistryIndex]:
+    """Returns the installed validators' index, or None if there isn't an
+    up to date one, e.g. the validators were installed by an older version
+    or the hub's __init__.py was edited by hand."""
+    hub_directory = get_hub_directory()
+    if hub_directory is None:
+        return None
+    index_path = os.path.join(hub_directory, HUB_REGISTRY_INDEX_FILE_NAME)
+    try:
+        index_mtime = os.path.getmtime(index_path)
+        if os.path.getmtime(os.path.join(hub_directory, "__init__.py")) > index_mtime:
+            return None
+    except OSError:
+        return None
+
+    cached = _index_cache.get(index_path)
+    if cached is not None and cached[0] == index_mtime:
+        return cached[1]
+    try:
+        with open(index_path, "r") as index_file:
+            contents = json.load(index_file)
+        index = HubRegistryIndex(
+            validators=dict(contents["validators"]),
+            # An index without it predates unresolved modules being listed
+            unresolved=list(contents["unresolved"]),
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    _index_cache[index_path] = (index_mtime, index)
+    return index
@@ -1,12 +1,6 @@
 # Imports
 import logging
 
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import (  # HTTP Exporter
-    OTLPSpanExporter,
-)
-from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import ConsoleSpanExporter, SimpleSpanProcessor
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
 
@@ -46,6 +40,16 @@ class HubTelemetry:
         export_locally: bool,
     ):
         """Initializes a tracer for Guardrails Hub."""
+        # Only imported once telemetry is on, since they're slow to import
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+        from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            ConsoleSpanExporter,
+            SimpleSpanProcessor,
+        )
 
         self._service_name = service_name
         # self._endpoint = "http://localhost:4318/v1/traces"
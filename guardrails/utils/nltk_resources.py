@@ -0,0 +1,161 @@
+"""nltk_resources.py.
+
+Loads the NLTK tokenizers guardrails uses the first time they're needed,
+rather than when guardrails is imported.
+
+Resources are looked up in NLTK's usual data paths, plus any directory
+given through `configure(data_path=...)` or the GUARDRAILS_NLTK_DATA
+environment variable, e.g. one bundled into a container image.  Missing
+resources are downloaded, unless offline mode is on, in which case a
+LookupError explains what to install instead.  Offline mode can be
+turned on with `configure(offline=True)` or by setting GUARDRAILS_OFFLINE
+to "true".
+
+Loaded tokenizers are kept for the life of the process.
+"""
+
+import importlib.util
+import os
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+OFFLINE_ENV_VAR = "GUARDRAILS_OFFLINE"
+NLTK_DATA_ENV_VAR = "GUARDRAILS_NLTK_DATA"
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+
+class NLTKResourceManager:
+    """Finds, and when allowed downloads, NLTK resources on first use and
+    caches the tokenizers loaded from them.
+
+    Args:
+        offline: Never download missing resources. Defaults to the
+            GUARDRAILS_OFFLINE environment variable.
+        data_path: A directory with pre-bundled NLTK data, searched before
+            NLTK's default paths. Defaults to the GUARDRAILS_NLTK_DATA
+            environment variable.
+    """
+
+    def __init__(self, offline: Optional[bool] = None, data_path: Optional[str] = None):
+        self._lock = threading.RLock()
+        self._tokenizers: Dict[str, Any] = {}
+        # Resources we failed to download, so we don't wait on the network again
+        self._unavailable: Set[str] = set()
+        self.offline = False
+        self.data_path: Optional[str] = None
+        self.configure(
+            offline=_env_flag(OFFLINE_ENV_VAR) if offline is None else offline,
+            data_path=data_path or os.environ.get(NLTK_DATA_ENV_VAR),
+        )
+
+    @staticmethod
+    def is_available() -> bool:
+        """Whether nltk is installed, without importing it."""
+        return importlib.util.find_spec("nltk") is not None
+
+    def configure(
+        self, *, offline: Optional[bool] = None, data_path: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            if offline is not None:
+                self.offline = offline
+            if data_path is not None:
+                self.data_path = data_path
+            self._tokenizers.clear()
+            self._unavailable.clear()
+
+    def sent_tokenize(self, text: str, language: str = "english") -> List[str]:
+        """Splits the text into sentences, like `nltk.sent_tokenize`."""
+        return self.get_sentence_tokenizer(language).tokenize(text)
+
+    def word_tokenize(self, text: str, language: str = "english") -> List[str]:
+        """Splits the text into words, like `nltk.word_tokenize`."""
+        word_tokenizer = self._get_word_tokenizer()
+        return [
+            token
+            for sentence in self.sent_tokenize(text, language)
+            for token in word_tokenizer.tokenize(sentence)
+        ]
+
+    def get_sentence_tokenizer(self, language: str = "english"):
+        """Returns the Punkt sentence tokenizer for the language, loading it
+        the first time it's asked for."""
+        key = f"punkt/{language}"
+        tokenizer = self._tokenizers.get(key)
+        if tokenizer is not None:
+            return tokenizer
+
+        with self._lock:
+            if key not in self._tokenizers:
+                import nltk
+                from nltk.tokenize import punkt
+
+                if hasattr(punkt, "PunktTokenizer"):
+                    # nltk >= 3.8.2 ships Punkt parameters as plain tables
+                    self.ensure("punkt_tab")
+                    tokenizer = punkt.PunktTokenizer(language)
+                else:
+                    self.ensure("punkt")
+                    tokenizer = nltk.data.load(f"tokenizers/punkt/{language}.pickle")
+                self._tokenizers[key] = tokenizer
+            return self._tokenizers[key]
+
+    def ensure(self, name: str, category: str = "tokenizers") -> None:
+        """Makes sure the NLTK resource can be loaded, downloading it unless
+        offline mode is on.
+
+        Raises:
+            LookupError: If the resource isn't installed and can't be
+                downloaded.
+        """
+        import nltk
+
+        resource = f"{category}/{name}"
+        with self._lock:
+            if self.data_path and self.data_path not in nltk.data.path:
+                nltk.data.path.insert(0, self.data_path)
+            try:
+                nltk.data.find(resource)
+                return
+            except LookupError:
+                pass
+
+            install_hint = (
+                f"Install it with `python -m nltk.downloader {name}`, or point"
+                f" {NLTK_DATA_ENV_VAR} at a directory that has it."
+            )
+            if self.offline:
+                raise LookupError(
+                    f"NLTK resource '{resource}' is missing and offline mode"
+                    f" is on. {install_hint}"
+                )
+            if resource not in self._unavailable:
+                try:
+                    downloaded = nltk.download(
+                        name,
+                        download_dir=self.data_path,
+                        quiet=True,
+                        raise_on_error=True,
+                    )
+                except Exception:
+                    downloaded = False
+                if downloaded:
+                    return
+                self._unavailable.add(resource)
+            raise LookupError(
+                f"NLTK resource '{resource}' could not be downloaded. {install_hint}"
+            )
+
+    def _get_word_tokenizer(self):
+        tokenizer = self._tokenizers.get("words")
+        if tokenizer is None:
+            from nltk.tokenize import NLTKWordTokenizer
+
+            tokenizer = self._tokenizers.setdefault("words", NLTKWordTokenizer())
+        return tokenizer
+
+
+nltk_resources = NLTKResourceManager()
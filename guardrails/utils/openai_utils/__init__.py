@@ -1,13 +1,22 @@
 from .v1 import AsyncOpenAIClientV1 as AsyncOpenAIClient
 from .v1 import OpenAIClientV1 as OpenAIClient
 from .v1 import (
-    OpenAIServiceUnavailableError,
     get_static_openai_acreate_func,
     get_static_openai_chat_acreate_func,
     get_static_openai_chat_create_func,
     get_static_openai_create_func,
 )
 
+
+def __getattr__(name: str):
+    # Resolved lazily so importing this package doesn't import openai
+    if name == "OpenAIServiceUnavailableError":
+        from . import v1
+
+        return v1.OpenAIServiceUnavailableError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "AsyncOpenAIClient",
     "OpenAIClient",
@@ -1,8 +1,68 @@
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from guardrails.logger import logger
 
 import tiktoken
 
+# How many tokens each message and each name adds, for models known to format
+#   chat messages the same way.
+TOKENS_PER_MESSAGE_AND_NAME = {
+    "gpt-3.5-turbo-0613": (3, 1),
+    "gpt-3.5-turbo-16k-0613": (3, 1),
+    "gpt-4-0314": (3, 1),
+    "gpt-4-32k-0314": (3, 1),
+    "gpt-4-0613": (3, 1),
+    "gpt-4-32k-0613": (3, 1),
+    # every message follows <|start|>{role/name}\n{content}<|end|>\n
+    #   and if there's a name, the role is omitted
+    "gpt-3.5-turbo-0301": (4, -1),
+}
+
+
+@lru_cache(maxsize=None)
+def get_encoding_for_model(
+    model_name: str, default_encoding: Optional[str] = None
+) -> tiktoken.Encoding:
+    """Returns the tiktoken encoding for a model, creating it only once per
+    model.
+
+    Args:
+        model_name (str): The name of the OpenAI model.
+        default_encoding (str, optional): The encoding to use if tiktoken
+            doesn't know the model. Defaults to None, i.e. raise a KeyError.
+    """
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        if default_encoding is None:
+            raise
+        logger.warning(f"model not found. Using {default_encoding} encoding.")
+        return tiktoken.get_encoding(default_encoding)
+
+
+@lru_cache(maxsize=None)
+def _tokens_per_message_and_name(model: str) -> Tuple[int, int]:
+    if model in TOKENS_PER_MESSAGE_AND_NAME:
+        return TOKENS_PER_MESSAGE_AND_NAME[model]
+    elif "gpt-3.5-turbo" in model:
+        logger.warning(
+            """gpt-3.5-turbo may update over time.
+            Returning num tokens assuming gpt-3.5-turbo-0613."""
+        )
+        return TOKENS_PER_MESSAGE_AND_NAME["gpt-3.5-turbo-0613"]
+    elif "gpt-4" in model:
+        logger.warning(
+            """gpt-4 may update over time.
+            Returning num tokens assuming gpt-4-0613."""
+        )
+        return TOKENS_PER_MESSAGE_AND_NAME["gpt-4-0613"]
+    else:
+        raise NotImplementedError(
+            f"""num_tokens_from_messages() is not implemented for model {model}.
+            See https://github.com/openai/openai-python/blob/main/chatml.md for
+            information on how messages are converted to tokens."""
+        )
+
 
 def num_tokens_from_string(text: str, model_name: str) -> int:
     """Returns the number of tokens in a text string.
@@ -19,7 +79,7 @@ def num_tokens_from_string(text: str, model_name: str) -> int:
     Returns:
         num_tokens (int): The number of tokens in the text string.
     """
-    encoding = tiktoken.encoding_for_model(model_name)
+    encoding = get_encoding_for_model(model_name)
     num_tokens = len(encoding.encode(text))
     return num_tokens
 
@@ -28,44 +88,8 @@ def num_tokens_from_messages(
     messages: List[Dict[str, str]], model: str = "gpt-3.5-turbo-0613"
 ) -> int:
     """Return the number of tokens used by a list of messages."""
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        logger.warning("model not found. Using cl100k_base encoding.")
-        encoding = tiktoken.get_encoding("cl100k_base")
-    if model in {
-        "gpt-3.5-turbo-0613",
-        "gpt-3.5-turbo-16k-0613",
-        "gpt-4-0314",
-        "gpt-4-32k-0314",
-        "gpt-4-0613",
-        "gpt-4-32k-0613",
-    }:
-        tokens_per_message = 3
-        tokens_per_name = 1
-    elif model == "gpt-3.5-turbo-0301":
-        tokens_per_message = (
-            4  # every message follows <|start|>{role/name}\n{content}<|end|>\n
-        )
-        tokens_per_name = -1  # if there's a name, the role is omitted
-    elif "gpt-3.5-turbo" in model:
-        logger.warning(
-            """gpt-3.5-turbo may update over time.
-            Returning num tokens assuming gpt-3.5-turbo-0613."""
-        )
-        return num_tokens_from_messages(messages, model="gpt-3.5-turbo-0613")
-    elif "gpt-4" in model:
-        logger.warning(
-            """gpt-4 may update over time.
-            Returning num tokens assuming gpt-4-0613."""
-        )
-        return num_tokens_from_messages(messages, model="gpt-4-0613")
-    else:
-        raise NotImplementedError(
-            f"""num_tokens_from_messages() is not implemented for model {model}.
-            See https://github.com/openai/openai-python/blob/main/chatml.md for
-            information on how messages are converted to tokens."""
-        )
+    tokens_per_message, tokens_per_name = _tokens_per_message_and_name(model)
+    encoding = get_encoding_for_model(model, default_encoding="cl100k_base")
 
     num_tokens = 0
     for message in messages:
@@ -78,3 +102,47 @@ def num_tokens_from_messages(
     # every reply is primed with <|start|>assistant<|message|>
     num_tokens += 3
     return num_tokens
+
+
+class StreamingTokenCounter:
+    """Keeps a running count of the tokens in a streamed response as its
+    chunks arrive, so the output doesn't have to be encoded again once the
+    stream ends.
+
+    Tokens can span chunks, so the text after the last word boundary is
+    held back and encoded again with the next chunk, or when the count is
+    read.
+
+    Args:
+        model_name (str): The name of the OpenAI model that is streaming.
+    """
+
+    def __init__(self, model_name: str):
+        self._encoding = get_encoding_for_model(model_name)
+        self._pending = ""
+        self._count = 0
+
+    @staticmethod
+    def _last_word_boundary(text: str) -> int:
+        # The pre-tokenizers of tiktoken's encodings never put a space in the
+        #   same piece as the non-whitespace character before it, so no token
+        #   spans such a space, whatever text follows it
+        split = text.rfind(" ")
+        while split > 0 and text[split - 1].isspace():
+            split = text.rfind(" ", 0, split)
+        return max(split, 0)
+
+    def add(self, text: str) -> None:
+        """Counts the tokens of the next chunk of the response."""
+        if not text:
+            return
+        self._pending += text
+        split = self._last_word_boundary(self._pending)
+        if split:
+            self._count += len(self._encoding.encode_ordinary(self._pending[:split]))
+            self._pending = self._pending[split:]
+
+    @property
+    def count(self) -> int:
+        """The number of tokens in everything added so far."""
+        return self._count + len(self._encoding.encode_ordinary(self._pending))
@@ -1,10 +1,9 @@
 from typing import Any, AsyncIterable, Dict, Iterable, List, cast
 
-import openai
-
 from guardrails.classes.llm.llm_response import LLMResponse
 from guardrails.utils.openai_utils.base import BaseOpenAIClient
 from guardrails.utils.openai_utils.streaming_utils import (
+    StreamingTokenCounter,
     num_tokens_from_messages,
     num_tokens_from_string,
 )
@@ -12,11 +11,18 @@ from guardrails.utils.safe_get import safe_get
 from guardrails.telemetry import trace_llm_call, trace_operation
 
 
+# openai is only imported once it's used, as importing it is slow
+
+
 def get_static_openai_create_func():
+    import openai
+
     return openai.completions.create
 
 
 def get_static_openai_chat_create_func():
+    import openai
+
     return openai.chat.completions.create
 
 
@@ -28,12 +34,19 @@ def get_static_openai_chat_acreate_func():
     return None
 
 
-OpenAIServiceUnavailableError = openai.APIError
+def __getattr__(name: str) -> Any:
+    if name == "OpenAIServiceUnavailableError":
+        import openai
+
+        return openai.APIError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class OpenAIClientV1(BaseOpenAIClient):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        import openai
+
         self.client = openai.Client(
             api_key=self.api_key,
             base_url=self.api_base,
@@ -215,6 +228,8 @@ class OpenAIClientV1(BaseOpenAIClient):
 class AsyncOpenAIClientV1(BaseOpenAIClient):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        import openai
+
         self.client = openai.AsyncClient(
             api_key=self.api_key,
             base_url=self.api_base,
@@ -255,26 +270,27 @@ class AsyncOpenAIClientV1(BaseOpenAIClient):
         if stream:
             # If stream is defined and set to True,
             # openai returns a generator object
-            complete_output = ""
+            # Also, it no longer returns usage information
+            # So manually count the tokens using tiktoken,
+            # counting the output as it arrives
+            token_counter = StreamingTokenCounter(engine)
+            collected_text = []
             openai_response = cast(AsyncIterable[Dict[str, Any]], openai_response)
             async for response in openai_response:
-                complete_output += response["choices"][0]["text"]
+                text = response["choices"][0]["text"]
+                collected_text.append(text)
+                token_counter.add(text)
 
-            # Also, it no longer returns usage information
-            # So manually count the tokens using tiktoken
             prompt_token_count = num_tokens_from_string(
                 text=prompt,
                 model_name=engine,
             )
-            response_token_count = num_tokens_from_string(
-                text=complete_output, model_name=engine
-            )
 
             # Return the LLMResponse
             return LLMResponse(
-                output=complete_output,
+                output="".join(collected_text),
                 prompt_token_count=prompt_token_count,
-                response_token_count=response_token_count,
+                response_token_count=token_counter.count,
             )
 
         # If stream is not defined or is set to False,
@@ -319,31 +335,27 @@ class AsyncOpenAIClientV1(BaseOpenAIClient):
         if stream:
             # If stream is defined and set to True,
             # openai returns a generator object
-            collected_messages = []
+            # Also, it no longer returns usage information
+            # So manually count the tokens using tiktoken,
+            # counting the output as it arrives
+            token_counter = StreamingTokenCounter(model)
+            collected_content = []
             openai_response = cast(AsyncIterable[Dict[str, Any]], openai_response)
             async for chunk in openai_response:
-                chunk_message = chunk["choices"][0]["delta"]
-                collected_messages.append(chunk_message)  # save the message
+                content = chunk["choices"][0]["delta"].get("content") or ""
+                collected_content.append(content)
+                token_counter.add(content)
 
-            complete_output = "".join(
-                [msg.get("content", "") for msg in collected_messages]
-            )
-
-            # Also, it no longer returns usage information
-            # So manually count the tokens using tiktoken
             prompt_token_count = num_tokens_from_messages(
                 messages=prompt,
                 model=model,
             )
-            response_token_count = num_tokens_from_string(
-                text=complete_output, model_name=model
-            )
 
             # Return the LLMResponse
             return LLMResponse(
-                output=complete_output,
+                output="".join(collected_content),
                 prompt_token_count=prompt_token_count,
-                response_token_count=response_token_count,
+                response_token_count=token_counter.count,
             )
 
         # If stream is not defined or is set to False,
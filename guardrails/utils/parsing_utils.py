@@ -1,6 +1,5 @@
 import json
 from guardrails_api_client import SimpleTypes
-import jsonref
 import regex
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, cast
 
@@ -417,6 +416,8 @@ def coerce_property(
 def coerce_types(
     payload: Union[str, List[Any], Dict[str, Any], Any], schema: Dict[str, Any]
 ) -> Union[str, List[Any], Dict[str, Any]]:
+    import jsonref
+
     dereferenced_schema = cast(
         Dict[str, Any], jsonref.replace_refs(schema)
     )  # for pyright
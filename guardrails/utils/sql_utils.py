@@ -1,3 +1,5 @@
+import threading
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Optional
@@ -10,6 +12,13 @@ try:
 except ImportError:
     _HAS_SQLALCHEMY = False
 
+# How long a schema snapshot is reused before the database is inspected again
+DEFAULT_SCHEMA_TTL = 300
+
+# "execute" runs queries to validate them, "explain" only has the database
+#   plan them, so they're checked without side effects or the cost of running.
+VALIDATION_MODES = ("execute", "explain")
+
 
 class SQLDriver(ABC):
     """Abstract class for SQL drivers.
@@ -47,9 +56,23 @@ class SqlAlchemyDriver(SQLDriver):
 
     It can setup the database schema and check if the queries are valid
     by connecting to the database.
+
+    Args:
+        schema_file: Path to a SQL script that creates the schema.
+        conn: The sqlalchemy connection string.
+        schema_ttl: Seconds to reuse the inspected schema for. None reuses
+            it until `refresh_schema` is called.
+        validation_mode: Either "execute" to run queries to validate them,
+            or "explain" to validate them with EXPLAIN without running them.
     """
 
-    def __init__(self, schema_file: Optional[str], conn: Optional[str]) -> None:
+    def __init__(
+        self,
+        schema_file: Optional[str],
+        conn: Optional[str],
+        schema_ttl: Optional[float] = DEFAULT_SCHEMA_TTL,
+        validation_mode: str = "execute",
+    ) -> None:
         if not _HAS_SQLALCHEMY:
             raise ImportError(
                 """The functionality requires sqlalchemy to be installed.
@@ -63,6 +86,16 @@ class SqlAlchemyDriver(SQLDriver):
            Use sqlite for ex: sqlite://"""
             )
 
+        if validation_mode not in VALIDATION_MODES:
+            raise ValueError(
+                f"validation_mode must be one of {', '.join(VALIDATION_MODES)}."
+            )
+        self.validation_mode = validation_mode
+        self.schema_ttl = schema_ttl
+        self._schema: Optional[str] = None
+        self._schema_expires_at = 0.0
+        self._schema_lock = threading.Lock()
+
         if conn is not None:
             try:
                 self._engine = sqlalchemy.create_engine(conn)
@@ -81,6 +114,9 @@ class SqlAlchemyDriver(SQLDriver):
 
     def validate_sql(self, query: str) -> List[str]:
         exceptions: List[str] = []
+        if self.validation_mode == "explain":
+            # The database parses and plans the query, but doesn't run it
+            query = f"EXPLAIN {query}"
         try:
             self._conn.execute(text(query))
         except Exception as ex:
@@ -88,17 +124,45 @@ class SqlAlchemyDriver(SQLDriver):
         return exceptions
 
     def get_schema(self) -> str:
+        """Returns a description of the database's tables and columns.
+
+        The database is only inspected again once the snapshot is older
+        than `schema_ttl`.
+        """
+        with self._schema_lock:
+            if self._schema is None or (
+                self.schema_ttl is not None
+                and time.monotonic() >= self._schema_expires_at
+            ):
+                self._schema = self._inspect_schema()
+                if self.schema_ttl is not None:
+                    self._schema_expires_at = time.monotonic() + self.schema_ttl
+            return self._schema
+
+    def refresh_schema(self) -> str:
+        """Inspects the database again, e.g. after a migration."""
+        with self._schema_lock:
+            self._schema = None
+        return self.get_schema()
+
+    def _inspect_schema(self) -> str:
         # Get table schema using sqlalchemy.inspect
         insp = sqlalchemy.inspect(self._conn)
 
+        # The get_multi_* methods reflect every table in as few queries as
+        #   the dialect allows, rather than a few queries per table.
+        table_names = insp.get_table_names()
+        columns_by_table = insp.get_multi_columns()
+        foreign_keys_by_table = insp.get_multi_foreign_keys()
+
         schema = {}
-        for table in insp.get_table_names():
+        for table in table_names:
             schema[table] = {}
-            for column in insp.get_columns(table):
+            for column in columns_by_table.get((None, table), []):
                 schema[table][column["name"]] = {"type": column["type"]}
 
             # Get foreign keys
-            for fk in insp.get_foreign_keys(table):
+            for fk in foreign_keys_by_table.get((None, table), []):
                 schema[table][fk["constrained_columns"][0]]["foreign_key"] = {
                     "table": fk["referred_table"],
                     "column": fk["referred_columns"][0],
@@ -117,8 +181,16 @@ class SqlAlchemyDriver(SQLDriver):
 
 
 def create_sql_driver(
-    schema_file: Optional[str] = None, conn: Optional[str] = None
+    schema_file: Optional[str] = None,
+    conn: Optional[str] = None,
+    schema_ttl: Optional[float] = DEFAULT_SCHEMA_TTL,
+    validation_mode: str = "execute",
 ) -> SQLDriver:
     if schema_file is None and conn is None:
         return SimpleSqlDriver()
-    return SqlAlchemyDriver(schema_file=schema_file, conn=conn)
+    return SqlAlchemyDriver(
+        schema_file=schema_file,
+        conn=conn,
+        schema_ttl=schema_ttl,
+        validation_mode=validation_mode,
+    )
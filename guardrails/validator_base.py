@@ -8,13 +8,19 @@ import logging
 from collections import defaultdict
 from dataclasses import dataclass
 from string import Template
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 from warnings import warn
 
-import nltk
-import requests
-from langchain_core.runnables import Runnable
-
 from guardrails.classes import ErrorSpan  # noqa
 from guardrails.classes import PassResult  # noqa
 from guardrails.classes import FailResult, ValidationResult
@@ -24,13 +30,15 @@ from guardrails.hub_token.token import VALIDATOR_HUB_SERVICE, get_jwt_token
 from guardrails.logger import logger
 from guardrails.remote_inference import remote_inference
 from guardrails.types.on_fail import OnFailAction
+from guardrails.utils.hub_registry_utils import (
+    import_hub_module,
+    load_hub_registry_index,
+)
 from guardrails.utils.hub_telemetry_utils import HubTelemetry
+from guardrails.utils.nltk_resources import nltk_resources
 
-#   See: https://github.com/guardrails-ai/guardrails/issues/829
-try:
-    nltk.data.find("tokenizers/punkt")
-except LookupError:
-    nltk.download("punkt")
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
 
 
 ### functions to get chunks ###
@@ -54,7 +62,9 @@ def split_sentence_nltk(chunk: str):
     # we check for a . to avoid wastefully calling the tokenizer
     if "." not in chunk:
         return []
-    sentences = nltk.sent_tokenize(chunk)
+
+    #   See: https://github.com/guardrails-ai/guardrails/issues/829
+    sentences = nltk_resources.sent_tokenize(chunk)
     if len(sentences) == 0:
         return []
     # return the sentence
@@ -71,6 +81,10 @@ class Validator:
 
     run_in_separate_process = False
     override_value_on_pass = False
+    # Set to True if the result only depends on the init kwargs, the value,
+    #   and the metadata keys listed in required_metadata_keys.
+    #   See guardrails.stores.validator_cache.
+    cacheable = False
     required_metadata_keys = []
     _metadata = {}
 
@@ -278,6 +292,8 @@ class Validator:
             "Authorization": f"Bearer {self.hub_jwt_token}",
             "Content-Type": "application/json",
         }
+        import requests
+
         req = requests.post(validation_endpoint, data=request_body, headers=headers)
         if not req.ok:
             if req.status_code == 401:
@@ -404,7 +420,7 @@ class Validator:
         self._metadata = metadata
         return self
 
-    def to_runnable(self) -> Runnable:
+    def to_runnable(self) -> "Runnable":
         from guardrails.integrations.langchain.validator_runnable import (
             ValidatorRunnable,
         )
@@ -505,6 +521,30 @@ def try_to_import_hub():
         logger.error("Could not import hub. Validators may not work properly.")
 
 
+def import_hub_validator(validator_id: str):
+    """Imports the hub module that registers the validator, found through
+    the index written when validators are installed.
+
+    Validators missing from the index can only be registered under a name
+    that isn't a string literal, so only the modules that do that are
+    imported.  Falls back to importing all of guardrails.hub if there's no
+    up to date index.
+    """
+    index = load_hub_registry_index()
+    if index is None:
+        try_to_import_hub()
+        return
+    module_name = index.validators.get(validator_id)
+    module_names = [module_name] if module_name is not None else index.unresolved
+    for module_name in module_names:
+        try:
+            import_hub_module(module_name)
+        except Exception as e:
+            logger.error(
+                f"Could not import {module_name} for validator {validator_id}: {e}"
+            )
+
+
 # TODO: Move this to validator_utils.py
 def get_validator_class(name: Optional[str]) -> Optional[Type[Validator]]:
     if not name:
@@ -514,7 +554,7 @@ def get_validator_class(name: Optional[str]) -> Optional[Type[Validator]]:
 
     registration = validators_registry.get(validator_key)
     if not registration:
-        try_to_import_hub()
+        import_hub_validator(validator_key)
         registration = validators_registry.get(validator_key)
 
     if not registration:
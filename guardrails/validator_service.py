@@ -3,10 +3,22 @@ import itertools
 import os
 from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple, Union, cast
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from guardrails.actions.filter import Filter, apply_filters
-from guardrails.actions.refrain import Refrain, apply_refrain
+from guardrails.actions.refrain import Refrain, apply_refrain, check_for_refrain
 from guardrails.classes.history import Iteration
 from guardrails.classes.output_type import OutputTypes
 from guardrails.classes.validation.validation_result import (
@@ -17,6 +29,7 @@ from guardrails.classes.validation.validation_result import (
 )
 from guardrails.errors import ValidationError
 from guardrails.merge import merge
+from guardrails.stores.validator_cache import validator_cache
 from guardrails.types import ValidatorMap, OnFailAction
 from guardrails.utils.exception_utils import UserFacingException
 from guardrails.utils.hub_telemetry_utils import HubTelemetry
@@ -33,6 +46,33 @@ def key_not_empty(key: str) -> bool:
     return key is not None and len(str(key)) > 0
 
 
+def cancel_siblings_on_terminal(siblings: List[asyncio.Task], task: asyncio.Task):
+    """Done callback for child validation tasks.
+
+    If the child raised (e.g. an EXCEPTION on fail action) or refrained,
+    the output is going to be discarded, so there's no point in letting
+    its siblings keep running.
+    """
+    if task.cancelled():
+        return
+    if task.exception() is None:
+        _key, child_value, _metadata = task.result()
+        if not check_for_refrain(child_value):
+            return
+    for sibling in siblings:
+        if sibling is not task and not sibling.done():
+            sibling.cancel()
+
+
+# On fail actions that end validation of a value;
+#   once one of these fires the other validators' results can't change the outcome.
+TERMINAL_ON_FAIL_ACTIONS = [
+    OnFailAction.EXCEPTION,
+    OnFailAction.REFRAIN,
+    OnFailAction.FILTER,
+]
+
+
 class ValidatorServiceBase:
     """Base class for validator services."""
 
@@ -56,6 +96,8 @@ class ValidatorServiceBase:
         **kwargs,
     ) -> ValidatorResult:
         validate_func = validator.validate_stream if stream else validator.validate
+        if validator.cacheable and not stream:
+            validate_func = validator_cache.cached(validator, validate_func)
         traced_validator = trace_validator(
             validator_name=validator.rail_alias,
             obj_id=id(validator),
@@ -174,6 +216,32 @@ class ValidatorServiceBase:
 
         return validator_logs
 
+    def record_not_run(
+        self,
+        iteration: Iteration,
+        validators: List[Validator],
+        value: Any,
+        absolute_property_path: str,
+    ) -> List[ValidatorLogs]:
+        """Log validators that were skipped or cancelled because a sibling
+        validator triggered a terminal on fail action.
+
+        These logs have no validation_result and report a status of
+        "not run".
+        """
+        not_run_logs = []
+        for validator in validators:
+            validator_logs = ValidatorLogs(
+                validator_name=validator.__class__.__name__,
+                value_before_validation=value,
+                registered_name=validator.rail_alias,
+                property_path=absolute_property_path,
+                instance_id=id(validator),
+            )
+            iteration.outputs.validator_logs.append(validator_logs)
+            not_run_logs.append(validator_logs)
+        return not_run_logs
+
     def run_validator(
         self,
         iteration: Iteration,
@@ -689,6 +757,16 @@ class MultiprocMixin:
 
 
 class AsyncValidatorService(ValidatorServiceBase, MultiprocMixin):
+    def __init__(
+        self,
+        disable_tracer: Optional[bool] = True,
+        short_circuit: Optional[bool] = True,
+    ):
+        super().__init__(disable_tracer)
+        # Validators run one at a time in SequentialValidatorService,
+        #   which already stops at the first terminal failure
+        self._short_circuit = short_circuit
+
     async def run_validator_async(
         self,
         validator: Validator,
@@ -772,98 +850,203 @@ class AsyncValidatorService(ValidatorServiceBase, MultiprocMixin):
     ):
         loop = asyncio.get_running_loop()
         validators = validator_map.get(reference_property_path, [])
-        for on_fail, validator_group in self.group_validators(validators):
-            parallel_tasks = []
-            validators_logs: List[ValidatorLogs] = []
-            for validator in validator_group:
-                if validator.run_in_separate_process:
-                    # queue the validators to run in a separate process
-                    parallel_tasks.append(
-                        loop.run_in_executor(
-                            self.multiprocessing_executor,
-                            self.run_validator,
+        # Track which validators have been started so we can log the rest
+        #   as not run if this coroutine is cancelled.
+        started_validators: Set[int] = set()
+        parallel_tasks: List[Tuple[Validator, Awaitable]] = []
+        try:
+            for on_fail, validator_group in self.group_validators(validators):
+                short_circuit = (
+                    self._short_circuit and on_fail in TERMINAL_ON_FAIL_ACTIONS
+                )
+                parallel_tasks = []
+                validators_logs: List[ValidatorLogs] = []
+                for index, validator in enumerate(validator_group):
+                    started_validators.add(id(validator))
+                    if validator.run_in_separate_process:
+                        # queue the validators to run in a separate process
+                        parallel_tasks.append(
+                            (
+                                validator,
+                                loop.run_in_executor(
+                                    self.multiprocessing_executor,
+                                    self.run_validator,
+                                    iteration,
+                                    validator,
+                                    value,
+                                    metadata,
+                                    absolute_property_path,
+                                    stream,
+                                ),
+                            )
+                        )
+                    else:
+                        # run the validators in the current process
+                        result = await self.run_validator(
                             iteration,
                             validator,
                             value,
                             metadata,
                             absolute_property_path,
+                            stream=stream,
+                            **kwargs,
+                        )
+                        validators_logs.append(result)
+                        if short_circuit and isinstance(
+                            result.validation_result, FailResult
+                        ):
+                            # The rest of this group can't change the outcome
+                            skipped = validator_group[index + 1 :]
+                            started_validators.update(id(v) for v in skipped)
+                            self.record_not_run(
+                                iteration, skipped, value, absolute_property_path
+                            )
+                            break
+
+                # wait for the parallel tasks to finish
+                if parallel_tasks:
+                    if short_circuit:
+                        validators_logs.extend(
+                            await self.gather_until_fail(
+                                iteration,
+                                parallel_tasks,
+                                value,
+                                absolute_property_path,
+                                already_failed=any(
+                                    isinstance(logs.validation_result, FailResult)
+                                    for logs in validators_logs
+                                ),
+                            )
+                        )
+                    else:
+                        parallel_results = await asyncio.gather(
+                            *[task for _, task in parallel_tasks]
+                        )
+                        awaited_results = []
+                        for res in parallel_results:
+                            if asyncio.iscoroutine(res):
+                                res = await res
+                            awaited_results.append(res)
+                        validators_logs.extend(awaited_results)
+                    parallel_tasks = []
+
+                # process the results, handle failures
+                fails = [
+                    logs
+                    for logs in validators_logs
+                    if isinstance(logs.validation_result, FailResult)
+                ]
+                if fails:
+                    # NOTE: Ignoring type bc we know it's a FailResult
+                    fail_results: List[FailResult] = [
+                        logs.validation_result  # type: ignore
+                        for logs in fails
+                    ]
+                    rechecked_value = None
+                    validator: Validator = validator_group[0]
+                    if validator.on_fail_descriptor == OnFailAction.FIX_REASK:
+                        fixed_value = fail_results[0].fix_value
+                        rechecked_value = await self.run_validator_async(
+                            validator,
+                            fixed_value,
+                            fail_results[0].metadata or {},
                             stream,
+                            validation_session_id=iteration.id,
+                            **kwargs,
                         )
-                    )
-                else:
-                    # run the validators in the current process
-                    result = await self.run_validator(
-                        iteration,
-                        validator,
+                    value = self.perform_correction(
+                        fail_results,
                         value,
-                        metadata,
-                        absolute_property_path,
-                        stream=stream,
-                        **kwargs,
+                        validator_group[0],
+                        on_fail,
+                        rechecked_value=rechecked_value,
                     )
-                    validators_logs.append(result)
 
-            # wait for the parallel tasks to finish
-            if parallel_tasks:
-                parallel_results = await asyncio.gather(*parallel_tasks)
-                awaited_results = []
-                for res in parallel_results:
-                    if asyncio.iscoroutine(res):
-                        res = await res
-                    awaited_results.append(res)
-                validators_logs.extend(awaited_results)
-
-            # process the results, handle failures
-            fails = [
-                logs
-                for logs in validators_logs
-                if isinstance(logs.validation_result, FailResult)
-            ]
-            if fails:
-                # NOTE: Ignoring type bc we know it's a FailResult
-                fail_results: List[FailResult] = [
-                    logs.validation_result  # type: ignore
-                    for logs in fails
-                ]
-                rechecked_value = None
-                validator: Validator = validator_group[0]
-                if validator.on_fail_descriptor == OnFailAction.FIX_REASK:
-                    fixed_value = fail_results[0].fix_value
-                    rechecked_value = await self.run_validator_async(
-                        validator,
-                        fixed_value,
-                        fail_results[0].metadata or {},
-                        stream,
-                        validation_session_id=iteration.id,
-                        **kwargs,
-                    )
-                value = self.perform_correction(
-                    fail_results,
-                    value,
-                    validator_group[0],
-                    on_fail,
-                    rechecked_value=rechecked_value,
-                )
+                # handle overrides
+                if (
+                    len(validator_group) == 1
+                    and validator_group[0].override_value_on_pass
+                    and isinstance(validators_logs[0].validation_result, PassResult)
+                    and validators_logs[0].validation_result.value_override
+                    is not PassResult.ValueOverrideSentinel
+                ):
+                    value = validators_logs[0].validation_result.value_override
 
-            # handle overrides
-            if (
-                len(validator_group) == 1
-                and validator_group[0].override_value_on_pass
-                and isinstance(validators_logs[0].validation_result, PassResult)
-                and validators_logs[0].validation_result.value_override
-                is not PassResult.ValueOverrideSentinel
-            ):
-                value = validators_logs[0].validation_result.value_override
-
-            for logs in validators_logs:
-                logs.value_after_validation = value
-
-            # return early if we have a filter, refrain, or reask
-            if isinstance(value, (Filter, Refrain, FieldReAsk)):
-                return value, metadata
+                for logs in validators_logs:
+                    logs.value_after_validation = value
+
+                # return early if we have a filter, refrain, or reask
+                if isinstance(value, (Filter, Refrain, FieldReAsk)):
+                    if short_circuit:
+                        self.record_not_run(
+                            iteration,
+                            [v for v in validators if id(v) not in started_validators],
+                            value,
+                            absolute_property_path,
+                        )
+                    return value, metadata
+        except asyncio.CancelledError:
+            # A sibling value triggered a terminal on fail action.
+            for _, task in parallel_tasks:
+                cast(asyncio.Future, task).cancel()
+            self.record_not_run(
+                iteration,
+                [v for v in validators if id(v) not in started_validators],
+                value,
+                absolute_property_path,
+            )
+            raise
 
         return value, metadata
 
+    async def gather_until_fail(
+        self,
+        iteration: Iteration,
+        tasks: List[Tuple[Validator, Awaitable]],
+        value: Any,
+        absolute_property_path: str,
+        already_failed: bool = False,
+    ) -> List[ValidatorLogs]:
+        """Await validators queued in separate processes, cancelling the
+        outstanding ones as soon as one of them fails.
+
+        Only used for validator groups with a terminal on fail action.
+        Validators that have already finished when one fails are kept,
+        the others are cancelled and logged as not run. Work that has
+        already been picked up by a worker process can't be interrupted,
+        but its result is discarded.
+        """
+        futures = {asyncio.ensure_future(task): validator for validator, task in tasks}
+        pending: Set[asyncio.Future] = set(futures)
+        validators_logs: List[ValidatorLogs] = []
+        try:
+            while pending:
+                # Once one has failed, only collect the ones already done
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=0 if already_failed else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    break
+                for future in done:
+                    res = future.result()
+                    if asyncio.iscoroutine(res):
+                        res = await res
+                    validators_logs.append(res)
+                    if isinstance(res.validation_result, FailResult):
+                        already_failed = True
+        finally:
+            for future in pending:
+                future.cancel()
+            self.record_not_run(
+                iteration,
+                [futures[future] for future in pending],
+                value,
+                absolute_property_path,
+            )
+        return validators_logs
+
     async def validate_children(
         self,
         value: Any,
@@ -906,7 +1089,23 @@ class AsyncValidatorService(ValidatorServiceBase, MultiprocMixin):
                 child = value.get(key)
                 tasks.append(validate_child(child, key=key))
 
-        results = await asyncio.gather(*tasks)
+        if self._short_circuit:
+            child_tasks = [asyncio.ensure_future(task) for task in tasks]
+            for child_task in child_tasks:
+                child_task.add_done_callback(
+                    partial(cancel_siblings_on_terminal, child_tasks)
+                )
+            results = []
+            for result in await asyncio.gather(*child_tasks, return_exceptions=True):
+                if isinstance(result, asyncio.CancelledError):
+                    # This child was cancelled because a sibling
+                    #   raised or refrained; its value is moot.
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                results.append(result)
+        else:
+            results = await asyncio.gather(*tasks)
 
         for key, child_value, child_metadata in results:
             value[key] = child_value
@@ -929,16 +1128,35 @@ class AsyncValidatorService(ValidatorServiceBase, MultiprocMixin):
         child_ref_path = reference_path.replace(".*", "")
         # Validate children first
         if isinstance(value, List) or isinstance(value, Dict):
-            await self.validate_children(
-                value,
-                metadata,
-                validator_map,
-                iteration,
-                absolute_path,
-                child_ref_path,
-                stream=stream,
-                **kwargs,
-            )
+            try:
+                await self.validate_children(
+                    value,
+                    metadata,
+                    validator_map,
+                    iteration,
+                    absolute_path,
+                    child_ref_path,
+                    stream=stream,
+                    **kwargs,
+                )
+            except asyncio.CancelledError:
+                self.record_not_run(
+                    iteration,
+                    validator_map.get(reference_path, []),
+                    value,
+                    absolute_path,
+                )
+                raise
+
+            # A refrain anywhere below means the whole output is discarded
+            if self._short_circuit and check_for_refrain(value):
+                self.record_not_run(
+                    iteration,
+                    validator_map.get(reference_path, []),
+                    value,
+                    absolute_path,
+                )
+                return value, metadata
 
         # Then validate the parent value
         value, metadata = await self.run_validators(
@@ -993,6 +1211,7 @@ def validate(
     iteration: Iteration,
     disable_tracer: Optional[bool] = True,
     path: Optional[str] = None,
+    short_circuit: Optional[bool] = True,
     **kwargs,
 ):
     if path is None:
@@ -1007,7 +1226,7 @@ def validate(
     if process_count == 1:
         validator_service = SequentialValidatorService(disable_tracer)
     elif loop is not None and not loop.is_running():
-        validator_service = AsyncValidatorService(disable_tracer)
+        validator_service = AsyncValidatorService(disable_tracer, short_circuit)
     else:
         validator_service = SequentialValidatorService(disable_tracer)
 
@@ -1042,11 +1261,12 @@ async def async_validate(
     disable_tracer: Optional[bool] = True,
     path: Optional[str] = None,
     stream: Optional[bool] = False,
+    short_circuit: Optional[bool] = True,
     **kwargs,
 ) -> Tuple[Any, dict]:
     if path is None:
         path = "$"
-    validator_service = AsyncValidatorService(disable_tracer)
+    validator_service = AsyncValidatorService(disable_tracer, short_circuit)
     return await validator_service.async_validate(
         value, metadata, validator_map, iteration, path, path, stream, **kwargs
     )
@@ -1,4 +1,5 @@
 from .base import VectorDBBase
 from .faiss import Faiss
+from .memmap import MemmapVectorDB
 
-__all__ = ["VectorDBBase", "Faiss"]
+__all__ = ["VectorDBBase", "Faiss", "MemmapVectorDB"]
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 
 from guardrails.embedding import EmbeddingBase
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 # TODO Parameterize the init with the distance algorithm to use: cosine, L2, etc.
 class VectorDBBase(ABC):
@@ -19,18 +22,20 @@ class VectorDBBase(ABC):
         self._path = path
 
     @abstractmethod
-    def add_vectors(self, vectors: List[List[float]]) -> None:
+    def add_vectors(self, vectors: Union[List[List[float]], "np.ndarray"]) -> None:
         """Adds a list of vectors to the store.
 
         Args:
-            vectors: List of vectors to add.
+            vectors: List of vectors to add, ideally as a 2D float32 array.
         Returns:
             None
         """
         ...
 
     @abstractmethod
-    def similarity_search_vector(self, vector: List[float], k: int) -> List[int]:
+    def similarity_search_vector(
+        self, vector: Union[List[float], "np.ndarray"], k: int
+    ) -> List[int]:
         """Searches for vectors which are similar to the given vector.
 
         Args:
@@ -41,7 +46,7 @@ class VectorDBBase(ABC):
 
     @abstractmethod
     def similarity_search_vector_with_threshold(
-        self, vector: List[float], k: int, threshold: float
+        self, vector: Union[List[float], "np.ndarray"], k: int, threshold: float
     ) -> List[int]:
         """Searches for vectors which are similar to the given vector.
 
@@ -52,6 +57,21 @@ class VectorDBBase(ABC):
         """
         ...
 
+    def similarity_search_vector_batch(
+        self, vectors: Union[List[List[float]], "np.ndarray"], k: int
+    ) -> List[List[int]]:
+        """Searches for vectors which are similar to each of the given
+        vectors.
+
+        Args:
+            vectors: Vectors to search for.
+            k: Number of similar vectors to return per vector.
+
+        Returns:
+            List[List[int]] The indexes of the similar vectors for each vector.
+        """
+        return [self.similarity_search_vector(vector, k) for vector in vectors]
+
     def similarity_search(self, text: str, k: int) -> List[int]:
         """Searches for vectors which are similar to the given text.
         Args:
@@ -63,6 +83,24 @@ class VectorDBBase(ABC):
         vector = self._embedder.embed_query(text)
         return self.similarity_search_vector(vector, k)
 
+    def similarity_search_batch(self, texts: List[str], k: int) -> List[List[int]]:
+        """Searches for vectors which are similar to each of the given texts.
+
+        The texts are embedded together and searched for together, which
+        is much faster than calling `similarity_search` for each of them.
+
+        Args:
+            texts: Texts to search for.
+            k: Number of similar vectors to return per text.
+
+        Returns:
+            List[List[int]] The indexes of the similar vectors for each text.
+        """
+        if not texts:
+            return []
+        vectors = self._embedder.embed_queries(texts)
+        return self.similarity_search_vector_batch(vectors, k)
+
     def similarity_search_with_threshold(
         self, text: str, k: int, threshold: float
     ) -> List[int]:
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Union
 
 from guardrails.embedding import EmbeddingBase
 from guardrails.vectordb.base import VectorDBBase
@@ -10,12 +10,24 @@ try:
 except ImportError:
     pass
 
+if TYPE_CHECKING:
+    import numpy as np
+
+METRICS = {"l2": "METRIC_L2", "ip": "METRIC_INNER_PRODUCT"}
+
 faiss_error = (
     "`faiss` is required for using vectordb.faiss."
     "Install it with `poetry add faiss-cpu`."
 )
 
 
+def _as_query(vector: Union[List[float], "np.ndarray"]) -> "np.ndarray":
+    """A single vector as the 1 x d float32 matrix Faiss searches with."""
+    import numpy as np
+
+    return np.asarray(vector, dtype=np.float32).reshape(1, -1)
+
+
 class Faiss(VectorDBBase):
     def __init__(
         self, index: "Index", embedder: EmbeddingBase, path: Optional[str] = None
@@ -46,10 +58,114 @@ class Faiss(VectorDBBase):
             raise ImportError(faiss_error)
         return cls(faiss.IndexFlatIP(vector_dim), embedder, path)
 
+    @classmethod
+    def new_index_from_factory(
+        cls,
+        vector_dim: int,
+        description: str,
+        embedder: EmbeddingBase,
+        path: Optional[str] = None,
+        metric: str = "l2",
+    ):
+        """Creates a store backed by any index `faiss.index_factory` can
+        build, e.g. "IVF1024,Flat" or "HNSW32,Flat".
+
+        Args:
+            vector_dim: Dimension of the vectors.
+            description: The faiss index factory string.
+            embedder: EmbeddingBase instance to use for embedding the text.
+            path: Path to store or load the index.
+            metric: Either "l2" or "ip" (inner product).
+        """
+        try:
+            import faiss
+        except ImportError:
+            raise ImportError(faiss_error)
+        if metric not in METRICS:
+            raise ValueError(
+                f"Unknown metric {metric}; expected one of {', '.join(METRICS)}."
+            )
+        metric_type = getattr(faiss, METRICS[metric])
+        return cls(
+            faiss.index_factory(vector_dim, description, metric_type), embedder, path
+        )
+
+    @classmethod
+    def new_ivf_flat_index(
+        cls,
+        vector_dim: int,
+        embedder: EmbeddingBase,
+        path: Optional[str] = None,
+        *,
+        nlist: int = 1024,
+        nprobe: int = 8,
+        metric: str = "l2",
+    ):
+        """Creates an inverted file index that stores full vectors.
+
+        Vectors are clustered into `nlist` lists and each search only
+        scans the `nprobe` closest ones. The index must be trained
+        with `train` before vectors are added.
+        """
+        store = cls.new_index_from_factory(
+            vector_dim, f"IVF{nlist},Flat", embedder, path, metric
+        )
+        store.set_search_params(nprobe=nprobe)
+        return store
+
+    @classmethod
+    def new_ivf_pq_index(
+        cls,
+        vector_dim: int,
+        embedder: EmbeddingBase,
+        path: Optional[str] = None,
+        *,
+        nlist: int = 1024,
+        m: int = 16,
+        nbits: int = 8,
+        nprobe: int = 8,
+        metric: str = "l2",
+    ):
+        """Creates an inverted file index that stores product quantized
+        vectors, using `m` codes of `nbits` bits each per vector.
+
+        `vector_dim` must be a multiple of `m`. The index must be
+        trained with `train` before vectors are added.
+        """
+        store = cls.new_index_from_factory(
+            vector_dim, f"IVF{nlist},PQ{m}x{nbits}", embedder, path, metric
+        )
+        store.set_search_params(nprobe=nprobe)
+        return store
+
+    @classmethod
+    def new_hnsw_index(
+        cls,
+        vector_dim: int,
+        embedder: EmbeddingBase,
+        path: Optional[str] = None,
+        *,
+        m: int = 32,
+        ef_construction: int = 40,
+        ef_search: int = 16,
+        metric: str = "l2",
+    ):
+        """Creates a hierarchical navigable small world graph index with `m`
+        neighbours per node.
+
+        It doesn't need training.
+        """
+        store = cls.new_index_from_factory(
+            vector_dim, f"HNSW{m},Flat", embedder, path, metric
+        )
+        store._index.hnsw.efConstruction = ef_construction  # type: ignore
+        store.set_search_params(ef_search=ef_search)
+        return store
+
     @classmethod
     def new_flat_l2_index_from_embedding(
         cls,
-        embedding: List[List[float]],
+        embedding: Union[List[List[float]], "np.ndarray"],
         embedder: EmbeddingBase,
         path: Optional[str] = None,
     ):
@@ -60,34 +176,96 @@ class Faiss(VectorDBBase):
         return store
 
     @classmethod
-    def load(cls, path: str, embedder: EmbeddingBase):
+    def load(cls, path: str, embedder: EmbeddingBase, mmap: bool = False):
+        """Loads an index saved with `save`.
+
+        Args:
+            path: Path to the saved index.
+            embedder: EmbeddingBase instance to use for embedding the text.
+            mmap: Map the index's vectors from the file instead of reading
+                them into memory, so processes that load the same file
+                share them. The loaded index is read-only.
+        """
         if faiss is None:
             raise ImportError(faiss_error)
 
-        index = faiss.read_index(path)
+        if not mmap:
+            return cls(faiss.read_index(path), embedder, path)
+        # IO_FLAG_MMAP_IFC also maps flat indexes, but is only in newer faiss
+        mmap_flag = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP)
+        index = faiss.read_index(path, mmap_flag | faiss.IO_FLAG_READ_ONLY)
         return cls(index, embedder, path)
 
     def save(self, path: Optional[str] = None):
         write_path = path if path else self._path
         faiss.write_index(self._index, write_path)
 
-    def similarity_search_vector(self, vector: List[float], k: int) -> List[int]:
+    @property
+    def is_trained(self) -> bool:
+        return self._index.is_trained
+
+    def train(self, vectors: Union[List[List[float]], "np.ndarray"]) -> None:
+        """Trains the index on a representative sample of vectors.
+
+        Only needed for IVF indexes; a few dozen vectors per list is
+        usually enough.
+        """
         import numpy as np
 
+        self._index.train(np.asarray(vectors, dtype=np.float32))  # type: ignore
+
+    def train_on_texts(self, texts: List[str]) -> None:
+        """Embeds a sample of texts and trains the index on them."""
+        self.train(self._embedder.embed(texts))
+
+    def set_search_params(
+        self, *, nprobe: Optional[int] = None, ef_search: Optional[int] = None
+    ) -> None:
+        """Tunes the speed / recall trade off of future searches.
+
+        The values are stored in the index, so `save` persists them.
+
+        Args:
+            nprobe: How many inverted lists an IVF index scans.
+            ef_search: How many candidates an HNSW index keeps while searching.
+        """
+        import faiss
+
+        parameter_space = faiss.ParameterSpace()
+        if nprobe is not None:
+            parameter_space.set_index_parameter(self._index, "nprobe", nprobe)
+        if ef_search is not None:
+            parameter_space.set_index_parameter(self._index, "efSearch", ef_search)
+
+    def similarity_search_vector(
+        self, vector: Union[List[float], "np.ndarray"], k: int
+    ) -> List[int]:
         # FIXME is this correct usage of `search`?
         #  Arguments missing for parameters "k", "distances", "labels"
-        _, scores = self._index.search(np.array([vector]), k)  # type: ignore
+        _, scores = self._index.search(_as_query(vector), k)  # type: ignore
         return scores[0].tolist()
 
+    def similarity_search_vector_batch(
+        self, vectors: Union[List[List[float]], "np.ndarray"], k: int
+    ) -> List[List[int]]:
+        import numpy as np
+
+        queries = np.asarray(vectors, dtype=np.float32)
+        if len(queries) == 0:
+            return []
+        # One n x d search lets faiss spread the queries over its threads
+        _, indexes = self._index.search(queries.reshape(len(queries), -1), k)  # type: ignore
+        return indexes.tolist()
+
     def similarity_search_vector_with_threshold(
-        self, vector: List[float], k: int, threshold: float
+        self, vector: Union[List[float], "np.ndarray"], k: int, threshold: float
     ) -> List[int]:
         import numpy as np
 
         # Call faiss range search and get all the vectors with a score >= threshold
         # FIXME is this correct usage of `range_search`?
         #  Arguments missing for parameters "radius", "result"
-        _, dist, indexes = self._index.range_search(np.array([vector]), threshold)  # type: ignore
+        _, dist, indexes = self._index.range_search(_as_query(vector), threshold)  # type: ignore
 
         if len(indexes) == 0:
             return []
@@ -96,12 +274,13 @@ class Faiss(VectorDBBase):
         sorted_indexes = indexes[sorted_indices]
         return sorted_indexes.tolist()[:k]
 
-    def add_vectors(self, vectors: List[List[float]]) -> None:
+    def add_vectors(self, vectors: Union[List[List[float]], "np.ndarray"]) -> None:
         import numpy as np
 
         # FIXME is this correct usage of `add`?
         #  Arguments missing for parameters "x"
-        self._index.add(np.array(vectors))  # type: ignore
+        # Faiss works on float32; this doesn't copy if embed() already returned that
+        self._index.add(np.asarray(vectors, dtype=np.float32))  # type: ignore
 
     def last_index(self) -> int:
         return self._index.ntotal
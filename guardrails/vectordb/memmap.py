@@ -0,0 +1,269 @@
+"""memmap.py.
+
+A vector database whose vectors live in a memory-mapped file.
+
+Vectors are appended to a raw float32 file, one row per vector.  A
+write-ahead manifest next to it records each append before the vectors
+are written and again once they're on disk, so an append that was
+interrupted is simply discarded.  Readers only ever see committed
+vectors, which lets any number of processes open the same directory
+read-only and share the vectors through the OS page cache instead of
+each loading a copy.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
+
+from guardrails.embedding import EmbeddingBase
+from guardrails.vectordb.base import VectorDBBase
+
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+VECTORS_FILE_NAME = "vectors.f32"
+MANIFEST_FILE_NAME = "manifest.jsonl"
+
+# Rows compared against the queries at a time, to bound the memory a
+#   search needs no matter how many vectors are stored.
+SEARCH_CHUNK_SIZE = 65536
+
+
+class MemmapVectorDB(VectorDBBase):
+    """Stores vectors in a memory-mapped file and searches them exactly by
+    L2 distance, like a flat Faiss index.
+
+    Args:
+        embedder: EmbeddingBase instance to use for embedding the text.
+        path: The directory to keep the vectors and the manifest in.
+        vector_dim: Dimension of the vectors. Only required when the
+            directory doesn't hold a store yet.
+        read_only: Open an existing store for searching only.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbeddingBase,
+        path: str,
+        vector_dim: Optional[int] = None,
+        read_only: bool = False,
+    ) -> None:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "`numpy` is required for `MemmapVectorDB`."
+                "Please install it with `poetry add numpy`."
+            )
+
+        super().__init__(embedder, path)
+        self.read_only = read_only
+        self._vectors_path = os.path.join(path, VECTORS_FILE_NAME)
+        self._manifest_path = os.path.join(path, MANIFEST_FILE_NAME)
+
+        if not os.path.exists(self._manifest_path):
+            if read_only:
+                raise FileNotFoundError(f"No vector store found at {path}.")
+            if vector_dim is None:
+                raise ValueError("vector_dim is required to create a vector store.")
+            os.makedirs(path, exist_ok=True)
+            open(self._vectors_path, "ab").close()
+            self._write_manifest({"op": "create", "dim": vector_dim})
+
+        self._write_lock = threading.RLock()
+        self._write_lock_file = None
+        self._write_lock_depth = 0
+        self._dim = 0
+        self._committed = 0
+        self._manifest_position = 0
+        self._vectors: Optional["np.ndarray"] = None
+        self._norms: Optional["np.ndarray"] = None
+        self._refresh()
+        if vector_dim is not None and vector_dim != self._dim:
+            raise ValueError(
+                f"The vector store at {path} holds {self._dim} dimensional vectors,"
+                f" not {vector_dim}."
+            )
+
+    @classmethod
+    def load(cls, path: str, embedder: EmbeddingBase, read_only: bool = False):
+        return cls(embedder, path, read_only=read_only)
+
+    def save(self, path: Optional[str] = None):
+        """Appends are persisted as they're made, so there's nothing left to
+        write."""
+        if path is not None and path != self._path:
+            raise ValueError("MemmapVectorDB can only be saved to its own path.")
+
+    def last_index(self) -> int:
+        self._refresh()
+        return self._committed
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        """Lets one writer at a time, across threads and processes, append to
+        the store.
+
+        Held by add_vectors, and can be held around it, e.g. so the index
+        of the next vector doesn't change between reading it with
+        last_index() and adding the vectors.
+        """
+        if self.read_only:
+            raise ValueError("Cannot write to a read-only vector store.")
+        with self._write_lock:
+            if self._write_lock_depth == 0:
+                self._write_lock_file = open(self._manifest_path, "ab")
+                if fcntl is not None:
+                    fcntl.flock(self._write_lock_file.fileno(), fcntl.LOCK_EX)
+            self._write_lock_depth += 1
+            try:
+                yield
+            finally:
+                self._write_lock_depth -= 1
+                if self._write_lock_depth == 0:
+                    # Closing the file releases the lock
+                    self._write_lock_file.close()  # type: ignore
+                    self._write_lock_file = None
+
+    def add_vectors(self, vectors: Union[List[List[float]], "np.ndarray"]) -> None:
+        import numpy as np
+
+        if self.read_only:
+            raise ValueError("Cannot add vectors to a read-only vector store.")
+        data = np.asarray(vectors, dtype="<f4").reshape(-1, self._dim)
+        if len(data) == 0:
+            return
+
+        with self.write_lock(), open(self._manifest_path, "ab") as manifest_file:
+            # Another writer may have appended since we last looked
+            self._refresh()
+            entry = {"start": self._committed, "count": len(data)}
+            self._append_manifest(manifest_file, {"op": "begin", **entry})
+            with open(self._vectors_path, "r+b") as vectors_file:
+                # Drop whatever an interrupted append left behind
+                vectors_file.truncate(self._committed * self._dim * 4)
+                vectors_file.seek(0, os.SEEK_END)
+                vectors_file.write(data.tobytes())
+                vectors_file.flush()
+                os.fsync(vectors_file.fileno())
+            self._append_manifest(manifest_file, {"op": "commit", **entry})
+        self._refresh()
+
+    def similarity_search_vector(
+        self, vector: Union[List[float], "np.ndarray"], k: int
+    ) -> List[int]:
+        return self.similarity_search_vector_batch([vector], k)[0]
+
+    def similarity_search_vector_batch(
+        self, vectors: Union[List[List[float]], "np.ndarray"], k: int
+    ) -> List[List[int]]:
+        import numpy as np
+
+        queries = np.asarray(vectors, dtype=np.float32).reshape(-1, self._dim)
+        if len(queries) == 0:
+            return []
+        distances, indexes = self._search(queries, k)
+        # Pad with -1 like Faiss does when there are fewer than k vectors
+        padded = np.full((len(queries), k), -1, dtype=np.int64)
+        padded[:, : indexes.shape[1]] = indexes
+        return padded.tolist()
+
+    def similarity_search_vector_with_threshold(
+        self, vector: Union[List[float], "np.ndarray"], k: int, threshold: float
+    ) -> List[int]:
+        import numpy as np
+
+        query = np.asarray(vector, dtype=np.float32).reshape(1, self._dim)
+        distances, indexes = self._search(query, k)
+        # Squared L2 distances below the threshold, as Faiss' range_search
+        return indexes[0][distances[0] < threshold].tolist()
+
+    def _search(
+        self, queries: "np.ndarray", k: int
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """The squared L2 distances and indexes of the k nearest vectors to
+        each query, nearest first."""
+        import numpy as np
+
+        self._refresh()
+        best_distances = np.empty((len(queries), 0), dtype=np.float32)
+        best_indexes = np.empty((len(queries), 0), dtype=np.int64)
+        if self._vectors is None or k < 1:
+            return best_distances, best_indexes
+
+        query_norms = (queries**2).sum(axis=1, keepdims=True)
+        for start in range(0, self._committed, SEARCH_CHUNK_SIZE):
+            chunk = self._vectors[start : start + SEARCH_CHUNK_SIZE]
+            chunk_norms = self._norms[start : start + SEARCH_CHUNK_SIZE]  # type: ignore
+            distances = query_norms - 2 * queries @ chunk.T + chunk_norms
+            indexes = np.broadcast_to(
+                np.arange(start, start + len(chunk)), distances.shape
+            )
+            # Keep the k best of this chunk and the previous best
+            distances = np.concatenate([best_distances, distances], axis=1)
+            indexes = np.concatenate([best_indexes, indexes], axis=1)
+            if distances.shape[1] > k:
+                top = np.argpartition(distances, k - 1, axis=1)[:, :k]
+                distances = np.take_along_axis(distances, top, axis=1)
+                indexes = np.take_along_axis(indexes, top, axis=1)
+            best_distances, best_indexes = distances, indexes
+
+        order = np.argsort(best_distances, axis=1, kind="stable")
+        return (
+            np.take_along_axis(best_distances, order, axis=1),
+            np.take_along_axis(best_indexes, order, axis=1),
+        )
+
+    def _refresh(self) -> None:
+        """Pick up appends committed since we last looked, including those
+        made by other processes, and map the new vectors."""
+        import numpy as np
+
+        committed = self._committed
+        with open(self._manifest_path, "rb") as manifest_file:
+            manifest_file.seek(self._manifest_position)
+            for line in manifest_file:
+                if not line.endswith(b"\n"):
+                    # Still being written; read it next time
+                    break
+                self._manifest_position += len(line)
+                entry = json.loads(line)
+                if entry["op"] == "create":
+                    self._dim = entry["dim"]
+                elif entry["op"] == "commit":
+                    committed = entry["start"] + entry["count"]
+
+        if committed == self._committed and self._vectors is not None:
+            return
+        previous = self._committed
+        self._committed = committed
+        if committed == 0:
+            return
+        # Read-only maps are backed by the page cache, so every process
+        #   that opens the store shares the same memory.
+        self._vectors = np.memmap(
+            self._vectors_path, dtype="<f4", mode="r", shape=(committed, self._dim)
+        )
+        new_norms = (self._vectors[previous:] ** 2).sum(axis=1)
+        self._norms = (
+            new_norms
+            if self._norms is None
+            else np.concatenate([self._norms[:previous], new_norms])
+        )
+
+    def _write_manifest(self, entry: dict) -> None:
+        with open(self._manifest_path, "ab") as manifest_file:
+            self._append_manifest(manifest_file, entry)
+
+    @staticmethod
+    def _append_manifest(manifest_file, entry: dict) -> None:
+        manifest_file.write(json.dumps(entry).encode("utf-8") + b"\n")
+        manifest_file.flush()
+        os.fsync(manifest_file.fileno())
@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 
 import pytest
 
@@ -26,7 +27,7 @@ def test_text2sql_with_examples(conn_str: str, schema_path: str, examples: str,
     # Mock the call to the OpenAI API.
     mocker.patch(
         "guardrails.embedding.OpenAIEmbedding._get_embedding",
-        new=lambda *args, **kwargs: [[0.1] * 1536],
+        new=lambda self, texts: [[0.1] * 1536 for _ in texts],
     )
 
     if examples is not None:
@@ -44,3 +45,51 @@ def test_text2sql_with_coro():
     s = Text2Sql("sqlite://", llm_api=mock_llm)
     with pytest.raises(ValueError):
         s("")
+
+
+def test_text2sql_batch(mocker):
+    s = Text2Sql("sqlite://", llm_api=lambda *args, **kwargs: "")
+    s.store = mocker.Mock()
+    s.store.search_batch.return_value = [[], []]
+    mock_guard = mocker.Mock()
+    mock_guard.side_effect = lambda *args, prompt_params, **kwargs: mocker.Mock(
+        validated_output={"generated_sql": prompt_params["nl_instruction"]}
+    )
+    s.guard = mock_guard
+
+    assert s(["first", "second"]) == ["first", "second"]
+    assert s("third") == "third"
+    s.store.search_batch.assert_any_call(["first", "second"], 2)
+
+
+def test_text2sql_batch_is_concurrent(mocker):
+    s = Text2Sql("sqlite://", llm_api=lambda *args, **kwargs: "", max_concurrency=2)
+    s.store = None
+    # Each question waits for the other one, so this only passes when they
+    #   are asked at the same time
+    both_asked = threading.Barrier(2, timeout=5)
+
+    def guard(*args, prompt_params, **kwargs):
+        both_asked.wait()
+        return mocker.Mock(
+            validated_output={"generated_sql": prompt_params["nl_instruction"]}
+        )
+
+    s.guard = mocker.Mock(side_effect=guard)
+
+    assert s(["first", "second"]) == ["first", "second"]
+
+
+def test_text2sql_options(mocker):
+    s = Text2Sql(
+        "sqlite://",
+        llm_api=lambda *args, **kwargs: "",
+        schema_ttl=None,
+        validation_mode="explain",
+    )
+    assert s.sql_driver.validation_mode == "explain"
+
+    get_schema = mocker.spy(s.sql_driver, "get_schema")
+    s.sql_schema = "CREATE TABLE pinned (id INTEGER);"
+    assert s.sql_schema == "CREATE TABLE pinned (id INTEGER);"
+    get_schema.assert_not_called()
@@ -1,10 +1,13 @@
 import os
+import sys
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 from openai.version import VERSION
 
-from guardrails.embedding import OpenAIEmbedding
+from guardrails.embedding import ManifestEmbedding, OpenAIEmbedding
+from guardrails.stores.embedding_cache import EmbeddingCache
 
 OPENAI_VERSION = VERSION
 
@@ -60,7 +63,7 @@ class TestOpenAIEmbedding:
         instance = OpenAIEmbedding()
         instance._get_embedding = Mock(return_value=[[1.0, 2.0, 3.0]])
         result = instance.embed_query("test query")
-        assert result == [1.0, 2.0, 3.0]
+        assert result.tolist() == [1.0, 2.0, 3.0]
 
     def test__get_embedding(self, mocker):
         mock_environ = mocker.patch("os.environ.get")
@@ -116,3 +119,112 @@ def test_output_dim_for_unknown_model(openai_embeddings_instance):
     openai_embeddings_instance._model = "unknown-model"
     with pytest.raises(ValueError):
         openai_embeddings_instance.output_dim
+
+
+def fake_chunked_tokens_with_counts(text, encoding_name, chunk_length):
+    # One "token" per word
+    words = text.split()
+    for i in range(0, len(words), chunk_length):
+        chunk = words[i : i + chunk_length]
+        yield " ".join(chunk), len(chunk)
+
+
+def test_embed_batches_chunks_across_texts(mocker):
+    mocker.patch(
+        "guardrails.embedding.EmbeddingBase._chunked_tokens_with_counts",
+        side_effect=fake_chunked_tokens_with_counts,
+    )
+    instance = OpenAIEmbedding(max_tokens=2, batch_size=3, api_key="test_api_key")
+    instance._get_embedding = Mock(
+        side_effect=lambda batch: [[float(len(chunk)), 0.0] for chunk in batch]
+    )
+
+    result = instance.embed(["a b c", "d e", "f g h i j"])
+
+    # 6 chunks in batches of at most 3
+    assert [call.args[0] for call in instance._get_embedding.call_args_list] == [
+        ["a b", "c", "d e"],
+        ["f g", "h i", "j"],
+    ]
+    assert result.dtype == np.float32
+    assert result.tolist() == [[1.0, 0.0], [1.0, 0.0], [1.0, 0.0]]
+
+
+def test_embed_respects_max_batch_tokens(mocker):
+    mocker.patch(
+        "guardrails.embedding.EmbeddingBase._chunked_tokens_with_counts",
+        side_effect=fake_chunked_tokens_with_counts,
+    )
+    instance = OpenAIEmbedding(
+        max_tokens=2, max_batch_tokens=3, max_concurrency=2, api_key="test_api_key"
+    )
+    instance._get_embedding = Mock(
+        side_effect=lambda batch: [[0.0, 1.0] for _ in batch]
+    )
+
+    result = instance.embed(["a b c", "d e"])
+
+    batches = sorted(call.args[0] for call in instance._get_embedding.call_args_list)
+    assert batches == [["a b", "c"], ["d e"]]
+    assert result.tolist() == [[0.0, 1.0], [0.0, 1.0]]
+
+
+def test_len_safe_get_embedding_weights_chunks(mocker):
+    mocker.patch(
+        "guardrails.embedding.EmbeddingBase._chunked_tokens_with_counts",
+        side_effect=fake_chunked_tokens_with_counts,
+    )
+    instance = OpenAIEmbedding(max_tokens=2, api_key="test_api_key")
+    embedder = Mock(return_value=[[3.0, 0.0], [0.0, 1.0]])
+
+    # "a b" is weighted 3 times as much as "c"
+    result = instance._len_safe_get_embedding("a b c", embedder)
+
+    embedder.assert_called_once_with(["a b", "c"])
+    expected = np.array([9.0, 1.0]) / np.linalg.norm([9.0, 1.0])
+    np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+    chunk_embeddings = instance._len_safe_get_embedding(
+        "a b c", embedder, average=False
+    )
+    assert chunk_embeddings.tolist() == [3.0, 0.0, 0.0, 1.0]
+
+
+def test_embed_queries_batches_requests():
+    instance = OpenAIEmbedding(batch_size=2, api_key="test_api_key")
+    instance._get_embedding = Mock(
+        side_effect=lambda batch: [[float(len(query))] for query in batch]
+    )
+
+    result = instance.embed_queries(["a", "bb", "ccc"])
+
+    assert [call.args[0] for call in instance._get_embedding.call_args_list] == [
+        ["a", "bb"],
+        ["ccc"],
+    ]
+    assert result.dtype == np.float32
+    assert result.tolist() == [[1.0], [2.0], [3.0]]
+
+
+@pytest.mark.parametrize("cache", [None, EmbeddingCache()])
+@pytest.mark.parametrize("model", ["text-embedding-ada-002", "text-embedding-3-small"])
+def test_embed_nothing(cache, model):
+    instance = OpenAIEmbedding(model=model, api_key="test_api_key", cache=cache)
+    instance._get_embedding = Mock()
+
+    for result in (instance.embed([]), instance.embed_queries([])):
+        assert result.dtype == np.float32
+        assert result.shape == (0, 0)
+    assert instance._len_safe_get_embeddings([], Mock(), average=False) == []
+    instance._get_embedding.assert_not_called()
+
+
+def test_manifest_embed_nothing(mocker):
+    manifest = Mock()
+    mocker.patch.dict(sys.modules, {"manifest": manifest})
+    instance = ManifestEmbedding()
+
+    for result in (instance.embed([]), instance.embed_queries([])):
+        assert result.dtype == np.float32
+        assert result.shape == (0, 0)
+    manifest.Manifest.return_value.run.assert_not_called()
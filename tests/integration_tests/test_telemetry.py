@@ -23,17 +23,17 @@ class TestTelemetry:
     def test_private_traces_go_to_user_telem_sink(self, mocker):
         private_exporter = InMemorySpanExporter()
         mocker.patch(
-            "guardrails.telemetry.default_otel_collector_tracer_mod.OTLPSpanExporter",
+            "opentelemetry.exporter.otlp.proto.grpc.trace_exporter.OTLPSpanExporter",
             return_value=private_exporter,
         )
         mocker.patch(
-            "guardrails.telemetry.default_otel_collector_tracer_mod.BatchSpanProcessor",
+            "opentelemetry.sdk.trace.export.BatchSpanProcessor",
             return_value=SimpleSpanProcessor(private_exporter),
         )
 
         hub_exporter = InMemorySpanExporter()
         mocker.patch(
-            "guardrails.utils.hub_telemetry_utils.OTLPSpanExporter",
+            "opentelemetry.exporter.otlp.proto.http.trace_exporter.OTLPSpanExporter",
             return_value=hub_exporter,
         )
 
@@ -68,17 +68,17 @@ class TestTelemetry:
     def test_hub_traces_go_to_hub_telem_sink(self, mocker):
         private_exporter = InMemorySpanExporter()
         mocker.patch(
-            "guardrails.telemetry.default_otel_collector_tracer_mod.OTLPSpanExporter",
+            "opentelemetry.exporter.otlp.proto.grpc.trace_exporter.OTLPSpanExporter",
             return_value=private_exporter,
         )
         mocker.patch(
-            "guardrails.telemetry.default_otel_collector_tracer_mod.BatchSpanProcessor",
+            "opentelemetry.sdk.trace.export.BatchSpanProcessor",
             return_value=SimpleSpanProcessor(private_exporter),
         )
 
         hub_exporter = InMemorySpanExporter()
         mocker.patch(
-            "guardrails.utils.hub_telemetry_utils.OTLPSpanExporter",
+            "opentelemetry.exporter.otlp.proto.http.trace_exporter.OTLPSpanExporter",
             return_value=hub_exporter,
         )
 
@@ -104,17 +104,17 @@ class TestTelemetry:
     def test_no_cross_contamination(self, mocker):
         private_exporter = InMemorySpanExporter()
         mocker.patch(
-            "guardrails.telemetry.default_otel_collector_tracer_mod.OTLPSpanExporter",
+            "opentelemetry.exporter.otlp.proto.grpc.trace_exporter.OTLPSpanExporter",
             return_value=private_exporter,
         )
         mocker.patch(
-            "guardrails.telemetry.default_otel_collector_tracer_mod.BatchSpanProcessor",
+            "opentelemetry.sdk.trace.export.BatchSpanProcessor",
             return_value=SimpleSpanProcessor(private_exporter),
         )
 
         hub_exporter = InMemorySpanExporter()
         mock_hub_otlp_span_exporter = mocker.patch(
-            "guardrails.utils.hub_telemetry_utils.OTLPSpanExporter"
+            "opentelemetry.exporter.otlp.proto.http.trace_exporter.OTLPSpanExporter"
         )
         mock_hub_otlp_span_exporter.return_value = hub_exporter
 
@@ -2,7 +2,7 @@ from typing import Union
 
 import pytest
 
-from guardrails.classes.generic.stack import Stack
+from guardrails.classes.generic.stack import LazyStack, Stack
 
 
 @pytest.mark.parametrize(
@@ -98,3 +98,40 @@ def test_length():
 
     stack.push(1)
     assert stack.length == 1
+
+
+def test_lazy_stack_loads_on_first_use():
+    stack = LazyStack(1)
+    loads = []
+    stack.defer(lambda: loads.append("load") or [2, 3])
+    stack.defer(lambda: [4])
+
+    assert loads == []
+
+    stack.push(5)
+    assert loads == ["load"]
+    assert stack == [1, 2, 3, 4, 5]
+    assert stack.last == 5
+
+
+@pytest.mark.parametrize(
+    "use",
+    [len, list, bool, lambda s: s[0], lambda s: 2 in s, lambda s: s.pop()],
+)
+def test_lazy_stack_reads_load(use):
+    stack = LazyStack()
+    stack.defer(lambda: [2])
+
+    use(stack)
+
+    assert stack._loaders == []
+
+
+def test_lazy_stack_clear_drops_pending():
+    stack = LazyStack(1)
+    stack.defer(lambda: [2])
+
+    stack.clear()
+
+    assert stack.empty()
+    assert stack._loaders == []
@@ -197,3 +197,13 @@ def test_non_empty_initialization():
     # TODO: How to do shallow comparison
     # assert call.tree == "something"
     assert call.tree is not None
+
+
+def test_timings():
+    first = Iteration(call_id="mock-call", index=0)
+    first.timings.update({"llm_call": 100, "validation": 20, "reask_setup": 5})
+    second = Iteration(call_id="mock-call", index=1)
+    second.timings.update({"llm_call": 50, "validation": 10})
+    call = Call(iterations=Stack(first, second))
+
+    assert call.timings == {"llm_call": 150, "validation": 30, "reask_setup": 5}
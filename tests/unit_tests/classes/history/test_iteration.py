@@ -1,6 +1,7 @@
 from guardrails.classes.generic.stack import Stack
 from guardrails.classes.history.inputs import Inputs
 from guardrails.classes.history.iteration import Iteration
+from guardrails.classes.history.timings import Stage
 from guardrails.classes.history.outputs import Outputs
 from guardrails.constants import error_status, not_run_status
 from guardrails.llm_providers import OpenAICallable
@@ -114,3 +115,13 @@ def test_non_empty_initialization():
     assert iteration.validator_logs == validator_logs
     assert iteration.error == error
     assert iteration.status == error_status
+
+
+def test_add_timing():
+    iteration = Iteration(call_id="mock-call", index=0)
+
+    start = iteration.add_timing(Stage.PARSE, 0)
+    end = iteration.add_timing(Stage.PARSE, start)
+
+    assert end >= start
+    assert iteration.timings == {"parse": end}
@@ -18,7 +18,7 @@ class TestInstall:
         )
 
     def test_install_local_models__false(self, mocker):
-        mock_install = mocker.patch("guardrails.hub.install.install")
+        mock_install = mocker.patch("guardrails.hub.install.install_multiple")
         runner = CliRunner()
         result = runner.invoke(
             hub_command,
@@ -26,7 +26,7 @@ class TestInstall:
         )
 
         mock_install.assert_called_once_with(
-            "hub://guardrails/test-validator",
+            ["hub://guardrails/test-validator"],
             install_local_models=False,
             quiet=ANY,
             upgrade=False,
@@ -36,14 +36,14 @@ class TestInstall:
         assert result.exit_code == 0
 
     def test_install_local_models__true(self, mocker):
-        mock_install = mocker.patch("guardrails.hub.install.install")
+        mock_install = mocker.patch("guardrails.hub.install.install_multiple")
         runner = CliRunner()
         result = runner.invoke(
             hub_command,
             ["install", "hub://guardrails/test-validator", "--install-local-models"],
         )
         mock_install.assert_called_once_with(
-            "hub://guardrails/test-validator",
+            ["hub://guardrails/test-validator"],
             install_local_models=True,
             quiet=False,
             upgrade=False,
@@ -53,14 +53,14 @@ class TestInstall:
         assert result.exit_code == 0
 
     def test_install_local_models__none(self, mocker):
-        mock_install = mocker.patch("guardrails.hub.install.install")
+        mock_install = mocker.patch("guardrails.hub.install.install_multiple")
         runner = CliRunner()
         result = runner.invoke(
             hub_command,
             ["install", "hub://guardrails/test-validator"],
         )
         mock_install.assert_called_once_with(
-            "hub://guardrails/test-validator",
+            ["hub://guardrails/test-validator"],
             install_local_models=None,
             quiet=False,
             upgrade=False,
@@ -70,14 +70,14 @@ class TestInstall:
         assert result.exit_code == 0
 
     def test_install_quiet(self, mocker):
-        mock_install = mocker.patch("guardrails.hub.install.install")
+        mock_install = mocker.patch("guardrails.hub.install.install_multiple")
         runner = CliRunner()
         result = runner.invoke(
             hub_command, ["install", "hub://guardrails/test-validator", "--quiet"]
         )
 
         mock_install.assert_called_once_with(
-            "hub://guardrails/test-validator",
+            ["hub://guardrails/test-validator"],
             install_local_models=None,
             quiet=True,
             upgrade=False,
@@ -256,14 +256,14 @@ class TestPipProcess:
             sys_exit_spy.assert_called_once_with(1)
 
     def test_install_with_upgrade_flag(self, mocker):
-        mock_install = mocker.patch("guardrails.hub.install.install")
+        mock_install = mocker.patch("guardrails.hub.install.install_multiple")
         runner = CliRunner()
         result = runner.invoke(
             hub_command, ["install", "--upgrade", "hub://guardrails/test-validator"]
         )
 
         mock_install.assert_called_once_with(
-            "hub://guardrails/test-validator",
+            ["hub://guardrails/test-validator"],
             install_local_models=None,
             quiet=False,
             install_local_models_confirm=ANY,
@@ -1,6 +1,35 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from guardrails.validator_base import (
+    FailResult,
+    PassResult,
+    Validator,
+    register_validator,
+)
 from tests.unit_tests.mocks.mock_file import MockFile
 
 
+@register_validator(name="test-batch-is-upper", data_type="string")
+class IsUpper(Validator):
+    def validate(self, value, metadata):
+        if value.isupper():
+            return PassResult()
+        return FailResult(error_message="Value must be upper case.")
+
+
+BATCH_RAIL = """<rail version="0.1">
+<output
+    type="string"
+    validators="test-batch-is-upper"
+    on-fail-test-batch-is-upper="noop"
+/>
+</rail>"""
+
+
 def test_validate(mocker):
     mocker.patch("nltk.data.find")
     mocker.patch("nltk.download")
@@ -23,7 +52,7 @@ def test_validate(mocker):
 
     from guardrails.cli.validate import validate
 
-    response = validate("my_spec.rail", "output", out="somewhere")
+    response = validate("my_spec.rail", "output", out="somewhere", batch=None)
 
     mock_validate_llm_output.assert_called_once_with("my_spec.rail", "output")
 
@@ -64,3 +93,91 @@ def test_validate_llm_output(mocker):
     parse_mock.assert_called_once_with("output")
 
     assert response == "validated output"
+
+
+def test_validate_batch(tmp_path):
+    rail = tmp_path / "batch.rail"
+    rail.write_text(BATCH_RAIL)
+    lines = [
+        '"HELLO"\n',
+        "\n",
+        '{"llm_output": "hello", "metadata": {}}\n',
+        "not json\n",
+        '{"llm_output": 1}\n',
+        '"WORLD"\n',
+    ]
+
+    from guardrails.cli.validate import validate_batch
+
+    output = io.StringIO()
+    summary = validate_batch(str(rail), lines, output, concurrency=2)
+
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    # One result per record, blank lines skipped, in input order
+    assert [r["validated_output"] for r in results] == [
+        "HELLO",
+        "hello",
+        None,
+        None,
+        "WORLD",
+    ]
+    assert [r["validation_passed"] for r in results] == [
+        True,
+        False,
+        False,
+        False,
+        True,
+    ]
+    assert results[2]["error"] is not None
+    assert results[3]["error"] is not None
+
+    assert (summary.records, summary.passed, summary.failed, summary.errored) == (
+        5,
+        2,
+        1,
+        2,
+    )
+    assert summary.failure_rate == 3 / 5
+    assert "5 records" in str(summary)
+
+
+def test_validate_batch_reads_off_the_event_loop(tmp_path):
+    rail = tmp_path / "batch.rail"
+    rail.write_text(BATCH_RAIL)
+
+    def records():
+        for line in ['"HELLO"\n', '"hello"\n']:
+            # Reading stdin would block every record being validated
+            with pytest.raises(RuntimeError):
+                asyncio.get_running_loop()
+            yield line
+
+    from guardrails.cli.validate import validate_batch
+
+    output = io.StringIO()
+    summary = validate_batch(str(rail), records(), output)
+
+    assert (summary.records, summary.passed, summary.failed) == (2, 1, 1)
+
+
+def test_validate_batch_command(runner, tmp_path, mocker):
+    mocker.patch("guardrails.cli.validate.trace_if_enabled")
+    rail = tmp_path / "batch.rail"
+    rail.write_text(BATCH_RAIL)
+    records = tmp_path / "records.jsonl"
+    records.write_text('"HELLO"\n"hello"\n')
+
+    from guardrails.cli import cli
+
+    result = runner.invoke(cli, ["validate", str(rail), "--batch", str(records)])
+
+    assert result.exit_code == 0
+    assert result.stdout.splitlines()[:2] == [
+        json.dumps(
+            {"validation_passed": True, "validated_output": "HELLO", "error": None}
+        ),
+        json.dumps(
+            {"validation_passed": False, "validated_output": "hello", "error": None}
+        ),
+    ]
+    assert "2 records" in result.output
@@ -7,7 +7,7 @@ from guardrails.hub.validator_package_service import (
     InvalidHubInstallURL,
 )
 
-from guardrails.hub.install import LocalModelFlagNotSet, install
+from guardrails.hub.install import LocalModelFlagNotSet, install, install_multiple
 
 
 @pytest.mark.parametrize(
@@ -441,3 +441,164 @@ class TestInstall:
 
         assert mock_logger_log.call_count == 3
         mock_logger_log.assert_has_calls(log_calls)
+
+
+class TestInstallMultiple:
+    def setup_method(self):
+        self.manifests = {
+            name: Manifest.from_dict(
+                {
+                    "id": f"guardrails/{name}",
+                    "name": name,
+                    "author": {"name": "me", "email": "me@me.me"},
+                    "maintainers": [],
+                    "repository": {"url": f"https://github.com/guardrails/{name}"},
+                    "namespace": "guardrails",
+                    "packageName": name,
+                    "moduleName": "validator",
+                    "description": "test-description",
+                    "exports": [name.title().replace("-", "")],
+                    "tags": {"hasGuardrailsEndpoint": False},
+                }
+            )
+            for name in ["first-validator", "second-validator", "third-validator"]
+        }
+        self.site_packages = "./.venv/lib/python3.X/site-packages"
+
+    def test_installs_in_parallel_and_skips_installed(self, mocker):
+        service = "guardrails.hub.validator_package_service.ValidatorPackageService"
+        mocker.patch(
+            "guardrails.hub.install.Credentials.has_rc_file", return_value=False
+        )
+        get_cached_manifest = mocker.patch(
+            f"{service}.get_cached_manifest",
+            side_effect=lambda name, ttl: self.manifests[name.split("/")[1]],
+        )
+        mocker.patch(
+            f"{service}.get_site_packages_location", return_value=self.site_packages
+        )
+        mocker.patch(
+            f"{service}.get_pinned_install_url",
+            side_effect=lambda manifest, logger: f"git+{manifest.name}@commit",
+        )
+        mocker.patch(
+            f"{service}.is_installed",
+            side_effect=lambda manifest, _, install_url: (
+                install_url == "git+second-validator@commit"
+            ),
+        )
+        install_from_cache = mocker.patch(
+            f"{service}.install_hub_module_from_cache",
+            side_effect=lambda manifest, *args, **kwargs: ["rstr", manifest.name],
+        )
+        install_requirements = mocker.patch(f"{service}.install_requirements")
+        run_post_install = mocker.patch(f"{service}.run_post_install")
+        write_install_record = mocker.patch(f"{service}.write_install_record")
+        add_to_hub_inits = mocker.patch(f"{service}.add_to_hub_inits")
+        get_validator_from_manifest = mocker.patch(
+            f"{service}.get_validator_from_manifest",
+            side_effect=lambda manifest: MagicMock(name=manifest.name),
+        )
+
+        installed = install_multiple(
+            [
+                "hub://guardrails/first-validator",
+                "hub://guardrails/second-validator",
+                "hub://guardrails/third-validator",
+            ],
+            install_local_models=True,
+        )
+
+        assert get_cached_manifest.call_count == 3
+        first, second, third = self.manifests.values()
+
+        # second-validator is already installed at this version
+        assert [c.args[0] for c in install_from_cache.call_args_list] == [first, third]
+        assert install_from_cache.call_args.args[2] == "git+third-validator@commit"
+        install_requirements.assert_called_once_with(
+            ["rstr", "first-validator", "rstr", "third-validator"],
+            quiet=True,
+            logger=ANY,
+        )
+        assert [c.args[0] for c in run_post_install.call_args_list] == [first, third]
+        assert [c.args for c in write_install_record.call_args_list] == [
+            (first, self.site_packages, "git+first-validator@commit"),
+            (third, self.site_packages, "git+third-validator@commit"),
+        ]
+
+        # Every validator is still importable from guardrails.hub
+        assert [c.args[0] for c in add_to_hub_inits.call_args_list] == [
+            first,
+            second,
+            third,
+        ]
+        assert get_validator_from_manifest.call_count == 3
+        assert [module.__validator_exports__ for module in installed] == [
+            ["FirstValidator"],
+            ["SecondValidator"],
+            ["ThirdValidator"],
+        ]
+
+    def test_upgrade_bypasses_cache(self, mocker):
+        service = "guardrails.hub.validator_package_service.ValidatorPackageService"
+        mocker.patch(
+            "guardrails.hub.install.Credentials.has_rc_file", return_value=False
+        )
+        get_cached_manifest = mocker.patch(
+            f"{service}.get_cached_manifest",
+            return_value=self.manifests["first-validator"],
+        )
+        mocker.patch(
+            f"{service}.get_site_packages_location", return_value=self.site_packages
+        )
+        mocker.patch(f"{service}.get_pinned_install_url", return_value=None)
+        is_installed = mocker.patch(f"{service}.is_installed", return_value=True)
+        install_from_cache = mocker.patch(
+            f"{service}.install_hub_module_from_cache", return_value=[]
+        )
+        mocker.patch(f"{service}.install_requirements")
+        run_post_install = mocker.patch(f"{service}.run_post_install")
+        mocker.patch(f"{service}.write_install_record")
+        mocker.patch(f"{service}.add_to_hub_inits")
+        mocker.patch(f"{service}.get_validator_from_manifest")
+
+        install_multiple(
+            ["hub://guardrails/first-validator", "hub://guardrails/second-validator"],
+            install_local_models=False,
+            upgrade=True,
+        )
+
+        get_cached_manifest.assert_any_call("guardrails/first-validator", ttl=0)
+        get_cached_manifest.assert_any_call("guardrails/second-validator", ttl=0)
+        is_installed.assert_not_called()
+        assert install_from_cache.call_args.kwargs["upgrade"] is True
+        run_post_install.assert_not_called()
+
+    def test_single_validator_uses_cache(self, mocker):
+        service = "guardrails.hub.validator_package_service.ValidatorPackageService"
+        mocker.patch(
+            "guardrails.hub.install.Credentials.has_rc_file", return_value=False
+        )
+        mocker.patch(
+            f"{service}.get_cached_manifest",
+            return_value=self.manifests["first-validator"],
+        )
+        mocker.patch(
+            f"{service}.get_site_packages_location", return_value=self.site_packages
+        )
+        mocker.patch(f"{service}.get_pinned_install_url", return_value="git+x@commit")
+        mocker.patch(f"{service}.is_installed", return_value=True)
+        install_hub_module = mocker.patch(f"{service}.install_hub_module")
+        install_from_cache = mocker.patch(f"{service}.install_hub_module_from_cache")
+        mocker.patch(f"{service}.install_requirements")
+        mocker.patch(f"{service}.write_install_record")
+        mocker.patch(f"{service}.add_to_hub_inits")
+        mocker.patch(f"{service}.get_validator_from_manifest")
+
+        install_multiple(
+            ["hub://guardrails/first-validator"], install_local_models=False
+        )
+
+        # Already installed from this commit
+        install_hub_module.assert_not_called()
+        install_from_cache.assert_not_called()
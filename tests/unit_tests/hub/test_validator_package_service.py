@@ -1,3 +1,5 @@
+import json
+import os
 from pathlib import Path
 import pytest
 import sys
@@ -692,3 +694,197 @@ class TestValidatorPackageService:
             call("install", "pydash>=7.0.6,<8.0.0", quiet=False),
         ]
         mock_pip_process.assert_has_calls(pip_calls)
+
+
+class TestHubCache:
+    def setup_method(self):
+        self.manifest = Manifest.from_dict(
+            {
+                "id": "guardrails/test-validator",
+                "name": "name",
+                "author": {"name": "me", "email": "me@me.me"},
+                "maintainers": [],
+                "repository": {"url": "https://github.com/guardrails/test-validator"},
+                "namespace": "guardrails",
+                "packageName": "test-validator",
+                "moduleName": "validator",
+                "description": "description",
+                "exports": ["TestValidator"],
+                "tags": {},
+            }
+        )
+
+    def test_get_cached_manifest(self, mocker, monkeypatch, tmp_path):
+        monkeypatch.setenv("GUARDRAILS_HUB_CACHE_DIR", str(tmp_path))
+        mock_get_validator_manifest = mocker.patch(
+            "guardrails.hub.validator_package_service.get_validator_manifest",
+            return_value=self.manifest,
+        )
+
+        first = ValidatorPackageService.get_cached_manifest("guardrails/test-validator")
+        second = ValidatorPackageService.get_cached_manifest(
+            "guardrails/test-validator"
+        )
+        assert first == second == self.manifest
+        mock_get_validator_manifest.assert_called_once_with("guardrails/test-validator")
+
+        # A ttl of 0 always fetches a fresh manifest
+        ValidatorPackageService.get_cached_manifest("guardrails/test-validator", ttl=0)
+        assert mock_get_validator_manifest.call_count == 2
+
+    def test_get_cached_wheel(self, mocker, monkeypatch, tmp_path):
+        monkeypatch.setenv("GUARDRAILS_HUB_CACHE_DIR", str(tmp_path))
+
+        def build_wheel(action, package, flags, quiet):
+            wheel_directory = flags[0].replace("--wheel-dir=", "")
+            os.makedirs(wheel_directory, exist_ok=True)
+            open(os.path.join(wheel_directory, "validator-0.1-py3-none-any.whl"), "w")
+
+        mock_pip_process = mocker.patch(
+            "guardrails.hub.validator_package_service.pip_process",
+            side_effect=build_wheel,
+        )
+
+        install_url = f"git+https://github.com/guardrails/test-validator@{'a' * 40}"
+        wheel = ValidatorPackageService.get_cached_wheel(self.manifest, install_url)
+        assert wheel.endswith("validator-0.1-py3-none-any.whl")
+        assert (
+            ValidatorPackageService.get_cached_wheel(self.manifest, install_url)
+            == wheel
+        )
+        mock_pip_process.assert_called_once_with(
+            "wheel",
+            install_url,
+            [f"--wheel-dir={os.path.dirname(wheel)}", "--no-deps"],
+            quiet=False,
+        )
+
+        # Upgrading rebuilds it
+        ValidatorPackageService.get_cached_wheel(
+            self.manifest, install_url, upgrade=True
+        )
+        assert mock_pip_process.call_count == 2
+
+        # So does a new commit
+        new_install_url = install_url.replace("a" * 40, "b" * 40)
+        ValidatorPackageService.get_cached_wheel(self.manifest, new_install_url)
+        assert mock_pip_process.call_count == 3
+
+    def test_get_pinned_install_url(self, mocker):
+        mock_run = mocker.patch(
+            "guardrails.hub.validator_package_service.subprocess.run",
+            return_value=mocker.Mock(
+                stdout=f"{'a' * 40}\trefs/heads/main\n"
+                f"{'b' * 40}\trefs/tags/main\n"
+                f"{'c' * 40}\trefs/tags/v1\n"
+                f"{'d' * 40}\trefs/tags/v1^{{}}\n"
+            ),
+        )
+        repo_url = "https://github.com/guardrails/test-validator"
+
+        self.manifest.repository.branch = "main"
+        assert ValidatorPackageService.get_pinned_install_url(self.manifest) == (
+            f"git+{repo_url}@{'a' * 40}"
+        )
+        assert mock_run.call_args.args[0] == ["git", "ls-remote", repo_url, "main"]
+
+        # Annotated tags resolve to the commit they point to
+        self.manifest.repository.branch = "v1"
+        assert ValidatorPackageService.get_pinned_install_url(self.manifest) == (
+            f"git+{repo_url}@{'d' * 40}"
+        )
+
+        self.manifest.repository.branch = "missing"
+        assert ValidatorPackageService.get_pinned_install_url(self.manifest) is None
+
+        mock_run.side_effect = FileNotFoundError("git")
+        self.manifest.repository.branch = None
+        assert ValidatorPackageService.get_pinned_install_url(self.manifest) is None
+
+        # Commits are already pinned
+        mock_run.reset_mock()
+        self.manifest.repository.branch = "e" * 40
+        assert ValidatorPackageService.get_pinned_install_url(self.manifest) == (
+            f"git+{repo_url}@{'e' * 40}"
+        )
+        mock_run.assert_not_called()
+
+    def test_install_record(self, tmp_path):
+        site_packages = str(tmp_path)
+        install_url = f"git+https://github.com/guardrails/test-validator@{'a' * 40}"
+        assert not ValidatorPackageService.is_installed(
+            self.manifest, site_packages, install_url
+        )
+
+        os.makedirs(
+            ValidatorPackageService.get_hub_directory(self.manifest, site_packages)
+        )
+        ValidatorPackageService.write_install_record(
+            self.manifest, site_packages, install_url
+        )
+        assert ValidatorPackageService.is_installed(
+            self.manifest, site_packages, install_url
+        )
+
+        # A new commit is a different install URL
+        new_install_url = install_url.replace("a" * 40, "b" * 40)
+        assert not ValidatorPackageService.is_installed(
+            self.manifest, site_packages, new_install_url
+        )
+
+        # Without a commit, it's never known to be installed
+        assert not ValidatorPackageService.is_installed(
+            self.manifest, site_packages, None
+        )
+        ValidatorPackageService.write_install_record(self.manifest, site_packages, None)
+        assert not ValidatorPackageService.is_installed(
+            self.manifest, site_packages, install_url
+        )
+
+    def test_install_requirements(self, mocker):
+        mock_pip_process = mocker.patch(
+            "guardrails.hub.validator_package_service.pip_process"
+        )
+
+        ValidatorPackageService.install_requirements(
+            ["rstr", "openai<2", "rstr"], quiet=True
+        )
+        ValidatorPackageService.install_requirements([], quiet=True)
+
+        mock_pip_process.assert_called_once_with(
+            "install", flags=["rstr", "openai<2"], quiet=True
+        )
+
+
+def test_add_to_hub_inits_updates_registry_index(tmp_path):
+    manifest = Manifest.from_dict(
+        {
+            "id": "guardrails/test_validator",
+            "name": "name",
+            "author": {"name": "me", "email": "me@me.me"},
+            "maintainers": [],
+            "repository": {"url": "some-repo"},
+            "namespace": "guardrails",
+            "packageName": "test-validator",
+            "moduleName": "validator",
+            "description": "description",
+            "exports": ["TestValidator"],
+            "tags": {},
+        }
+    )
+    site_packages = str(tmp_path)
+    module_directory = tmp_path / "guardrails" / "hub" / "guardrails" / "test_validator"
+    (module_directory / "validator").mkdir(parents=True)
+    (module_directory / "validator" / "__init__.py").write_text(
+        "@register_validator(name='guardrails/registered_name', data_type='string')\n"
+        "class TestValidator: ...\n"
+    )
+
+    ValidatorPackageService.add_to_hub_inits(manifest, site_packages)
+
+    with open(tmp_path / "guardrails" / "hub" / "registry_index.json") as f:
+        index = json.load(f)["validators"]
+    assert index == {
+        "guardrails/registered_name": "guardrails.hub.guardrails.test_validator.validator",  # noqa
+        "guardrails/test_validator": "guardrails.hub.guardrails.test_validator.validator",  # noqa
+    }
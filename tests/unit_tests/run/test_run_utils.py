@@ -0,0 +1,32 @@
+from guardrails.prompt.prompt import Prompt
+from guardrails.run.utils import (
+    msg_history_source,
+    msg_history_string,
+    replace_msg_content,
+)
+
+
+def test_replace_msg_content_leaves_original_untouched():
+    metadata = {"tags": ["greeting"]}
+    msg = {"role": "user", "content": "Hello ${name}", "metadata": metadata}
+
+    new_msg = replace_msg_content(msg, "Hello Bob")
+
+    assert new_msg == {"role": "user", "content": "Hello Bob", "metadata": metadata}
+    assert msg["content"] == "Hello ${name}"
+    # Everything other than the content is shared, not copied
+    assert new_msg["metadata"] is metadata
+
+
+def test_msg_history_source_and_string():
+    msg_history = [
+        {"role": "system", "content": Prompt("You are a helpful assistant.")},
+        {"role": "user", "content": "Say hi."},
+    ]
+
+    assert msg_history_source(msg_history) == [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": "Say hi."},
+    ]
+    assert isinstance(msg_history[0]["content"], Prompt)
+    assert msg_history_string(msg_history) == "You are a helpful assistant.Say hi."
@@ -0,0 +1,270 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from guardrails_api_client.models import (
+    Call as ICall,
+    ValidatePayload,
+    ValidationOutcome as IValidationOutcome,
+)
+
+from guardrails.api_client import (
+    GuardrailsApiClient,
+    get_session,
+    parse_validation_outcome,
+)
+from guardrails.errors import ValidationError
+
+
+class MockGuard:
+    name = "test-guard"
+
+
+HISTORY = [{"id": "call-1", "iterations": []}]
+
+
+def outcome(validated_output):
+    return {
+        "callId": "call-1",
+        "rawLlmOutput": "raw",
+        "validatedOutput": validated_output,
+        "validationPassed": True,
+        "validationSummaries": [
+            {"validatorName": "v", "validatorStatus": "pass", "propertyPath": "$"}
+        ],
+    }
+
+
+@pytest.mark.parametrize("validated_output", ["text", {"a": 1}, [1, 2], None])
+def test_parse_validation_outcome(validated_output):
+    data = outcome(validated_output)
+
+    parsed = parse_validation_outcome(data)
+
+    assert parsed.to_dict() == IValidationOutcome.from_dict(data).to_dict()
+    if validated_output is None:
+        assert parsed.validated_output is None
+    else:
+        assert parsed.validated_output.actual_instance == validated_output
+
+
+def test_clients_share_a_session():
+    first = GuardrailsApiClient(base_url="http://localhost:1234", pool_size=3)
+    second = GuardrailsApiClient(base_url="http://localhost:1234", pool_size=3)
+
+    assert get_session(first.pool_size) is get_session(second.pool_size)
+    adapter = get_session(3).get_adapter("http://localhost:1234")
+    assert adapter._pool_maxsize == 3
+
+
+def test_pool_size_from_env(monkeypatch):
+    monkeypatch.setenv("GUARDRAILS_API_POOL_SIZE", "7")
+
+    assert GuardrailsApiClient().pool_size == 7
+
+
+class MockResponse:
+    def __init__(self, status_code=200, body=None, lines=()):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.reason = "reason"
+        self._body = body
+        self.text = json.dumps(body)
+        self._lines = lines
+
+    def json(self):
+        return self._body
+
+    def iter_lines(self):
+        return iter(self._lines)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+def test_validate(mocker):
+    client = GuardrailsApiClient(base_url="http://server", api_key="key")
+    post = mocker.patch.object(
+        get_session(client.pool_size),
+        "post",
+        return_value=MockResponse(body=outcome("text")),
+    )
+
+    result = client.validate(
+        MockGuard(), ValidatePayload(llm_output="raw"), openai_api_key="sk"
+    )
+
+    assert result.validated_output.actual_instance == "text"
+    assert post.call_args.args == ("http://server/guards/test-guard/validate",)
+    assert post.call_args.kwargs["headers"]["x-openai-api-key"] == "sk"
+
+
+def test_validate_bad_request(mocker):
+    client = GuardrailsApiClient(base_url="http://server")
+    mocker.patch.object(
+        get_session(client.pool_size),
+        "post",
+        return_value=MockResponse(status_code=400, body={"message": "bad"}),
+    )
+
+    with pytest.raises(ValidationError, match="bad"):
+        client.validate(MockGuard(), ValidatePayload(llm_output="raw"))
+
+
+def test_stream_validate(mocker):
+    client = GuardrailsApiClient(base_url="http://server")
+    lines = [json.dumps(outcome("te")).encode(), b"", json.dumps(outcome("text"))]
+    mocker.patch.object(
+        get_session(client.pool_size), "post", return_value=MockResponse(lines=lines)
+    )
+
+    results = list(client.stream_validate(MockGuard(), ValidatePayload()))
+
+    assert [r.validated_output.actual_instance for r in results] == ["te", "text"]
+
+
+def mock_async_client(mocker):
+    """Makes the async clients GuardrailsApiClient creates send requests to
+    a mock server."""
+    async_client = httpx.AsyncClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/guards/test-guard/validate":
+            if json.loads(request.content).get("llmOutput") == "stream":
+                lines = [json.dumps(outcome("te")), json.dumps(outcome("text"))]
+                return httpx.Response(200, text="\n".join(lines) + "\n")
+            return httpx.Response(200, json=outcome({"a": 1}))
+        if request.url.path == "/guards/test-guard/history/call-1":
+            return httpx.Response(200, json=HISTORY)
+        return httpx.Response(404, text="not found")
+
+    clients = []
+
+    def make_client(**kwargs):
+        clients.append(async_client(**kwargs, transport=httpx.MockTransport(handler)))
+        return clients[-1]
+
+    mocker.patch("httpx.AsyncClient", side_effect=make_client)
+    return clients
+
+
+@pytest.mark.asyncio
+async def test_async_client(mocker):
+    client = GuardrailsApiClient(base_url="http://server")
+    mock_async_client(mocker)
+
+    result = await client.async_validate(MockGuard(), ValidatePayload(llm_output="raw"))
+    assert result.validated_output.actual_instance == {"a": 1}
+
+    results = [
+        r
+        async for r in client.async_stream_validate(
+            MockGuard(), ValidatePayload(llm_output="stream")
+        )
+    ]
+    assert [r.validated_output.actual_instance for r in results] == ["te", "text"]
+
+    missing_guard = MockGuard()
+    missing_guard.name = "missing-guard"
+    with pytest.raises(ValueError, match="404"):
+        await client.async_validate(missing_guard, ValidatePayload(llm_output="raw"))
+
+    async_client = client._get_async_client()
+    await client.aclose()
+    assert async_client.is_closed
+    assert client._get_async_client() is not async_client
+
+
+def test_async_client_per_event_loop(mocker):
+    client = GuardrailsApiClient(base_url="http://server")
+    async_clients = mock_async_client(mocker)
+
+    async def validate_twice():
+        for _ in range(2):
+            result = await client.async_validate(
+                MockGuard(), ValidatePayload(llm_output="raw")
+            )
+            assert result.validated_output.actual_instance == {"a": 1}
+
+    # Connections can't be reused once the loop they were opened on is closed
+    asyncio.run(validate_twice())
+    asyncio.run(validate_twice())
+
+    assert len(async_clients) == 2
+    # Each loop's client is closed when the loop shuts down
+    assert all(c.is_closed for c in async_clients)
+
+
+@pytest.mark.asyncio
+async def test_async_guard_uses_async_client(mocker):
+    from guardrails import AsyncGuard
+
+    guard = AsyncGuard(name="test-guard")
+    guard._api_client = GuardrailsApiClient(base_url="http://server")
+    mock_async_client(mocker)
+    get_history = mocker.patch.object(
+        guard._api_client,
+        "get_history",
+        return_value=[ICall.from_dict(call) for call in HISTORY],
+    )
+
+    result = await guard._single_server_call(payload={"llmOutput": "raw"})
+
+    assert result.validated_output == {"a": 1}
+    assert result.validation_passed is True
+    # History is only fetched once it's used
+    get_history.assert_not_called()
+    assert len(guard.history) == 1
+    get_history.assert_called_once_with("test-guard", "call-1")
+
+
+def test_server_history_is_fetched_lazily(mocker):
+    from guardrails import Guard, settings
+
+    guard = Guard(name="test-guard")
+    guard._api_client = GuardrailsApiClient(base_url="http://server")
+    mocker.patch.object(settings, "use_server", True)
+    mocker.patch.object(
+        get_session(guard._api_client.pool_size),
+        "post",
+        return_value=MockResponse(body=outcome("text")),
+    )
+    get_history = mocker.patch.object(
+        guard._api_client,
+        "get_history",
+        return_value=[ICall.from_dict(call) for call in HISTORY],
+    )
+
+    guard._single_server_call(payload={"llmOutput": "raw"})
+    guard._single_server_call(payload={"llmOutput": "raw"})
+
+    get_history.assert_not_called()
+    assert [call.id for call in guard.history] == ["call-1", "call-1"]
+    assert get_history.call_count == 2
+    guard.history.clear()
+    assert get_history.call_count == 2
+
+
+def test_server_history_fetch_disabled(mocker):
+    from guardrails import Guard, settings
+
+    guard = Guard(name="test-guard")
+    guard._api_client = GuardrailsApiClient(base_url="http://server")
+    mocker.patch.object(
+        get_session(guard._api_client.pool_size),
+        "post",
+        return_value=MockResponse(body=outcome("text")),
+    )
+    get_history = mocker.patch.object(guard._api_client, "get_history")
+    mocker.patch.object(settings, "use_server", True)
+    mocker.patch.object(settings, "fetch_server_history", False)
+
+    result = guard._single_server_call(payload={"llmOutput": "raw"})
+
+    assert result.validated_output == "text"
+    assert len(guard.history) == 0
+    get_history.assert_not_called()
@@ -2,11 +2,14 @@ import asyncio
 
 import pytest
 
+from guardrails.actions.reask import FieldReAsk
+from guardrails.actions.refrain import Refrain
 from guardrails.classes.history.iteration import Iteration
 from guardrails.classes.validation.validator_logs import ValidatorLogs
+from guardrails.errors import ValidationError
 from guardrails.validator_base import OnFailAction
 from guardrails.validator_service import AsyncValidatorService
-from guardrails.classes.validation.validation_result import PassResult
+from guardrails.classes.validation.validation_result import FailResult, PassResult
 
 from .mocks import MockLoop
 from .mocks.mock_validator import create_mock_validator
@@ -343,3 +346,190 @@ async def test_run_validators_with_override(mocker):
 @pytest.mark.asyncio
 async def test_run_validators_with_failures(mocker):
     assert True is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "short_circuit,expected_run_count,expected_not_run",
+    [(True, 1, ["refrain_two"]), (False, 2, [])],
+)
+async def test_run_validators_short_circuits_terminal_failures(
+    mocker, short_circuit, expected_run_count, expected_not_run
+):
+    service = AsyncValidatorService(short_circuit=short_circuit)
+    refrain_one = create_mock_validator("refrain_one", OnFailAction.REFRAIN)()
+    refrain_two = create_mock_validator("refrain_two", OnFailAction.REFRAIN)()
+    mocker.patch.object(
+        service,
+        "group_validators",
+        return_value=[(OnFailAction.REFRAIN, [refrain_one, refrain_two])],
+    )
+
+    async def mock_run_validator(
+        iteration, validator, value, metadata, property_path, stream, **kwargs
+    ):
+        return ValidatorLogs(
+            registered_name=validator.name,
+            validator_name=validator.name,
+            value_before_validation=value,
+            validation_result=FailResult(error_message="Nope"),
+            property_path=property_path,
+        )
+
+    run_validator_mock = mocker.patch.object(
+        service, "run_validator", side_effect=mock_run_validator
+    )
+
+    iteration = Iteration(
+        call_id="mock-call",
+        index=0,
+    )
+
+    value, _metadata = await service.run_validators(
+        iteration=iteration,
+        validator_map={},
+        value="mock-value",
+        metadata={},
+        absolute_property_path="$",
+        reference_property_path="$",
+    )
+
+    assert isinstance(value, Refrain)
+    assert run_validator_mock.call_count == expected_run_count
+    not_run_logs = [
+        log for log in iteration.outputs.validator_logs if log.status == "not run"
+    ]
+    assert [log.registered_name for log in not_run_logs] == expected_not_run
+
+
+@pytest.mark.asyncio
+async def test_run_validators_keeps_finished_failures(mocker):
+    service = AsyncValidatorService()
+    separate = create_mock_validator("separate", OnFailAction.EXCEPTION)()
+    separate.run_in_separate_process = True
+    in_process = create_mock_validator("in_process", OnFailAction.EXCEPTION)()
+    mocker.patch.object(
+        service,
+        "group_validators",
+        return_value=[(OnFailAction.EXCEPTION, [separate, in_process])],
+    )
+
+    async def mock_run_validator(
+        iteration, validator, value, metadata, property_path, stream=False, **kwargs
+    ):
+        if validator is in_process:
+            # Fails after the separate process validator has finished
+            await asyncio.sleep(0.1)
+        return ValidatorLogs(
+            registered_name=validator.name,
+            validator_name=validator.name,
+            value_before_validation=value,
+            validation_result=FailResult(error_message=f"{validator.name} failed"),
+            property_path=property_path,
+        )
+
+    mocker.patch.object(service, "run_validator", side_effect=mock_run_validator)
+
+    iteration = Iteration(
+        call_id="mock-call",
+        index=0,
+    )
+
+    with pytest.raises(ValidationError) as e_info:
+        await service.run_validators(
+            iteration=iteration,
+            validator_map={},
+            value="mock-value",
+            metadata={},
+            absolute_property_path="$",
+            reference_property_path="$",
+        )
+
+    assert "in_process failed" in str(e_info.value)
+    assert "separate failed" in str(e_info.value)
+    assert not [
+        log for log in iteration.outputs.validator_logs if log.status == "not run"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_validators_reask_does_not_record_not_run(mocker):
+    service = AsyncValidatorService()
+    reask = create_mock_validator("reask", OnFailAction.REASK)()
+    noop = create_mock_validator("noop", OnFailAction.NOOP)()
+    mocker.patch.object(
+        service,
+        "group_validators",
+        return_value=[(OnFailAction.REASK, [reask]), (OnFailAction.NOOP, [noop])],
+    )
+
+    async def mock_run_validator(
+        iteration, validator, value, metadata, property_path, stream, **kwargs
+    ):
+        return ValidatorLogs(
+            registered_name=validator.name,
+            validator_name=validator.name,
+            value_before_validation=value,
+            validation_result=FailResult(error_message="Nope"),
+            property_path=property_path,
+        )
+
+    mocker.patch.object(service, "run_validator", side_effect=mock_run_validator)
+
+    iteration = Iteration(
+        call_id="mock-call",
+        index=0,
+    )
+
+    value, _metadata = await service.run_validators(
+        iteration=iteration,
+        validator_map={"$": [reask, noop]},
+        value="mock-value",
+        metadata={},
+        absolute_property_path="$",
+        reference_property_path="$",
+    )
+
+    assert isinstance(value, FieldReAsk)
+    # Reasks aren't terminal, so nothing is reported as skipped
+    assert not [
+        log for log in iteration.outputs.validator_logs if log.status == "not run"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_validate_children_cancels_siblings_on_refrain(mocker):
+    service = AsyncValidatorService()
+    cancelled = []
+
+    async def mock_async_validate(v, md, *args, **kwargs):
+        if v == "slow":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(v)
+                raise
+        return Refrain(), md
+
+    mocker.patch.object(service, "async_validate", side_effect=mock_async_validate)
+
+    iteration = Iteration(
+        call_id="mock-call",
+        index=0,
+    )
+
+    validated_value, _metadata = await asyncio.wait_for(
+        service.validate_children(
+            value={"fast": "fast", "slow": "slow"},
+            metadata={},
+            validator_map={},
+            iteration=iteration,
+            abs_parent_path="$",
+            ref_parent_path="$",
+        ),
+        timeout=5,
+    )
+
+    assert cancelled == ["slow"]
+    assert isinstance(validated_value["fast"], Refrain)
+    assert validated_value["slow"] == "slow"
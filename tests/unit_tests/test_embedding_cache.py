@@ -0,0 +1,65 @@
+from unittest.mock import Mock
+
+import pytest
+
+from guardrails.embedding import OpenAIEmbedding
+from guardrails.stores.embedding_cache import EmbeddingCache
+
+
+def test_get_key():
+    key = EmbeddingCache.get_key("model", "cl100k_base", "text")
+
+    assert key == EmbeddingCache.get_key("model", "cl100k_base", "text")
+    assert key != EmbeddingCache.get_key("other-model", "cl100k_base", "text")
+    assert key != EmbeddingCache.get_key("model", None, "text")
+    assert key != EmbeddingCache.get_key("model", "cl100k_base", "other text")
+
+
+def test_in_memory_lru():
+    cache = EmbeddingCache(max_size=2)
+    cache.set("a", [1.0])
+    cache.set("b", [2.0])
+    cache.get("a")
+    cache.set("c", [3.0])
+
+    assert cache.get("a").tolist() == [1.0]
+    assert cache.get("b") is None
+    assert cache.get("c").tolist() == [3.0]
+
+
+def test_persists_to_disk(tmp_path):
+    cache = EmbeddingCache(path=str(tmp_path))
+    cache.set("a", [0.5, 0.25])
+    cache.set("b", [1.0, 2.0, 3.0])
+
+    # e.g. after a restart, or from another worker
+    other_cache = EmbeddingCache(path=str(tmp_path))
+    assert other_cache.get("a").tolist() == [0.5, 0.25]
+    assert other_cache.get("b").tolist() == [1.0, 2.0, 3.0]
+    assert other_cache.get("missing") is None
+
+    # Entries written after opening are picked up too
+    cache.set("c", [4.0])
+    assert other_cache.get("c").tolist() == [4.0]
+
+
+@pytest.mark.parametrize("path", [None, "disk"])
+def test_embedding_uses_cache(tmp_path, path):
+    cache = EmbeddingCache(path=str(tmp_path / path) if path else None)
+    instance = OpenAIEmbedding(api_key="test_api_key", cache=cache)
+    instance._get_embedding = Mock(
+        side_effect=lambda texts: [[float(len(text))] for text in texts]
+    )
+
+    assert instance.embed_query("foo").tolist() == [3.0]
+    assert instance.embed_query("foo").tolist() == [3.0]
+    assert instance._get_embedding.call_count == 1
+
+    instance._len_safe_get_embeddings = Mock(
+        side_effect=lambda texts, embedder: [[float(len(text))] for text in texts]
+    )
+    assert instance.embed(["a", "bb", "a"]).tolist() == [[1.0], [2.0], [1.0]]
+    assert instance.embed(["bb", "ccc"]).tolist() == [[2.0], [3.0]]
+    assert [
+        call.args[0] for call in instance._len_safe_get_embeddings.call_args_list
+    ] == [["a", "bb"], ["ccc"]]
@@ -0,0 +1,164 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("faiss")
+pytest.importorskip("sqlalchemy")
+
+import sqlalchemy  # noqa: E402
+
+from guardrails.document_store import (  # noqa: E402
+    Document,
+    EphemeralDocumentStore,
+    PersistentDocumentStore,
+    SQLMetadataStore,
+)
+from guardrails.vectordb import Faiss, MemmapVectorDB  # noqa: E402
+
+from ..integration_tests.mock_embeddings import MOCK_EMBEDDINGS  # noqa: E402
+
+
+def embed(texts):
+    return np.array([MOCK_EMBEDDINGS[text] for text in texts], dtype=np.float32)
+
+
+def mock_embedder():
+    embedder = Mock()
+    embedder.embed.side_effect = embed
+    embedder.embed_query.side_effect = lambda text: embed([text])[0]
+    embedder.embed_queries.side_effect = embed
+    return embedder
+
+
+@pytest.fixture
+def store():
+    store = EphemeralDocumentStore(Faiss.new_flat_l2_index(3, mock_embedder()))
+    store.add_texts({text: {"name": text} for text in MOCK_EMBEDDINGS})
+    return store
+
+
+def test_search_batch(store):
+    results = store.search_batch(["cisco", "taj mahal"], k=2)
+
+    assert [[page.text for page in pages] for pages in results] == [
+        ["cisco", "broadcom"],
+        ["taj mahal", "paypal"],
+    ]
+    assert results[0][0].metadata == {"name": "cisco"}
+    # Batched searches find the same pages as searching one at a time
+    assert results == [store.search("cisco", 2), store.search("taj mahal", 2)]
+    store._vector_db._embedder.embed_queries.assert_called_once_with(
+        ["cisco", "taj mahal"]
+    )
+
+
+def test_search_batch_with_more_results_than_pages(store):
+    results = store.search_batch(["paypal"], k=10)
+
+    assert len(results[0]) == len(MOCK_EMBEDDINGS)
+
+
+def test_metadata_store_looks_up_pages_in_one_query(tmp_path):
+    metadata_store = SQLMetadataStore(str(tmp_path / "metadata.db"))
+    metadata_store.add_docs(
+        [
+            Document("a", {0: "first", 1: "second"}, {"source": "a"}),
+            Document("b", {0: "third"}, {"source": "b"}),
+        ],
+        vdb_last_index=10,
+    )
+
+    statements = []
+    sqlalchemy.event.listen(
+        metadata_store._engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    pages = metadata_store.get_pages_for_for_indexes([12, 10, 99, 11])
+
+    assert len(statements) == 1
+    assert [page.text for page in pages] == ["third", "first", "second"]
+    assert pages[0].cordinates == ("b", 0)
+    assert pages[0].metadata == {"source": "b"}
+
+
+def test_metadata_store_indexes_vector_index(tmp_path):
+    SQLMetadataStore(str(tmp_path / "metadata.db"))
+
+    inspector = sqlalchemy.inspect(
+        sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'metadata.db'}")
+    )
+    indexed_columns = [
+        index["column_names"] for index in inspector.get_indexes("documents")
+    ]
+    assert ["vector_index"] in indexed_columns
+
+
+def test_metadata_store_rejects_duplicate_documents():
+    metadata_store = SQLMetadataStore()
+    metadata_store.add_docs([Document("a", {0: "first"}, {})], vdb_last_index=0)
+
+    with pytest.raises(sqlalchemy.exc.IntegrityError):
+        metadata_store.add_docs([Document("a", {0: "first"}, {})], vdb_last_index=1)
+    assert len(metadata_store.get_pages_for_for_indexes([0, 1])) == 1
+
+
+def test_persistent_store_shares_documents_with_readers(tmp_path):
+    path = str(tmp_path / "store")
+    store = PersistentDocumentStore(MemmapVectorDB(mock_embedder(), path, 3))
+    store.add_texts({"cisco": {"name": "cisco"}, "taj mahal": {}})
+
+    reader = PersistentDocumentStore(
+        MemmapVectorDB.load(path, mock_embedder(), read_only=True)
+    )
+    assert [page.text for page in reader.search("broadcom", 1)] == ["cisco"]
+
+    # Documents added later show up in readers that are already open
+    store.add_text("paypal", {"name": "paypal"})
+    pages = reader.search("paypal", 1)
+    assert [page.text for page in pages] == ["paypal"]
+    assert pages[0].metadata == {"name": "paypal"}
+
+
+def test_persistent_store_drops_uncommitted_pages(tmp_path):
+    path = str(tmp_path / "store")
+    store = PersistentDocumentStore(MemmapVectorDB(mock_embedder(), path, 3))
+    store.add_text("cisco", {})
+    # As if the process died between writing metadata and vectors
+    store._storage.add_docs([Document("orphan", {0: "paypal"}, {})], 1)
+
+    reopened_store = PersistentDocumentStore(MemmapVectorDB(mock_embedder(), path))
+    reopened_store.add_text("taj mahal", {})
+
+    assert [page.text for page in reopened_store.search("taj mahal", 1)] == [
+        "taj mahal"
+    ]
+
+
+def test_persistent_store_writers_pair_pages_with_their_vectors(tmp_path):
+    path = str(tmp_path / "store")
+    slow_embedder = mock_embedder()
+
+    def slow_embed(texts):
+        # Gives the other writer time to add its document in between
+        time.sleep(0.2)
+        return embed(texts)
+
+    slow_embedder.embed.side_effect = slow_embed
+    slow_store = PersistentDocumentStore(MemmapVectorDB(slow_embedder, path, 3))
+    store = PersistentDocumentStore(MemmapVectorDB(mock_embedder(), path))
+
+    slow_writer = threading.Thread(target=slow_store.add_text, args=("cisco", {}))
+    slow_writer.start()
+    time.sleep(0.05)
+    store.add_text("paypal", {})
+    slow_writer.join()
+
+    reader = PersistentDocumentStore(
+        MemmapVectorDB.load(path, mock_embedder(), read_only=True)
+    )
+    for text in ["cisco", "paypal"]:
+        assert [page.text for page in reader.search(text, 1)] == [text]
@@ -5,6 +5,7 @@ from pydantic import BaseModel
 
 from guardrails import Guard, Validator, register_validator
 from guardrails.classes.validation.validation_result import PassResult
+from guardrails.classes.validation.validator_reference import ValidatorReference
 from guardrails.utils.validator_utils import verify_metadata_requirements
 from guardrails.utils import args, kwargs, on_fail
 from guardrails.types import OnFailAction
@@ -601,6 +602,63 @@ def test_use_and_use_many():
         )
 
 
+def test_execution_plan_is_reused_until_guard_changes():
+    guard: Guard = Guard().use(LowerCase(on_fail=OnFailAction.FIX))
+
+    guard.validate("Oh Canada")
+    execution_plan = guard._execution_plan
+    assert execution_plan is not None
+
+    response = guard.validate("Star Spangled Banner")
+    assert guard._execution_plan is execution_plan
+    assert response.validated_output == "star spangled banner"
+
+    guard.use(TwoWords)
+    assert guard._execution_plan is None
+    response = guard.validate("Star Spangled Banner")
+    assert guard._execution_plan is not execution_plan
+    assert response.validation_passed is False
+
+    guard.configure(num_reasks=2)
+    assert guard._execution_plan is None
+
+    guard.validate("Oh Canada")
+    execution_plan = guard._execution_plan
+    guard.output_schema = guard.output_schema.model_copy()
+    guard.validate("Oh Canada")
+    assert guard._execution_plan is execution_plan
+
+    # Changing the schema in place makes a new plan too
+    guard.output_schema.description = "A national anthem"
+    guard.validate("Oh Canada")
+    assert guard._execution_plan is not execution_plan
+    assert guard._execution_plan.output_schema["description"] == "A national anthem"
+
+
+def test_validators_added_to_the_list_are_used_on_the_next_call(mocker):
+    guard: Guard = Guard().use(LowerCase(on_fail=OnFailAction.FIX))
+    assert guard.validate("Star Spangled Banner").validation_passed is True
+
+    guard.validators.append(
+        ValidatorReference(id="two-words", on="$", on_fail=OnFailAction.NOOP)
+    )
+    execution_plan = guard._execution_plan
+    response = guard.validate("Star Spangled Banner")
+    assert response.validation_passed is False
+    assert guard._execution_plan is not execution_plan
+
+    # The validators are only built once the guard stops using the server
+    guard = Guard()
+    mocker.patch("guardrails.guard.settings.use_server", True)
+    guard.validators.append(
+        ValidatorReference(id="two-words", on="$", on_fail=OnFailAction.NOOP)
+    )
+    guard._fill_validator_map()
+    assert guard._validator_map == {}
+    mocker.patch("guardrails.guard.settings.use_server", False)
+    assert guard.validate("Star Spangled Banner").validation_passed is False
+
+
 # def test_call():
 #     five_seconds = 5 / 60
 #     response = Guard().use_many(
@@ -0,0 +1,79 @@
+import subprocess
+import sys
+
+import pytest
+
+import guardrails
+
+# Slow to import, and only needed once they're used
+HEAVY_MODULES = [
+    "openai",
+    "langchain_core",
+    "nltk",
+    "faker",
+    # Telemetry's exporters, talking to a server, and RAIL and JSON Schemas
+    "opentelemetry.sdk",
+    "opentelemetry.exporter",
+    "jwt",
+    "requests",
+    "guardrails_api_client.api",
+    "lxml",
+    "jsonschema",
+    "jsonref",
+]
+
+
+def imported_modules(statement: str):
+    code = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+def test_import_guardrails_is_lazy():
+    modules = imported_modules("import guardrails")
+
+    assert "guardrails.guard" not in modules
+    assert not modules.intersection(HEAVY_MODULES)
+
+
+@pytest.mark.parametrize("name", ["Guard", "AsyncGuard"])
+def test_import_guard_skips_heavy_modules(name):
+    modules = imported_modules(f"from guardrails import {name}")
+
+    assert not modules.intersection(HEAVY_MODULES)
+
+
+def test_lazy_attributes():
+    from guardrails.guard import Guard
+    from guardrails.utils import docs_utils
+
+    assert guardrails.Guard is Guard
+    assert guardrails.docs_utils is docs_utils
+    assert set(guardrails.__all__) <= set(dir(guardrails))
+    with pytest.raises(AttributeError):
+        guardrails.NotAThing
+
+
+def test_settings_is_not_shadowed_by_its_module():
+    import guardrails.settings  # noqa: F401
+    from guardrails.settings import Settings
+
+    assert isinstance(guardrails.settings, Settings)
+
+
+# Validators and integrations import these directly, without going through
+#   guardrails/__init__.py first
+@pytest.mark.parametrize(
+    "module",
+    [
+        "guardrails.validator_base",
+        "guardrails.prompt",
+        "guardrails.actions",
+        "guardrails.types",
+        "guardrails.utils.docs_utils",
+    ],
+)
+def test_submodules_import_on_their_own(module):
+    assert module in imported_modules(f"import {module}")
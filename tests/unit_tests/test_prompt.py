@@ -6,10 +6,12 @@ import pytest
 from pydantic import BaseModel, Field
 
 import guardrails as gd
+from guardrails.prompt.base_prompt import BasePrompt, compile_template
 from guardrails.prompt.instructions import Instructions
 from guardrails.prompt.prompt import Prompt
 from guardrails.utils.constants import constants
 from guardrails.utils.prompt_utils import prompt_content_for_schema
+from guardrails.utils.templating_utils import get_template_variables
 
 INSTRUCTIONS = "\nYou are a helpful bot, who answers only with valid JSON\n"
 
@@ -240,6 +242,56 @@ def test_substitute_constants(prompt_str, final_prompt):
     assert prompt.source == final_prompt
 
 
+def test_compiled_templates_are_reused(mocker):
+    compile_template.cache_clear()
+    substitute_spy = mocker.spy(BasePrompt, "substitute_constants")
+    prompt_str = "Tell me about ${topic}. ${gr.complete_json_suffix_v2}"
+
+    first_prompt = Prompt(prompt_str)
+    second_prompt = Prompt(prompt_str)
+
+    assert substitute_spy.call_count == 1
+    assert first_prompt.source == second_prompt.source
+    assert (
+        first_prompt.format_instructions_start
+        == second_prompt.format_instructions_start
+        == prompt_str.index("${gr.")
+    )
+
+    safe_substitute_spy = mocker.spy(Template, "safe_substitute")
+    formatted_prompt = first_prompt.format(topic="cats")
+    assert substitute_spy.call_count == 1
+    assert formatted_prompt.source == first_prompt.source.replace("${topic}", "cats")
+    assert "topic" not in formatted_prompt.variable_names
+    # Formatting fills in the compiled template's segments
+    safe_substitute_spy.assert_not_called()
+    # Formatted prompts don't take up room in the cache
+    assert compile_template.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "Tell me about ${topic} and $topic, twice: ${topic}",
+        "It costs $$5, or $5, or $$$amount $ ${not closed",
+        "${unknown} ${topic}${count}$count_",
+        "",
+    ],
+)
+def test_format_matches_safe_substitute(template):
+    prompt = Prompt(template)
+    kwargs = {"topic": "cats", "count": 3, "amount": "$topic", "extra": "ignored"}
+
+    formatted_prompt = prompt.format(**kwargs)
+
+    assert prompt.source == template
+    assert prompt.variable_names == get_template_variables(template)
+    assert formatted_prompt.source == Template(template).safe_substitute(**kwargs)
+    assert formatted_prompt.variable_names == [
+        v for v in get_template_variables(template) if v not in kwargs
+    ]
+
+
 class TestResponse(BaseModel):
     grade: int = Field(description="The grade of the response")
 
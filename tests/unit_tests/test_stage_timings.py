@@ -0,0 +1,61 @@
+from guardrails import Guard
+from guardrails.classes.history import Call, Iteration
+from guardrails.classes.generic import Stack
+from guardrails.telemetry.stage_timings import StageTimingHistograms, stage_timings
+from tests.integration_tests.test_assets.validators import LowerCase
+
+
+def test_to_prometheus():
+    histograms = StageTimingHistograms(buckets=[0.001, 0.01])
+    histograms.observe("parse", 500_000)
+    histograms.observe("parse", 5_000_000)
+    histograms.observe("parse", 50_000_000)
+    histograms.observe("llm_call", 1_000_000)
+
+    assert histograms.to_prometheus() == (
+        "# HELP guardrails_stage_duration_seconds"
+        " Time spent in each stage of a guard run.\n"
+        "# TYPE guardrails_stage_duration_seconds histogram\n"
+        'guardrails_stage_duration_seconds_bucket{stage="llm_call",le="0.001"} 1\n'
+        'guardrails_stage_duration_seconds_bucket{stage="llm_call",le="0.01"} 1\n'
+        'guardrails_stage_duration_seconds_bucket{stage="llm_call",le="+Inf"} 1\n'
+        'guardrails_stage_duration_seconds_sum{stage="llm_call"} 0.001\n'
+        'guardrails_stage_duration_seconds_count{stage="llm_call"} 1\n'
+        'guardrails_stage_duration_seconds_bucket{stage="parse",le="0.001"} 1\n'
+        'guardrails_stage_duration_seconds_bucket{stage="parse",le="0.01"} 2\n'
+        'guardrails_stage_duration_seconds_bucket{stage="parse",le="+Inf"} 3\n'
+        'guardrails_stage_duration_seconds_sum{stage="parse"} 0.0555\n'
+        'guardrails_stage_duration_seconds_count{stage="parse"} 3\n'
+    )
+
+    histograms.reset()
+    assert "stage=" not in histograms.to_prometheus()
+
+
+def test_observe_call():
+    histograms = StageTimingHistograms()
+    iteration = Iteration(call_id="mock-call", index=0)
+    iteration.timings.update({"llm_call": 100, "validation": 20})
+    histograms.observe_call(Call(iterations=Stack(iteration, iteration)))
+
+    assert histograms._counts["llm_call"][0] == 1
+    assert histograms._sums == {"llm_call": 200, "validation": 40}
+
+
+def test_guard_records_stage_timings(mocker):
+    observe_call = mocker.spy(stage_timings, "observe_call")
+    guard = Guard().use(LowerCase(on_fail="noop"))
+
+    guard.parse("hello world")
+
+    timings = guard.history.last.timings
+    assert set(timings) == {
+        "prepare",
+        "llm_call",
+        "parse",
+        "schema_validation",
+        "validation",
+        "introspect",
+    }
+    assert all(duration >= 0 for duration in timings.values())
+    observe_call.assert_called_once_with(guard.history.last)
@@ -0,0 +1,123 @@
+import time
+
+import pytest
+
+from guardrails.classes.validation.validation_result import FailResult, PassResult
+from guardrails.stores.validator_cache import (
+    InMemoryValidatorCacheBackend,
+    SQLiteValidatorCacheBackend,
+    ValidatorCache,
+    validator_cache,
+)
+from guardrails.validator_service import SequentialValidatorService
+
+from .mocks.mock_validator import create_mock_validator
+
+CacheableValidator = create_mock_validator("cacheable-validator")
+CacheableValidator.cacheable = True
+CacheableValidator.required_metadata_keys = ["language"]
+
+
+@pytest.fixture(autouse=True)
+def reset_validator_cache():
+    validator_cache.configure()
+    yield
+    validator_cache.configure()
+
+
+class TestInMemoryValidatorCacheBackend:
+    def test_evicts_least_recently_used(self):
+        backend = InMemoryValidatorCacheBackend(max_size=2)
+        backend.set("a", PassResult())
+        backend.set("b", PassResult())
+        backend.get("a")
+        backend.set("c", PassResult())
+
+        assert backend.get("a") is not None
+        assert backend.get("b") is None
+        assert backend.get("c") is not None
+
+    def test_expires_entries(self, mocker):
+        now = time.time()
+        mock_time = mocker.patch(
+            "guardrails.stores.validator_cache.time.time", return_value=now
+        )
+        backend = InMemoryValidatorCacheBackend(ttl=10)
+        backend.set("a", PassResult())
+        assert backend.get("a") is not None
+
+        mock_time.return_value = now + 60
+        assert backend.get("a") is None
+
+
+def test_sqlite_backend_round_trip(tmp_path):
+    backend = SQLiteValidatorCacheBackend(str(tmp_path / "cache.db"))
+    backend.set("pass", PassResult(value_override="fixed"))
+    backend.set("fail", FailResult(error_message="nope", fix_value="fixed"))
+
+    # A second connection sees the same results, e.g. from another worker
+    other_backend = SQLiteValidatorCacheBackend(str(tmp_path / "cache.db"))
+    pass_result = other_backend.get("pass")
+    fail_result = other_backend.get("fail")
+
+    assert isinstance(pass_result, PassResult)
+    assert pass_result.value_override == "fixed"
+    assert isinstance(fail_result, FailResult)
+    assert fail_result.error_message == "nope"
+    assert fail_result.fix_value == "fixed"
+    assert other_backend.get("missing") is None
+
+
+def test_sqlite_backend_keeps_none_value_overrides(tmp_path):
+    backend = SQLiteValidatorCacheBackend(str(tmp_path / "cache.db"))
+    backend.set("none", PassResult(value_override=None))
+    backend.set("no_override", PassResult())
+
+    assert backend.get("none").value_override is None
+    assert backend.get("no_override").value_override is PassResult.ValueOverrideSentinel
+
+
+def test_get_cache_key():
+    validator = CacheableValidator()
+    key = ValidatorCache.get_cache_key(validator, "value", {"language": "en"})
+
+    assert key == ValidatorCache.get_cache_key(
+        validator, "value", {"language": "en", "unrelated": 1}
+    )
+    assert key != ValidatorCache.get_cache_key(validator, "value", {"language": "fr"})
+    assert key != ValidatorCache.get_cache_key(validator, "other", {"language": "en"})
+    assert ValidatorCache.get_cache_key(validator, object(), {}) is None
+
+
+def test_execute_validator_uses_cache(mocker):
+    validator = CacheableValidator()
+    validate_spy = mocker.spy(validator, "validate")
+    validator_service = SequentialValidatorService()
+
+    first_result = validator_service.execute_validator(
+        validator, "value", {}, validation_session_id="session"
+    )
+    second_result = validator_service.execute_validator(
+        validator, "value", {}, validation_session_id="session"
+    )
+
+    assert validate_spy.call_count == 1
+    assert isinstance(first_result, PassResult)
+    assert isinstance(second_result, PassResult)
+    assert validator_cache.hits == 1
+    assert validator_cache.misses == 1
+
+
+def test_execute_validator_skips_cache_by_default(mocker):
+    UncachedValidator = create_mock_validator("uncached-validator")
+    validator = UncachedValidator()
+    validate_spy = mocker.spy(validator, "validate")
+    validator_service = SequentialValidatorService()
+
+    for _ in range(2):
+        validator_service.execute_validator(
+            validator, "value", {}, validation_session_id="session"
+        )
+
+    assert validate_spy.call_count == 2
+    assert validator_cache.misses == 0
@@ -0,0 +1,124 @@
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+
+from guardrails.classes.validation.validation_result import PassResult
+from guardrails.settings import settings
+from guardrails.telemetry import validator_tracing
+from guardrails.telemetry.validator_tracing import number_from_env, trace_validator
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture(autouse=True)
+def enable_tracing(mocker):
+    mocker.patch.object(settings, "disable_tracing", False)
+
+
+def get_tracer(exporter, **kwargs):
+    provider = TracerProvider(**kwargs)
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer("test")
+
+
+def traced_validate(tracer, validate=None):
+    @trace_validator(
+        "test-validator",
+        1,
+        "noop",
+        tracer,
+        validation_session_id="session",
+        threshold=0.5,
+    )
+    def _validate(value, metadata):
+        if validate is not None:
+            return validate(value, metadata)
+        return PassResult()
+
+    return _validate
+
+
+def test_recording_span_gets_attributes(exporter):
+    traced_validate(get_tracer(exporter))("hello world", {"key": "value"})
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "test-validator.validate"
+    assert span.attributes["input"] == "hello world"
+    assert span.attributes["validator.validate.input.value"] == "hello world"
+    assert span.attributes["validator.init.threshold"] == "0.5"
+    assert span.attributes["validator.validate.output.outcome"] == "pass"
+    assert span.attributes["input.mime_type"] == "application/json"
+    assert span.attributes["output.mime_type"] == "application/json"
+    assert '"outcome": "pass"' in span.attributes["output.value"]
+
+
+def test_non_recording_span_skips_attributes(exporter, mocker):
+    serialize = mocker.spy(validator_tracing, "serialize_attribute")
+
+    result = traced_validate(get_tracer(exporter, sampler=ALWAYS_OFF))(
+        "hello world", {}
+    )
+
+    assert result == PassResult()
+    assert exporter.get_finished_spans() == ()
+    serialize.assert_not_called()
+
+
+def test_failing_validator_on_non_recording_span(exporter, mocker):
+    serialize = mocker.spy(validator_tracing, "serialize_attribute")
+
+    def validate(value, metadata):
+        raise ValueError("Failed")
+
+    with pytest.raises(ValueError, match="Failed"):
+        traced_validate(get_tracer(exporter, sampler=ALWAYS_OFF), validate)(
+            "hello world", {}
+        )
+    serialize.assert_not_called()
+
+
+def test_long_attributes_are_truncated(exporter, mocker):
+    mocker.patch.object(validator_tracing, "max_attribute_length", 10)
+
+    traced_validate(get_tracer(exporter))("a" * 100, {})
+
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes["input"] == "aaaaaaaaaa...[truncated]"
+    assert span.attributes["validator.validate.input.value"] == (
+        "aaaaaaaaaa...[truncated]"
+    )
+    # The input is JSON with the truncated strings in it, the output isn't
+    assert span.attributes["input.mime_type"] == "application/json"
+    assert span.attributes["output.value"] == '{"outcome"...[truncated]'
+    assert span.attributes["output.mime_type"] == "text/plain"
+
+
+def test_number_from_env(monkeypatch):
+    monkeypatch.setenv("GUARDRAILS_TEST_NUMBER", "0.5")
+    assert number_from_env("GUARDRAILS_TEST_NUMBER", 1.0) == 0.5
+
+    monkeypatch.setenv("GUARDRAILS_TEST_NUMBER", "not a number")
+    assert number_from_env("GUARDRAILS_TEST_NUMBER", 10) == 10
+
+    monkeypatch.delenv("GUARDRAILS_TEST_NUMBER")
+    assert number_from_env("GUARDRAILS_TEST_NUMBER", 10) == 10
+
+
+@pytest.mark.parametrize(
+    "sample_rate,random_value,recorded",
+    [(1.0, 0.99, True), (0.5, 0.25, True), (0.5, 0.75, False), (0.0, 0.0, False)],
+)
+def test_sampling(exporter, mocker, sample_rate, random_value, recorded):
+    mocker.patch.object(validator_tracing, "sample_rate", sample_rate)
+    mocker.patch.object(validator_tracing.random, "random", return_value=random_value)
+
+    traced_validate(get_tracer(exporter))("hello world", {})
+
+    # The span itself is always exported, only its attributes are sampled
+    (span,) = exporter.get_finished_spans()
+    assert ("input" in span.attributes) is recorded
@@ -2,9 +2,14 @@
 
 import pytest
 
+from guardrails.utils import docs_utils
 from guardrails.utils.docs_utils import (  # sentence_split,
     TextSplitter,
     get_chunks_from_text,
+    get_encoding,
+    iter_chunks_from_text,
+    iter_pdf_pages,
+    read_pdf,
 )
 
 
@@ -28,7 +33,9 @@ class MockPromptTemplate:
 def mock_tokenizer(monkeypatch):
     mock = MockTokenizer()
     monkeypatch.setattr("tiktoken.get_encoding", lambda _: mock)
-    return mock
+    get_encoding.cache_clear()
+    yield mock
+    get_encoding.cache_clear()
 
 
 @pytest.fixture
@@ -110,3 +117,37 @@ def test_get_chunks_from_text_invalid_strategy():
             chunk_size=1,
             chunk_overlap=0,
         )
+
+
+@pytest.mark.parametrize(
+    "chunk_size,chunk_overlap", [(4, 1), (3, 0), (5, 4), (1, 0), (2, -3), (20, 2)]
+)
+def test_iter_chunks_from_text_matches_slicing(chunk_size, chunk_overlap):
+    text = "This is a longer test."
+    step = chunk_size - chunk_overlap
+    expected = [" ".join(text[i : i + chunk_size]) for i in range(0, len(text), step)]
+
+    chunks = iter_chunks_from_text(text, "char", chunk_size, chunk_overlap)
+
+    assert not isinstance(chunks, list)
+    assert list(chunks) == expected
+
+
+def test_iter_chunks_from_text_runs_across_texts():
+    chunks = iter_chunks_from_text(["abc", "", "de"], "char", 2, 0)
+    assert list(chunks) == ["a b", "c d", "e"]
+
+
+def test_iter_chunks_from_text_rejects_overlap_larger_than_size():
+    with pytest.raises(ValueError):
+        list(iter_chunks_from_text("text", "char", 2, 2))
+
+
+def test_pdf_pages_extracted_in_parallel(monkeypatch):
+    path = "docs/examples/data/chase_card_agreement.pdf"
+    monkeypatch.setattr(docs_utils, "PDF_PAGES_PER_TASK", 1)
+
+    pages = list(iter_pdf_pages(path))
+    assert list(iter_pdf_pages(path, max_workers=2)) == pages
+    assert read_pdf(path) == "".join(f"{page}\n" for page in pages)
+    assert all("\r" not in page for page in pages)
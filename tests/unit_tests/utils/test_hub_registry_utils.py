@@ -0,0 +1,158 @@
+import os
+import sys
+import time
+
+from guardrails.utils import hub_registry_utils
+from guardrails.utils.hub_registry_utils import (
+    HubRegistryIndex,
+    build_hub_registry_index,
+    find_registered_names,
+    load_hub_registry_index,
+    write_hub_registry_index,
+)
+
+VALIDATOR_SOURCE = """
+from guardrails.validator_base import Validator, register_validator
+
+
+@register_validator(name="{name}", data_type="string")
+class {class_name}(Validator):
+    def validate(self, value, metadata):
+        pass
+"""
+
+
+def make_hub(tmp_path, package_name="hub_registry_test_pkg"):
+    """A hub directory with one installed validator package."""
+    hub_directory = tmp_path / "hub"
+    module_directory = hub_directory / "guardrails" / package_name / "validator"
+    module_directory.mkdir(parents=True)
+    (module_directory / "__init__.py").write_text(
+        "from .main import IndexedValidator\n"
+    )
+    (module_directory / "main.py").write_text(
+        VALIDATOR_SOURCE.format(
+            name="guardrails/indexed_validator", class_name="IndexedValidator"
+        )
+    )
+    (hub_directory / "__init__.py").write_text(
+        f"from guardrails.hub.guardrails.{package_name}.validator"
+        " import IndexedValidator"
+    )
+    return hub_directory
+
+
+def test_find_registered_names(tmp_path):
+    source = tmp_path / "validators.py"
+    source.write_text(
+        VALIDATOR_SOURCE.format(name="guardrails/first", class_name="First")
+        + "\nimport guardrails.validator_base as vb\n"
+        + "vb.register_validator('guardrails/second', data_type='string')(First)\n"
+        + "register_validator(name=NOT_A_LITERAL, data_type='string')\n"
+    )
+
+    assert find_registered_names(str(source)) == [
+        "guardrails/first",
+        "guardrails/second",
+    ]
+
+
+def test_build_and_load_index(tmp_path, mocker):
+    hub_directory = make_hub(tmp_path)
+    mocker.patch.object(
+        hub_registry_utils, "get_hub_directory", return_value=str(hub_directory)
+    )
+    assert load_hub_registry_index() is None
+
+    computed_directory = hub_directory / "guardrails" / "computed_pkg" / "validator"
+    computed_directory.mkdir(parents=True)
+    (computed_directory / "__init__.py").write_text(
+        "register_validator(name=NOT_A_LITERAL, data_type='string')\n"
+    )
+    with open(hub_directory / "__init__.py", "a") as hub_init:
+        hub_init.write(
+            "\nfrom guardrails.hub.guardrails.computed_pkg.validator import *\n"
+        )
+
+    index = build_hub_registry_index(
+        str(hub_directory), known={"guardrails/manifest_id": "guardrails.hub.x"}
+    )
+    assert index == HubRegistryIndex(
+        validators={
+            "guardrails/indexed_validator": (
+                "guardrails.hub.guardrails.hub_registry_test_pkg.validator"
+            ),
+            "guardrails/manifest_id": "guardrails.hub.x",
+        },
+        unresolved=["guardrails.hub.guardrails.computed_pkg.validator"],
+    )
+
+    write_hub_registry_index(str(hub_directory), index)
+    assert load_hub_registry_index() == index
+
+    # Editing the hub's __init__.py without updating the index makes it stale
+    future = time.time() + 10
+    os.utime(hub_directory / "__init__.py", (future, future))
+    assert load_hub_registry_index() is None
+
+
+def test_get_validator_class_imports_only_the_owning_module(tmp_path, mocker):
+    package_name = "hub_registry_owner_pkg"
+    hub_directory = make_hub(tmp_path, package_name)
+    # Running the hub's __init__.py would import every installed validator,
+    #   including this one
+    other_directory = hub_directory / "guardrails" / "other_pkg" / "validator"
+    other_directory.mkdir(parents=True)
+    (other_directory / "__init__.py").write_text("raise ImportError('not me')\n")
+    with open(hub_directory / "__init__.py", "a") as hub_init:
+        hub_init.write(
+            "\nfrom guardrails.hub.guardrails.other_pkg.validator import *\n"
+        )
+    mocker.patch.object(
+        hub_registry_utils, "get_hub_directory", return_value=str(hub_directory)
+    )
+    module_name = f"guardrails.hub.guardrails.{package_name}.validator"
+    other_module_name = "guardrails.hub.guardrails.other_pkg.validator"
+    mocker.patch.dict(sys.modules)
+    sys.modules.pop("guardrails.hub", None)
+
+    from guardrails import validator_base
+
+    index = HubRegistryIndex(
+        validators={
+            "guardrails/indexed_validator": module_name,
+            "guardrails/other_validator": other_module_name,
+        }
+    )
+    mocker.patch.object(validator_base, "load_hub_registry_index", return_value=index)
+    try_to_import_hub = mocker.patch.object(validator_base, "try_to_import_hub")
+
+    validator = validator_base.get_validator_class("hub://guardrails/indexed_validator")
+
+    assert validator is not None
+    assert validator.__name__ == "IndexedValidator"
+    assert sys.modules[module_name].IndexedValidator is validator
+    assert "guardrails.hub" not in sys.modules
+    assert other_module_name not in sys.modules
+    try_to_import_hub.assert_not_called()
+
+    # Ids missing from the index can only be registered by the modules
+    #   that use computed names, so only those are imported
+    assert validator_base.get_validator_class("guardrails/typo_validator") is None
+    sys.modules.pop(module_name)
+    index.unresolved.append(module_name)
+    assert validator_base.get_validator_class("guardrails/typo_validator") is None
+    assert module_name in sys.modules
+    assert "guardrails.hub" not in sys.modules
+    assert other_module_name not in sys.modules
+    try_to_import_hub.assert_not_called()
+
+
+def test_get_validator_class_without_index_imports_hub(mocker):
+    from guardrails import validator_base
+
+    mocker.patch.object(validator_base, "load_hub_registry_index", return_value=None)
+    try_to_import_hub = mocker.patch.object(validator_base, "try_to_import_hub")
+
+    assert validator_base.get_validator_class("guardrails/not_installed") is None
+    try_to_import_hub.assert_called_once()
@@ -0,0 +1,72 @@
+import os
+import pickle
+
+import pytest
+
+nltk = pytest.importorskip("nltk")
+
+from nltk.tokenize import punkt  # noqa: E402
+
+from guardrails.utils.nltk_resources import NLTKResourceManager  # noqa: E402
+
+
+def _missing(resource, *args, **kwargs):
+    raise LookupError(resource)
+
+
+def test_offline_missing_resource_raises_without_downloading(mocker):
+    mocker.patch("nltk.data.find", side_effect=_missing)
+    download = mocker.patch("nltk.download")
+    manager = NLTKResourceManager(offline=True)
+
+    with pytest.raises(LookupError, match="offline mode"):
+        manager.ensure("punkt")
+    download.assert_not_called()
+
+
+def test_failed_download_is_only_attempted_once(mocker):
+    mocker.patch("nltk.data.find", side_effect=_missing)
+    download = mocker.patch("nltk.download", return_value=False)
+    manager = NLTKResourceManager(offline=False)
+
+    for _ in range(3):
+        with pytest.raises(LookupError, match="could not be downloaded"):
+            manager.ensure("punkt")
+    assert download.call_count == 1
+
+    # Reconfiguring lets it try again
+    manager.configure(offline=False)
+    with pytest.raises(LookupError):
+        manager.ensure("punkt")
+    assert download.call_count == 2
+
+
+@pytest.mark.skipif(
+    hasattr(punkt, "PunktTokenizer"),
+    reason="Newer nltk versions load Punkt from punkt_tab tables",
+)
+def test_bundled_data_path_is_used_offline(tmp_path, mocker):
+    # Laid out like the punkt package, which keeps the Python 3 pickles in PY3
+    punkt_dir = tmp_path / "tokenizers" / "punkt" / "PY3"
+    punkt_dir.mkdir(parents=True)
+    with open(punkt_dir / "english.pickle", "wb") as f:
+        pickle.dump(punkt.PunktSentenceTokenizer(), f)
+    download = mocker.patch("nltk.download")
+
+    manager = NLTKResourceManager(offline=True, data_path=str(tmp_path))
+    try:
+        sentences = manager.sent_tokenize("This is one. This is two.")
+        assert sentences == ["This is one.", "This is two."]
+        assert manager.get_sentence_tokenizer() is manager.get_sentence_tokenizer()
+        download.assert_not_called()
+    finally:
+        nltk.data.path.remove(str(tmp_path))
+
+
+def test_env_vars_configure_defaults(monkeypatch, tmp_path):
+    monkeypatch.setenv("GUARDRAILS_OFFLINE", "true")
+    monkeypatch.setenv("GUARDRAILS_NLTK_DATA", str(tmp_path))
+    manager = NLTKResourceManager()
+
+    assert manager.offline is True
+    assert manager.data_path == os.fspath(tmp_path)
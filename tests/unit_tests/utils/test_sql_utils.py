@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from guardrails.utils.sql_utils import create_sql_driver  # noqa: E402
+
+
+@pytest.fixture
+def schema_file(tmp_path):
+    path = tmp_path / "schema.sql"
+    path.write_text("CREATE TABLE employees (id INTEGER, name TEXT);")
+    return str(path)
+
+
+def test_schema_is_cached_until_it_expires(schema_file, mocker):
+    mock_time = mocker.patch(
+        "guardrails.utils.sql_utils.time.monotonic", return_value=100.0
+    )
+    driver = create_sql_driver(schema_file, "sqlite://", schema_ttl=60)
+    inspect_spy = mocker.spy(driver, "_inspect_schema")
+
+    assert "Table: employees" in driver.get_schema()
+    driver._conn.exec_driver_sql("CREATE TABLE teams (id INTEGER)")
+    assert "Table: teams" not in driver.get_schema()
+
+    mock_time.return_value = 200.0
+    assert "Table: teams" in driver.get_schema()
+    assert inspect_spy.call_count == 2
+
+    driver._conn.exec_driver_sql("CREATE TABLE offices (id INTEGER)")
+    assert "Table: offices" in driver.refresh_schema()
+
+
+def test_explain_validation_doesnt_run_queries(schema_file):
+    driver = create_sql_driver(schema_file, "sqlite://", validation_mode="explain")
+
+    assert driver.validate_sql("INSERT INTO employees VALUES (1, 'Ann')") == []
+    assert driver.validate_sql("SELECT * FROM missing") != []
+    assert driver.validate_sql("SELEC * FROM employees") != []
+    rows = driver._conn.exec_driver_sql("SELECT * FROM employees").fetchall()
+    assert rows == []
+
+
+def test_unknown_validation_mode(schema_file):
+    with pytest.raises(ValueError):
+        create_sql_driver(schema_file, "sqlite://", validation_mode="guess")
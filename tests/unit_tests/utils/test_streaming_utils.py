@@ -0,0 +1,58 @@
+import pytest
+import tiktoken
+
+from guardrails.utils.openai_utils.streaming_utils import (
+    StreamingTokenCounter,
+    get_encoding_for_model,
+    num_tokens_from_messages,
+    num_tokens_from_string,
+)
+
+PAT_STR = (
+    r"""'s|'t|'re|'ve|'m|'ll|'d| ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+(?!\S)|\s+"""
+)
+MERGES = [b"he", b"ll", b"hell", b"hello", b" w", b" wo", b" wor", b" worl", b"  "]
+
+
+@pytest.fixture(autouse=True)
+def test_encoding(mocker):
+    # A small byte level BPE, since real encodings are downloaded
+    ranks = {bytes([i]): i for i in range(256)}
+    for merge in MERGES:
+        ranks[merge] = len(ranks)
+    encoding = tiktoken.Encoding(
+        "test", pat_str=PAT_STR, mergeable_ranks=ranks, special_tokens={}
+    )
+    get_encoding_for_model.cache_clear()
+    encoding_for_model = mocker.patch(
+        "tiktoken.encoding_for_model", return_value=encoding
+    )
+    yield encoding_for_model
+    get_encoding_for_model.cache_clear()
+
+
+def test_encodings_are_created_once(test_encoding):
+    assert num_tokens_from_string("hello", "gpt-4") == 1
+    assert num_tokens_from_string("hello world", "gpt-4") == 3
+    assert num_tokens_from_messages([{"role": "user", "content": "hello"}]) == 11
+
+    assert test_encoding.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        ["hello world"],
+        ["he", "llo", " wo", "rld"],
+        ["h", "e", "l", "l", "o", " ", " ", " ", "w", "o", "r", "l", "d", "!"],
+        ["hello  ", "  ", "world hello", "", " world's hello\n\n", "\nhello"],
+        ["hello\t wor", "ld \n hel", "lo!", " ", "wor", "ld.  \t", " héllo wörld"],
+        ["wörld" * 20, "hello" * 20, " " * 5, "\n", " w", "orld"],
+    ],
+)
+def test_streaming_token_counter(chunks):
+    counter = StreamingTokenCounter("gpt-4")
+    for chunk in chunks:
+        counter.add(chunk)
+
+    assert counter.count == num_tokens_from_string("".join(chunks), "gpt-4")
@@ -0,0 +1,78 @@
+from unittest.mock import Mock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+faiss = pytest.importorskip("faiss")
+
+from guardrails.vectordb import Faiss  # noqa: E402
+
+
+@pytest.fixture
+def vectors():
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((500, 16)).astype(np.float32)
+
+
+@pytest.mark.parametrize(
+    "create_store",
+    [
+        lambda: Faiss.new_ivf_flat_index(16, Mock(), nlist=4, nprobe=4),
+        lambda: Faiss.new_ivf_pq_index(16, Mock(), nlist=4, m=4, nbits=4, nprobe=4),
+        lambda: Faiss.new_hnsw_index(16, Mock(), ef_search=32),
+    ],
+)
+def test_ann_indexes(create_store, vectors, tmp_path):
+    store = create_store()
+    if not store.is_trained:
+        store.train(vectors)
+    store.add_vectors(vectors)
+
+    assert store.similarity_search_vector(vectors[7], 1) == [7]
+
+    path = str(tmp_path / "test.index")
+    store.save(path)
+    loaded_store = Faiss.load(path, Mock())
+    assert loaded_store.last_index() == len(vectors)
+    assert loaded_store.similarity_search_vector(vectors[7], 1) == [7]
+
+
+def test_search_params_are_saved(vectors, tmp_path):
+    store = Faiss.new_ivf_flat_index(16, Mock(), nlist=4, nprobe=1)
+    store.train(vectors)
+    store.set_search_params(nprobe=3)
+
+    path = str(tmp_path / "test.index")
+    store.save(path)
+    loaded_index = faiss.extract_index_ivf(Faiss.load(path, Mock())._index)
+    assert loaded_index.nprobe == 3
+
+
+def test_unknown_metric():
+    with pytest.raises(ValueError):
+        Faiss.new_hnsw_index(16, Mock(), metric="cosine")
+
+
+def test_similarity_search_batch(vectors):
+    embedder = Mock()
+    embedder.embed_queries.return_value = vectors[[3, 9]]
+    store = Faiss.new_flat_l2_index(16, embedder)
+    store.add_vectors(vectors)
+
+    results = store.similarity_search_batch(["foo", "bar"], 2)
+
+    embedder.embed_queries.assert_called_once_with(["foo", "bar"])
+    assert [indexes[0] for indexes in results] == [3, 9]
+    assert all(len(indexes) == 2 for indexes in results)
+    assert store.similarity_search_batch([], 2) == []
+
+
+def test_load_memory_mapped(vectors, tmp_path):
+    store = Faiss.new_flat_l2_index(16, Mock())
+    store.add_vectors(vectors)
+    path = str(tmp_path / "test.index")
+    store.save(path)
+
+    loaded_store = Faiss.load(path, Mock(), mmap=True)
+    assert loaded_store.last_index() == len(vectors)
+    assert loaded_store.similarity_search_vector(vectors[7], 1) == [7]
@@ -0,0 +1,89 @@
+import json
+import os
+from unittest.mock import Mock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from guardrails.vectordb import MemmapVectorDB  # noqa: E402
+from guardrails.vectordb.memmap import (  # noqa: E402
+    MANIFEST_FILE_NAME,
+    VECTORS_FILE_NAME,
+)
+
+
+@pytest.fixture
+def vectors():
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((300, 8)).astype(np.float32)
+
+
+def test_search_matches_exact_search(vectors, tmp_path, mocker):
+    mocker.patch("guardrails.vectordb.memmap.SEARCH_CHUNK_SIZE", 64)
+    store = MemmapVectorDB(Mock(), str(tmp_path), vector_dim=8)
+    store.add_vectors(vectors[:100])
+    store.add_vectors(vectors[100:])
+
+    queries = vectors[:5] + 0.01
+    distances = ((queries[:, None, :] - vectors[None, :, :]) ** 2).sum(axis=2)
+    expected = np.argsort(distances, axis=1)[:, :3].tolist()
+
+    assert store.last_index() == 300
+    assert store.similarity_search_vector_batch(queries, 3) == expected
+    assert store.similarity_search_vector(queries[0], 3) == expected[0]
+    assert store.similarity_search_vector_with_threshold(queries[0], 3, 0.01) == [0]
+
+
+def test_pads_results_with_fewer_vectors_than_k(vectors, tmp_path):
+    store = MemmapVectorDB(Mock(), str(tmp_path), vector_dim=8)
+    assert store.similarity_search_vector(vectors[0], 2) == [-1, -1]
+
+    store.add_vectors(vectors[:1])
+    assert store.similarity_search_vector(vectors[0], 2) == [0, -1]
+
+
+def test_readers_see_committed_appends(vectors, tmp_path):
+    writer = MemmapVectorDB(Mock(), str(tmp_path), vector_dim=8)
+    writer.add_vectors(vectors[:10])
+
+    reader = MemmapVectorDB.load(str(tmp_path), Mock(), read_only=True)
+    assert reader.last_index() == 10
+    with pytest.raises(ValueError):
+        reader.add_vectors(vectors[10:])
+
+    writer.add_vectors(vectors[10:20])
+    assert reader.last_index() == 20
+    assert reader.similarity_search_vector(vectors[15], 1) == [15]
+
+
+def test_discards_interrupted_appends(vectors, tmp_path):
+    store = MemmapVectorDB(Mock(), str(tmp_path), vector_dim=8)
+    store.add_vectors(vectors[:10])
+
+    # As if a writer crashed halfway through an append
+    with open(tmp_path / MANIFEST_FILE_NAME, "ab") as manifest_file:
+        manifest_file.write(
+            json.dumps({"op": "begin", "start": 10, "count": 5}).encode() + b"\n"
+        )
+    with open(tmp_path / VECTORS_FILE_NAME, "ab") as vectors_file:
+        vectors_file.write(vectors[10:12].tobytes())
+
+    reopened_store = MemmapVectorDB.load(str(tmp_path), Mock())
+    assert reopened_store.last_index() == 10
+
+    reopened_store.add_vectors(vectors[20:25])
+    assert reopened_store.last_index() == 15
+    assert os.path.getsize(tmp_path / VECTORS_FILE_NAME) == 15 * 8 * 4
+    assert reopened_store.similarity_search_vector(vectors[20], 1) == [10]
+
+
+def test_requires_matching_dimensions(tmp_path):
+    with pytest.raises(ValueError):
+        MemmapVectorDB(Mock(), str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        MemmapVectorDB.load(str(tmp_path), Mock(), read_only=True)
+
+    MemmapVectorDB(Mock(), str(tmp_path), vector_dim=8)
+    with pytest.raises(ValueError):
+        MemmapVectorDB(Mock(), str(tmp_path), vector_dim=4)